@@ -38,6 +38,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/fighter/refresh-data": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /** Refresh Scraped Data */
+        get: operations["refresh_scraped_data_api_fighter_refresh_data_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/fighter/generate-avatars": {
         parameters: {
             query?: never;
@@ -115,6 +132,31 @@ export interface components {
             redCorner: components["schemas"]["FighterRead"];
             blueCorner: components["schemas"]["FighterRead"];
         };
+        /**
+         * CombatSport
+         * @enum {string}
+         */
+        CombatSport: "boxing" | "mma";
+        /**
+         * DataRefreshResult
+         * @description One result field per scrape source (see sbtb.fighter.orchestrator); None if it was not run or failed.
+         */
+        DataRefreshResult: {
+            ranks?: components["schemas"]["RankSyncResult"] | null;
+            fightCards?: components["schemas"]["FightCardSyncResult"] | null;
+            /**
+             * Failedsources
+             * @default []
+             */
+            failedSources: string[];
+            /**
+             * Timingsms
+             * @default {}
+             */
+            timingsMs: {
+                [key: string]: number;
+            };
+        };
         /**
          * FeaturedCollection
          * @enum {string}
@@ -156,6 +198,41 @@ export interface components {
              */
             bouts: components["schemas"]["BoutRead"][];
         };
+        /** FightCardSyncResult */
+        FightCardSyncResult: {
+            /**
+             * Fightcards
+             * @default []
+             */
+            fightCards: components["schemas"]["FightCardRead"][];
+            /**
+             * Cardsscraped
+             * @default 0
+             */
+            cardsScraped: number;
+            /**
+             * Cardschanged
+             * @default 0
+             */
+            cardsChanged: number;
+            /**
+             * Cardsremoved
+             * @default 0
+             */
+            cardsRemoved: number;
+            /**
+             * Fullsync
+             * @default false
+             */
+            fullSync: boolean;
+            /**
+             * Timingsms
+             * @default {}
+             */
+            timingsMs: {
+                [key: string]: number;
+            };
+        };
         /** FighterRead */
         FighterRead: {
             /**
@@ -194,6 +271,34 @@ export interface components {
             /** Organizationname */
             organizationName: string;
         };
+        /** RankSyncResult */
+        RankSyncResult: {
+            /**
+             * Ranks
+             * @default []
+             */
+            ranks: components["schemas"]["RankRead"][];
+            /**
+             * Isnoop
+             * @default false
+             */
+            isNoop: boolean;
+            /**
+             * Ranksinserted
+             * @default 0
+             */
+            ranksInserted: number;
+            /**
+             * Ranksupdated
+             * @default 0
+             */
+            ranksUpdated: number;
+            /**
+             * Ranksdeleted
+             * @default 0
+             */
+            ranksDeleted: number;
+        };
         /**
          * RankType
          * @enum {string}
@@ -258,7 +363,7 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["RankRead"][];
+                    "application/json": components["schemas"]["RankSyncResult"];
                 };
             };
         };
@@ -278,7 +383,38 @@ export interface operations {
                     [name: string]: unknown;
                 };
                 content: {
-                    "application/json": components["schemas"]["FightCardRead"][];
+                    "application/json": components["schemas"]["FightCardSyncResult"];
+                };
+            };
+        };
+    };
+    refresh_scraped_data_api_fighter_refresh_data_get: {
+        parameters: {
+            query?: {
+                sport?: components["schemas"]["CombatSport"] | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Scrape every source concurrently and persist the results in dependency order */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["DataRefreshResult"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
                 };
             };
         };
@@ -363,5 +499,6 @@ type ReadonlyArray<T> = [
 ] extends [
     unknown[]
 ] ? Readonly<Exclude<T, undefined>> : Readonly<Exclude<T, undefined>[]>;
+export const combatSportValues: ReadonlyArray<FlattenedDeepRequired<components>["schemas"]["CombatSport"]> = ["boxing", "mma"];
 export const featuredCollectionValues: ReadonlyArray<FlattenedDeepRequired<components>["schemas"]["FeaturedCollection"]> = ["popular_fighters"];
 export const rankTypeValues: ReadonlyArray<FlattenedDeepRequired<components>["schemas"]["RankType"]> = ["champion", "interim_champion", "champion_in_recess", "contender"];
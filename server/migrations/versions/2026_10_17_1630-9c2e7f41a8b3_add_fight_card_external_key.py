@@ -0,0 +1,58 @@
+"""add fight card external key
+
+Revision ID: 9c2e7f41a8b3
+Revises: 4d3181c17856
+Create Date: 2026-10-17 16:30:12.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2e7f41a8b3'
+down_revision: Union[str, None] = '4d3181c17856'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('fight_cards', sa.Column('source', sa.String(), nullable=True))
+    op.add_column('fight_cards', sa.Column('external_id', sa.String(), nullable=True))
+    # Every existing card came from the boxing schedule scraper. Their upstream event ids were never
+    # stored, so they can't be backfilled and stay NULL. The scraper's sync state key was bumped in
+    # the same change (BoxingFightCardScraper.SYNC_STATE_KEY), so the first run after this migration
+    # is a full sync: it inserts every upcoming card with its external id and delete_unlisted drops the
+    # upcoming NULL-keyed duplicates. Past cards aren't listed upstream anymore and are kept as they are
+    op.execute("UPDATE fight_cards SET source = 'boxing_schedule'")
+    op.drop_constraint('uq_fight_card_event', 'fight_cards', type_='unique')
+    op.create_unique_constraint('uq_fight_card_source_external_id', 'fight_cards', ['source', 'external_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_fight_card_source_external_id', 'fight_cards', type_='unique')
+    # Cards are only unique per source and external id now, so the same event can be stored twice
+    # (e.g. a legacy row next to its keyed replacement, or an event listed under two ids).
+    # Keep one card per (event_name, event_date), preferring keyed and then newer rows
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE duplicate_fight_cards ON COMMIT DROP AS
+        SELECT id FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY event_name, event_date
+                ORDER BY external_id IS NULL, created_at DESC, id
+            ) AS position
+            FROM fight_cards
+        ) AS ranked
+        WHERE position > 1
+        """
+    )
+    op.execute("DELETE FROM bouts WHERE fight_card_id IN (SELECT id FROM duplicate_fight_cards)")
+    op.execute("DELETE FROM fight_cards WHERE id IN (SELECT id FROM duplicate_fight_cards)")
+    op.create_unique_constraint('uq_fight_card_event', 'fight_cards', ['event_name', 'event_date'])
+    op.drop_column('fight_cards', 'external_id')
+    op.drop_column('fight_cards', 'source')
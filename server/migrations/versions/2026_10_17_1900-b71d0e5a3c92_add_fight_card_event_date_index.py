@@ -0,0 +1,28 @@
+"""add fight card event date index
+
+Revision ID: b71d0e5a3c92
+Revises: 9c2e7f41a8b3
+Create Date: 2026-10-17 19:00:41.902655
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71d0e5a3c92'
+down_revision: Union[str, None] = '9c2e7f41a8b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_fight_cards_event_date_id', 'fight_cards', ['event_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_fight_cards_event_date_id', table_name='fight_cards')
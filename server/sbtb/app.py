@@ -15,6 +15,7 @@ from sbtb.core.config import settings
 from sbtb.core.exceptions import add_exception_handlers
 from sbtb.core.logging import configure_logging
 from sbtb.core.util import is_valid_uuid4
+from sbtb.fighter.scraper import parse_executor, scraper_http_client
 from sbtb.routes import api_router
 
 configure_logging()
@@ -36,7 +37,10 @@ if settings.SENTRY_DSN:
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("FastAPI sbtb app running...")
+    await scraper_http_client.open()
     yield
+    await scraper_http_client.close()
+    parse_executor.shutdown()
     logger.info("FastAPI sbtb app shutting down...")
 
 
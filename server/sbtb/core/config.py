@@ -2,9 +2,9 @@ import json
 import os
 from enum import StrEnum
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, Self
 
-from pydantic import field_validator
+from pydantic import field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _SERVER_DIR = Path(__file__).parent.parent.parent
@@ -35,6 +35,8 @@ class Settings(BaseSettings):
     ENV: Environment = Environment.local
 
     LOG_LEVEL: int = 20
+    # Fraction of per-item DEBUG events emitted from hot loops (sbtb.core.logging.StageProgress)
+    LOG_ITEM_SAMPLE_RATE: float = 0.0
 
     DEBUG: bool = True
     SQLALCHEMY_ECHO: bool = True
@@ -47,6 +49,17 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "sbtb"
     POOL_SIZE: int = 10
     MAX_OVERFLOW: int = 10
+    # Session-mode pool with statement caching for batch work (sbtb.core.database.session.batch_engine)
+    BATCH_POOL_SIZE: int = 2
+    BATCH_MAX_OVERFLOW: int = 2
+    # Read replicas behind ReadSession (sbtb.core.database.routing), as full asyncpg URLs.
+    # Reads fall back to the primary when none is set, reachable, or within the lag limit
+    POSTGRES_REPLICA_URLS: list[str] = []
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_SECONDS: float = 10.0
+
+    # How often cached reference data (orgs, weight classes) is revalidated against the DB
+    REFERENCE_DATA_RECHECK_SECONDS: int = 300
 
     SENTRY_DSN: str | None = None
 
@@ -68,6 +81,47 @@ class Settings(BaseSettings):
     BOXING_RANKINGS_URL: str | None = None
     BOXING_SCHEDULE_URL: str | None = None
     BOXING_HEADERS: dict | None = None
+    # HTML backend for the rankings page (sbtb.fighter.scraper.rank_parsers)
+    BOXING_RANK_PARSER: Literal["bs4", "lxml"] = "bs4"
+
+    # Shared scraper HTTP client (sbtb.fighter.scraper.http)
+    SCRAPER_HTTP_LIMIT_PER_HOST: int = 4
+    SCRAPER_HTTP_DNS_CACHE_TTL_SECONDS: int = 300
+    SCRAPER_HTTP_KEEPALIVE_SECONDS: float = 30.0
+    SCRAPER_HTTP_TIMEOUT_SECONDS: float = 15.0
+    SCRAPER_HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    # Per-host request policy (sbtb.fighter.scraper.policy). The rate halves on every 429,
+    # down to the minimum, and recovers on successes
+    SCRAPER_RATE_LIMIT_PER_SECOND: float = 2.0
+    SCRAPER_RATE_LIMIT_BURST: int = 4
+    SCRAPER_RATE_LIMIT_MIN_PER_SECOND: float = 0.2
+    SCRAPER_MAX_RETRIES: int = 3
+    SCRAPER_BACKOFF_BASE_SECONDS: float = 0.5
+    SCRAPER_BACKOFF_MAX_SECONDS: float = 30.0
+    SCRAPER_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    SCRAPER_CIRCUIT_RESET_SECONDS: float = 60.0
+    # Scrape sources fetched at once by a full data refresh (sbtb.fighter.orchestrator)
+    SCRAPE_MAX_CONCURRENCY: int = 4
+
+    # Worker pool that runs scraper parsing off the event loop (sbtb.fighter.scraper.executor).
+    # "process" needs picklable parse inputs/outputs; "thread" is enough for lxml, which releases the GIL
+    SCRAPER_PARSE_EXECUTOR: Literal["thread", "process"] = "thread"
+    SCRAPER_PARSE_WORKERS: int = 2
+
+    # Local state scrapers persist between runs (sbtb.fighter.scraper.state)
+    SCRAPER_STATE_DIR: str = str(_SERVER_DIR / ".scraper_state")
+    # Compressed archive of every raw scrape payload, replayable offline (sbtb.fighter.scraper.archive).
+    # Unset means on for local and development only; oldest runs are pruned past either limit
+    SCRAPE_ARCHIVE_ENABLED: bool | None = None
+    SCRAPE_ARCHIVE_DIR: str = str(_SERVER_DIR / ".scrape_archive")
+    SCRAPE_ARCHIVE_MAX_RUNS: int = 500
+    SCRAPE_ARCHIVE_MAX_MB: int = 1024
+    # The schedule Server Action ID only changes when upstream redeploys
+    BOXING_SCHEDULE_ACTION_ID_TTL_SECONDS: int = 7 * 24 * 60 * 60
+    # Incremental schedule sync: re-fetch this many weeks ahead plus anything past the
+    # high-water mark, with a full resync at least this often
+    BOXING_SCHEDULE_INCREMENTAL_WINDOW_WEEKS: int = 6
+    BOXING_SCHEDULE_FULL_RESYNC_SECONDS: int = 24 * 60 * 60
 
     model_config = SettingsConfigDict(
         env_file=_env_file,
@@ -90,6 +144,12 @@ class Settings(BaseSettings):
             return json.loads(v)
         return v
 
+    @model_validator(mode="after")
+    def default_scrape_archive(self) -> Self:
+        if self.SCRAPE_ARCHIVE_ENABLED is None:
+            self.SCRAPE_ARCHIVE_ENABLED = self.is_environment({Environment.local, Environment.development})
+        return self
+
     def is_environment(self, environments: set[Environment]) -> bool:
         return self.ENV in environments
 
@@ -0,0 +1,90 @@
+"""Picks the engine a read-only session runs on: a fresh enough replica, else the primary.
+
+Each replica's replication lag is probed at most every ``check_interval`` seconds and
+cached, so routing a request costs no extra round trip. A replica that lags more than
+``max_lag_seconds`` or fails its probe is skipped until its next probe. When no replica
+is usable, reads fall back to the primary.
+"""
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = structlog.get_logger(__name__)
+
+# Seconds since the last replayed transaction, or 0 when the replica has replayed
+# everything it received (an idle primary writes nothing, so a replay timestamp alone
+# would read as ever-growing lag). On a server that isn't in recovery it's always 0.
+_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+@dataclass(slots=True)
+class ReplicaState:
+    engine: AsyncEngine
+    lag_seconds: float | None = None
+    checked_at: float = float("-inf")
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: list[AsyncEngine],
+        *,
+        max_lag_seconds: float,
+        check_interval: float,
+        probe_timeout: float = 1.0,
+    ) -> None:
+        self.primary = primary
+        self.replicas = [ReplicaState(engine=replica) for replica in replicas]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self.probe_timeout = probe_timeout
+        self._next = itertools.cycle(range(len(self.replicas)))
+
+    async def read_engine(self) -> AsyncEngine:
+        """The next usable replica in round-robin order, or the primary if none is."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._next)]
+            if await self._is_usable(replica):
+                return replica.engine
+        if self.replicas:
+            logger.warning("No usable read replica, reading from the primary")
+        return self.primary
+
+    async def _is_usable(self, replica: ReplicaState) -> bool:
+        if time.monotonic() - replica.checked_at >= self.check_interval:
+            async with replica.lock:
+                # Another request may have probed while this one waited for the lock
+                if time.monotonic() - replica.checked_at >= self.check_interval:
+                    replica.lag_seconds = await self._probe(replica.engine)
+                    replica.checked_at = time.monotonic()
+        return replica.lag_seconds is not None and replica.lag_seconds <= self.max_lag_seconds
+
+    async def _probe(self, engine: AsyncEngine) -> float | None:
+        try:
+            lag = await asyncio.wait_for(self._measure_lag(engine), timeout=self.probe_timeout)
+        except Exception as e:
+            logger.warning("Read replica probe failed", replica=engine.url.render_as_string(), error=str(e))
+            return None
+        if lag > self.max_lag_seconds:
+            logger.warning("Read replica is lagging", replica=engine.url.render_as_string(), lag_seconds=lag)
+        return lag
+
+    async def _measure_lag(self, engine: AsyncEngine) -> float:
+        async with engine.connect() as connection:
+            return float((await connection.execute(_LAG_QUERY)).scalar_one())
@@ -1,31 +1,62 @@
+from contextlib import asynccontextmanager
 from typing import Annotated, AsyncGenerator
 from uuid import uuid4
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from sbtb.core.config import settings
+from sbtb.core.database.routing import ReplicaRouter
 
-engine = create_async_engine(
-    settings.POSTGRES_DATABASE_URL,
+
+def _create_pooled_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.SQLALCHEMY_ECHO,
+        future=True,
+        pool_size=settings.POOL_SIZE,
+        pool_pre_ping=True,
+        max_overflow=settings.MAX_OVERFLOW,
+        connect_args={
+            "statement_cache_size": 0,  # Disable statement cache for asyncpg (use transaction connection pooler)
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            "prepared_statement_cache_size": 0,
+        },
+    )
+
+
+engine = _create_pooled_engine(settings.POSTGRES_DATABASE_URL)
+
+# Session-mode pooler: every client connection keeps its own server connection, so
+# prepared statements survive between transactions and asyncpg's statement cache is safe
+# to use. Repeated queries skip the server-side parse and plan. Each pooled connection
+# holds a server slot, so this pool is kept small and reserved for long-lived workers
+# and batch jobs (scrapes, avatar runs, replays, benchmarks).
+batch_engine = create_async_engine(
+    settings.POSTGRES_DATABASE_SESSION_URL,
     echo=settings.SQLALCHEMY_ECHO,
     future=True,
-    pool_size=settings.POOL_SIZE,
+    pool_size=settings.BATCH_POOL_SIZE,
     pool_pre_ping=True,
-    max_overflow=settings.MAX_OVERFLOW,
-    connect_args={
-        "statement_cache_size": 0,  # Disable statement cache for asyncpg (use transaction connection pooler)
-        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
-        "prepared_statement_cache_size": 0,
-    },
+    max_overflow=settings.BATCH_MAX_OVERFLOW,
+)
+
+# Replicas sit behind the same kind of pooler as the primary and get the same pool settings
+replica_router = ReplicaRouter(
+    primary=engine,
+    replicas=[_create_pooled_engine(url) for url in settings.POSTGRES_REPLICA_URLS],
+    max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.REPLICA_LAG_CHECK_SECONDS,
 )
 
 SessionLocal = sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+BatchSessionLocal = sessionmaker(batch_engine, expire_on_commit=False, class_=AsyncSession)
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with SessionLocal() as session:
+@asynccontextmanager
+async def _session_scope(session_maker: sessionmaker) -> AsyncGenerator[AsyncSession, None]:
+    async with session_maker() as session:
         try:
             yield session
         except Exception:
@@ -35,4 +66,24 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.commit()
 
 
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    async with _session_scope(SessionLocal) as session:
+        yield session
+
+
+async def get_batch_session() -> AsyncGenerator[AsyncSession, None]:
+    async with _session_scope(BatchSessionLocal) as session:
+        yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """A session on a read replica (or the primary, see replica_router) that never commits."""
+    async with AsyncSession(await replica_router.read_engine(), expire_on_commit=False) as session:
+        yield session
+
+
 DbSession = Annotated[AsyncSession, Depends(get_session)]
+# For routes that run scrapes or other batch work; see batch_engine
+BatchDbSession = Annotated[AsyncSession, Depends(get_batch_session)]
+# For read-only routes; may serve slightly stale data, within REPLICA_MAX_LAG_SECONDS
+ReadSession = Annotated[AsyncSession, Depends(get_read_session)]
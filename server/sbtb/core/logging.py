@@ -1,5 +1,8 @@
 import logging
 import logging.config
+import random
+import time
+from collections import Counter
 from typing import Any, Generic, TypeVar
 
 import structlog
@@ -161,6 +164,40 @@ class Production(CustomLogging[structlog.processors.JSONRenderer]):
         return structlog.processors.JSONRenderer(ensure_ascii=False)
 
 
+class StageProgress:
+    """Progress reporting for a hot loop: one summary event per stage instead of one per item.
+
+    ``count`` aggregates items per group (division, page, ...) for the summary that
+    ``finish`` emits at INFO. ``item`` emits a per-item DEBUG event only for a
+    ``LOG_ITEM_SAMPLE_RATE`` fraction of calls. The sampling check runs before the
+    logger is touched, so the unsampled calls never reach the processor chain
+    (whose CallsiteParameterAdder inspects the stack on every event).
+    """
+
+    def __init__(self, logger: Any, event: str, sample_rate: float | None = None) -> None:
+        self.logger = logger
+        self.event = event
+        self.sample_rate = settings.LOG_ITEM_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.counts: Counter[str] = Counter()
+        self._start = time.perf_counter()
+
+    def count(self, group: str, n: int = 1) -> None:
+        self.counts[group] += n
+
+    def item(self, event: str, **fields: Any) -> None:
+        if self.sample_rate and random.random() < self.sample_rate:
+            self.logger.debug(event, sampled=True, **fields)
+
+    def finish(self, **fields: Any) -> None:
+        self.logger.info(
+            self.event,
+            total=self.counts.total(),
+            counts=dict(self.counts),
+            elapsed_ms=round((time.perf_counter() - self._start) * 1000, 2),
+            **fields,
+        )
+
+
 def configure_logging() -> None:
     """Configure logging based on ENV environment variable."""
     if "local" in settings.ENV.lower():
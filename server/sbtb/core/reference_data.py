@@ -0,0 +1,144 @@
+"""Process-wide cache of seeded reference data (fight organizations and weight classes).
+
+These tables are only ever written by seed migrations, so every worker loads them
+once and serves lookups from memory. The cache is revalidated at most every
+``REFERENCE_DATA_RECHECK_SECONDS`` with a single aggregate query over both tables
+(row counts plus newest created/modified timestamp) and the applied alembic revision.
+When a new seed migration changes the data, that fingerprint moves and the snapshot
+is reloaded. The revision covers raw-SQL migrations that update rows without
+touching ``modified_at``.
+"""
+
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+import structlog
+from sqlalchemy import column, func, select, table
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sbtb.core.config import settings
+from sbtb.models import FightOrganization, WeightClass
+from sbtb.models.fight_organization import CombatSport
+
+logger = structlog.get_logger(__name__)
+
+# Maintained by alembic rather than the models, so it's only described here for the fingerprint query
+alembic_version = table("alembic_version", column("version_num"))
+
+
+@dataclass(frozen=True, slots=True)
+class OrganizationRef:
+    id: UUID
+    name: str
+    sport: CombatSport | None
+
+
+@dataclass(frozen=True, slots=True)
+class WeightClassRef:
+    id: UUID
+    name: str
+    pounds: int | None
+    sport: CombatSport
+
+
+class ReferenceData:
+    """Immutable snapshot of the reference tables with O(1) lookups by name and id."""
+
+    def __init__(
+        self,
+        organizations: list[OrganizationRef],
+        weight_classes: list[WeightClassRef],
+        fingerprint: tuple,
+    ) -> None:
+        self.fingerprint = fingerprint
+        self._organizations_by_name = {org.name: org for org in organizations}
+        self._organizations_by_id = {org.id: org for org in organizations}
+        self._weight_classes_by_name = {(wc.sport, wc.name): wc for wc in weight_classes}
+        self._weight_classes_by_id = {wc.id: wc for wc in weight_classes}
+
+    @property
+    def organizations(self) -> list[OrganizationRef]:
+        return list(self._organizations_by_id.values())
+
+    @property
+    def weight_classes(self) -> list[WeightClassRef]:
+        return list(self._weight_classes_by_id.values())
+
+    def organization_by_name(self, name: str) -> OrganizationRef | None:
+        return self._organizations_by_name.get(name)
+
+    def organization_by_id(self, id: UUID) -> OrganizationRef | None:
+        return self._organizations_by_id.get(id)
+
+    def weight_class_by_name(self, name: str, sport: CombatSport = CombatSport.boxing) -> WeightClassRef | None:
+        return self._weight_classes_by_name.get((sport, name))
+
+    def weight_class_by_id(self, id: UUID) -> WeightClassRef | None:
+        return self._weight_classes_by_id.get(id)
+
+
+class ReferenceDataRegistry:
+    def __init__(self, recheck_seconds: float) -> None:
+        self.recheck_seconds = recheck_seconds
+        self._snapshot: ReferenceData | None = None
+        self._checked_at = 0.0
+
+    async def get(self, session: AsyncSession) -> ReferenceData:
+        """Return the cached snapshot, revalidating against the DB once the recheck window lapses."""
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._checked_at < self.recheck_seconds:
+            return self._snapshot
+
+        fingerprint = await self._fetch_fingerprint(session)
+        if self._snapshot is None or self._snapshot.fingerprint != fingerprint:
+            self._snapshot = await self._load(session, fingerprint=fingerprint)
+            logger.info(
+                "Loaded reference data",
+                organizations=len(self._snapshot.organizations),
+                weight_classes=len(self._snapshot.weight_classes),
+            )
+        self._checked_at = now
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+        self._checked_at = 0.0
+
+    @staticmethod
+    async def _fetch_fingerprint(session: AsyncSession) -> tuple:
+        statement = select(
+            select(func.count()).select_from(FightOrganization).scalar_subquery(),
+            select(func.max(func.coalesce(FightOrganization.modified_at, FightOrganization.created_at)))
+            .select_from(FightOrganization)
+            .scalar_subquery(),
+            select(func.count()).select_from(WeightClass).scalar_subquery(),
+            select(func.max(func.coalesce(WeightClass.modified_at, WeightClass.created_at)))
+            .select_from(WeightClass)
+            .scalar_subquery(),
+            # One row per applied head
+            select(
+                func.array_agg(aggregate_order_by(alembic_version.c.version_num, alembic_version.c.version_num))
+            ).scalar_subquery(),
+        )
+        return tuple((await session.execute(statement)).one())
+
+    @staticmethod
+    async def _load(session: AsyncSession, *, fingerprint: tuple) -> ReferenceData:
+        organizations = await session.execute(
+            select(FightOrganization.id, FightOrganization.name, FightOrganization.sport)
+        )
+        weight_classes = await session.execute(
+            select(WeightClass.id, WeightClass.name, WeightClass.pounds, WeightClass.sport)
+        )
+        return ReferenceData(
+            organizations=[OrganizationRef(id=row.id, name=row.name, sport=row.sport) for row in organizations],
+            weight_classes=[
+                WeightClassRef(id=row.id, name=row.name, pounds=row.pounds, sport=row.sport) for row in weight_classes
+            ],
+            fingerprint=fingerprint,
+        )
+
+
+reference_data = ReferenceDataRegistry(recheck_seconds=settings.REFERENCE_DATA_RECHECK_SECONDS)
@@ -1,31 +1,216 @@
-from collections.abc import AsyncGenerator
-from typing import Any, Generic, Self, Sequence, TypeVar
+import base64
+import binascii
+import datetime
+import enum
+import json
+import uuid
+from collections.abc import AsyncGenerator, Callable, Collection, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, ClassVar, Generic, Literal, Self, Sequence, TypeVar
 
 from sqlalchemy import (
+    ARRAY,
+    BindParameter,
+    ColumnElement,
+    Result,
+    Row,
     Select,
+    UnaryExpression,
+    and_,
+    any_,
+    bindparam,
     func,
+    literal,
+    or_,
     over,
     select,
+    tuple_,
 )
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.base import Executable, ExecutableOption
+from sqlalchemy.sql.elements import ClauseElement
 
 from sbtb.core.database.session import DbSession
+from sbtb.core.exceptions import BadRequest
+from sbtb.core.util import utc_now
 
 M = TypeVar("M")
+R = TypeVar("R")
+
+CountMode = Literal["exact", "estimate"]
+
+
+@dataclass(slots=True)
+class KeysetPage(Generic[M]):
+    items: list[M]
+    # Opaque token for the page after this one, None on the last page
+    next_cursor: str | None
+    # Only set when a count was requested; an estimate comes from the planner's row estimate
+    total: int | None = None
+
+
+def array_param(column: Any, values: Iterable[Any]) -> BindParameter[list[Any]]:
+    """Bind ``values`` as a single typed array, for ``column == any_(...)`` / ``column != all_(...)``.
+
+    Unlike ``in_``, which renders one placeholder per value, the statement text is the
+    same for any number of values, so PostgreSQL can reuse its plan.
+    """
+    return bindparam(None, list(values), type_=ARRAY(column.type))
+
+
+def _as_python_type(column: Any, value: Any) -> Any:
+    """``value`` as ``column``'s Python type (e.g. a UUID string as a ``UUID``), or unchanged if it can't be."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if value is None or isinstance(value, python_type):
+        return value
+    try:
+        return python_type(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class _ExplainJson(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` around a statement, compiled and bound like the statement itself.
+
+    Rendering the statement with literal binds instead fails for types without a literal
+    form, such as UUIDs and arrays.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJson)
+def _compile_explain_json(element: _ExplainJson, compiler: Any, **kw: Any) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+class InvalidCursor(BadRequest):
+    def __init__(self) -> None:
+        super().__init__("Invalid pagination cursor", code="invalid_cursor")
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _decode_cursor_value(column: ColumnElement[Any], value: Any) -> Any:
+    python_type = column.type.python_type
+    if issubclass(python_type, datetime.date):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_encode_cursor_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[ColumnElement[Any]]) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise InvalidCursor()
+        return [_decode_cursor_value(column, value) for column, value in zip(columns, values)]
+    except (AttributeError, binascii.Error, TypeError, ValueError) as e:
+        raise InvalidCursor() from e
 
 
 class BaseRepository(Generic[M]):
     model: type[M]
 
+    # Bind parameters per bulk_upsert statement; PostgreSQL's protocol caps a statement at 32767
+    bulk_max_params: ClassVar[int] = 30_000
+
+    # Statements built once per repository class, see prepared()
+    _prepared: ClassVar[dict[tuple[type, str], Select[Any]]] = {}
+
     def __init__(self, session: DbSession) -> None:
         self.session = session
 
-    async def get_one_or_none(self, statement: Select[tuple[M]]) -> M | None:
-        result = await self.session.execute(statement)
+    def prepared(self, name: str, build: Callable[[], Select[tuple[M]]]) -> Select[tuple[M]]:
+        """Build a hot statement on first use and reuse it for every later call.
+
+        ``build`` must take its arguments as named ``bindparam``s and get them from the
+        execute params. A reused statement skips SQLAlchemy's construction and cache key
+        generation (its key is memoized), which otherwise cost more than the lookup's
+        compiled-cache hit.
+        """
+        key = (type(self), name)
+        statement = self._prepared.get(key)
+        if statement is None:
+            statement = self._prepared[key] = build()
+        return statement
+
+    async def get_one_or_none(self, statement: Select[tuple[M]], params: Mapping[str, Any] | None = None) -> M | None:
+        result = await self.session.execute(statement, params)
         return result.scalar_one_or_none()
 
-    async def get_by_id(self, id: str | int) -> M | None:
-        statement = self.get_base_statement().where(self.model.id == id)  # type: ignore
-        return await self.get_one_or_none(statement)
+    def get_by_id_statement(self) -> Select[tuple[M]]:
+        """The ``get_by_id`` SELECT; execute it with ``{"id": ...}``."""
+        return self.prepared(
+            "get_by_id",
+            lambda: self.get_base_statement().where(self.model.id == bindparam("id")),  # type: ignore
+        )
+
+    async def get_by_id(self, id: Any) -> M | None:
+        return await self.get_one_or_none(self.get_by_id_statement(), {"id": id})
+
+    async def get_many_by_ids(self, ids: Iterable[Any], *, as_rows: bool = False) -> Sequence[M] | Sequence[Row[Any]]:
+        """Fetch every object whose id is in ``ids`` in one query, in no particular order.
+
+        Pass ``as_rows=True`` to get plain column rows instead of ORM objects, skipping
+        the identity map for read-only bulk work.
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        id_column = self.model.id  # type: ignore
+        if as_rows:
+            result = await self.session.execute(
+                select(*self.model.__table__.columns).where(id_column == any_(array_param(id_column, ids)))  # type: ignore
+            )
+            return result.all()
+        return await self.get_all(self.get_base_statement().where(id_column == any_(array_param(id_column, ids))))
+
+    async def get_rows(self, statement: Select[Any], params: Mapping[str, Any] | None = None) -> Sequence[Row[Any]]:
+        """Run a column SELECT on the session's connection, bypassing the ORM.
+
+        For large read-only results that go straight to a response. There's no identity
+        map, instance state or relationship loading, just tuples with attribute access
+        named after the column labels. Select only the columns the reader needs. Pending
+        changes are flushed first, as ``session.execute`` would.
+        """
+        return (await self._execute_core(statement, params)).all()
+
+    async def get_records(
+        self, statement: Select[Any], record: Callable[..., R], params: Mapping[str, Any] | None = None
+    ) -> list[R]:
+        """``get_rows``, with each row passed to ``record`` as keyword arguments named after its labels.
+
+        ``record`` is typically a slotted dataclass or a response schema's ``model_construct``.
+        """
+        result = await self._execute_core(statement, params)
+        keys = list(result.keys())
+        return [record(**dict(zip(keys, row))) for row in result]
+
+    async def _execute_core(self, statement: Select[Any], params: Mapping[str, Any] | None) -> Result[Any]:
+        await self.session.flush()
+        connection = await self.session.connection()
+        return await connection.execute(statement, params)
 
     async def get_all(self, statement: Select[tuple[M]]) -> Sequence[M]:
         result = await self.session.execute(statement)
@@ -51,6 +236,131 @@ class BaseRepository(Generic[M]):
 
         return items, count
 
+    async def paginate_keyset(
+        self,
+        statement: Select[tuple[M]],
+        *,
+        order_by: Sequence[ColumnElement[Any]],
+        limit: int,
+        cursor: str | None = None,
+        count: CountMode | None = None,
+    ) -> KeysetPage[M]:
+        """Page through ``statement`` by seeking past the last row of the previous page.
+
+        Unlike ``paginate``, the cost of a page doesn't grow with its depth as long as
+        an index covers ``order_by``. The ordering columns must be non-nullable columns
+        of the model, ascending or ``.desc()``; ``id`` is appended as a tiebreaker when
+        missing, so the order is total. ``cursor`` is the ``next_cursor`` of the previous
+        page and must be used with the same statement and ordering.
+
+        ``count`` is off by default since it scans the whole result set: ``"exact"`` runs
+        a ``count(*)``, ``"estimate"`` reads the planner's row estimate for ``statement``.
+        """
+        keys = [_order_key(column) for column in order_by]
+        if not any(column.key == "id" for column, _ in keys):
+            keys.append((self.model.id, keys[-1][1] if keys else False))  # type: ignore
+        columns = [column for column, _ in keys]
+
+        page_statement = statement.order_by(None).order_by(
+            *(column.desc() if descending else column.asc() for column, descending in keys)
+        )
+        if cursor is not None:
+            page_statement = page_statement.where(_seek_predicate(keys, decode_cursor(cursor, columns)))
+
+        result = await self.session.execute(page_statement.limit(limit + 1))
+        items = list(result.scalars().unique().all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor([getattr(items[-1], column.key) for column in columns])
+
+        total = None
+        if count == "exact":
+            total = await self.count(statement)
+        elif count == "estimate":
+            total = await self.estimate_count(statement)
+
+        return KeysetPage(items=items, next_cursor=next_cursor, total=total)
+
+    async def count(self, statement: Select[tuple[M]]) -> int:
+        count_statement = select(func.count()).select_from(statement.order_by(None).subquery())
+        result = await self.session.execute(count_statement)
+        return result.scalar_one()
+
+    async def estimate_count(self, statement: Select[tuple[M]]) -> int:
+        """The planner's estimate of the rows ``statement`` returns, without running it.
+
+        Only as accurate as the table statistics, but costs the same on any table size.
+        """
+        result = await self.session.execute(_ExplainJson(statement.order_by(None)))
+        return int(result.scalar_one()[0]["Plan"]["Plan Rows"])
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        *,
+        conflict_cols: Collection[str],
+        update_cols: Collection[str] | None = None,
+        as_rows: bool = False,
+        options: Sequence[ExecutableOption] = (),
+    ) -> Sequence[M] | Sequence[Row[Any]]:
+        """Insert ``rows``, updating the ones that clash on ``conflict_cols``, and return them all.
+
+        Rows go out as multi-row INSERT ... VALUES (...), (...) ON CONFLICT DO UPDATE
+        ... RETURNING statements, each holding as many rows as fit in ``bulk_max_params``
+        bind parameters, so a batch costs one round trip per chunk rather than per row.
+        Every row must have the same keys. ``conflict_cols`` must match a unique
+        constraint or index. ``update_cols`` defaults to every other column present in
+        the rows; ``modified_at`` is bumped when the model has one. Rows sharing a
+        conflict key are collapsed to the last one, since PostgreSQL can't update the
+        same row twice in one statement. Conflict keys are compared as their column's
+        Python type, so e.g. a ``str`` id matches the ``UUID`` the database returns.
+
+        Returns ORM objects refreshed from the database (``options`` are loader options
+        for them, e.g. to skip an eager relationship), or plain column rows with
+        ``as_rows=True``. Either way the order matches the (deduplicated) input.
+        """
+        conflict_cols = list(conflict_cols)
+        table = self.model.__table__  # type: ignore
+        key_columns = [table.columns[col] for col in conflict_cols]
+
+        def conflict_key(values: Iterable[Any]) -> tuple[Any, ...]:
+            return tuple(_as_python_type(column, value) for column, value in zip(key_columns, values))
+
+        unique_rows = list({conflict_key(row[col] for col in conflict_cols): row for row in rows}.values())
+        if not unique_rows:
+            return []
+
+        if update_cols is None:
+            update_cols = [col for col in unique_rows[0] if col not in conflict_cols]
+        # Column defaults are bound per row too, so budget for every column of the table
+        chunk_size = max(1, self.bulk_max_params // len(table.columns))
+
+        returned: list[Any] = []
+        for start in range(0, len(unique_rows), chunk_size):
+            statement = pg_insert(self.model).values(unique_rows[start : start + chunk_size])
+            set_ = {col: statement.excluded[col] for col in update_cols}
+            if set_ and "modified_at" in table.columns:
+                set_["modified_at"] = utc_now()
+            if not set_:
+                # Still touch the row, so RETURNING includes the ones that already existed
+                set_ = {conflict_cols[0]: statement.excluded[conflict_cols[0]]}
+            statement = statement.on_conflict_do_update(index_elements=conflict_cols, set_=set_)
+
+            if as_rows:
+                returned.extend(await self.session.execute(statement.returning(*table.columns)))
+            else:
+                result = await self.session.execute(
+                    statement.returning(self.model).options(*options), execution_options={"populate_existing": True}
+                )
+                returned.extend(result.scalars())
+
+        # RETURNING order isn't guaranteed for a multi-row VALUES; restore the input order
+        position = {conflict_key(row[col] for col in conflict_cols): i for i, row in enumerate(unique_rows)}
+        returned.sort(key=lambda item: position[conflict_key(getattr(item, col) for col in conflict_cols)])
+        return returned
+
     def get_base_statement(self) -> Select[tuple[M]]:
         return select(self.model)
 
@@ -96,3 +406,25 @@ class BaseRepository(Generic[M]):
     @classmethod
     def from_session(cls, session: DbSession) -> Self:
         return cls(session)
+
+
+def _order_key(column: ColumnElement[Any]) -> tuple[ColumnElement[Any], bool]:
+    if isinstance(column, UnaryExpression) and column.modifier in (operators.desc_op, operators.asc_op):
+        return column.element, column.modifier is operators.desc_op
+    return column, False
+
+
+def _seek_predicate(keys: list[tuple[ColumnElement[Any], bool]], values: list[Any]) -> ColumnElement[bool]:
+    """Rows strictly after ``values`` in the ``keys`` ordering."""
+    if len({descending for _, descending in keys}) == 1:
+        # A row comparison matches a composite index directly
+        row = tuple_(*(column for column, _ in keys))
+        after = tuple_(*(literal(value, column.type) for (column, _), value in zip(keys, values)))
+        return row < after if keys[0][1] else row > after
+
+    # Mixed directions: (a > x) OR (a = x AND b < y) OR ...
+    clauses = []
+    for i, (column, descending) in enumerate(keys):
+        ties = [keys[j][0] == values[j] for j in range(i)]
+        clauses.append(and_(*ties, column < values[i] if descending else column > values[i]))
+    return or_(*clauses)
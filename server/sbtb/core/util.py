@@ -1,3 +1,6 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from uuid import UUID
 
@@ -11,3 +14,13 @@ def is_valid_uuid4(uuid_: str) -> bool:
         return UUID(uuid_).version == 4
     except ValueError:
         return False
+
+
+@contextmanager
+def timed(timings: dict[str, float], stage: str) -> Iterator[None]:
+    """Record the wall time of the wrapped block in ``timings[stage]``, in milliseconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = round((time.perf_counter() - start) * 1000, 2)
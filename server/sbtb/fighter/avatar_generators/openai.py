@@ -93,7 +93,8 @@ class GptFighterImageGenerator:
                     supabase_handler=supabase_handler,
                 )
                 if avatar_url:
-                    await fighter_repo.update(fighter, update_dict={"avatar_url": avatar_url}, flush=True)
+                    # No flush: the updates go out as one batched UPDATE when the session commits
+                    await fighter_repo.update(fighter, update_dict={"avatar_url": avatar_url})
                     updated.append(fighter.name)
                     logger.info(f"Generated avatar for {fighter.name}")
                 else:
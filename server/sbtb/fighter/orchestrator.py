@@ -0,0 +1,123 @@
+"""Runs every registered scrape source as one data refresh.
+
+Fetches are network-bound and independent, so they all run concurrently (capped by
+``SCRAPE_MAX_CONCURRENCY``) and a refresh takes about as long as the slowest source.
+Persistence shares one DB session, so it runs one source at a time, in dependency
+order: a source's ``depends_on`` sources are written first, e.g. ranked fighters
+before the bouts that reference them.
+"""
+
+import asyncio
+import time
+from collections.abc import Collection
+from dataclasses import dataclass
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Protocol
+
+import structlog
+
+from sbtb.core.config import settings
+from sbtb.core.database.session import DbSession
+from sbtb.core.schemas import BaseSchema
+from sbtb.core.util import timed
+from sbtb.fighter.schemas import DataRefreshResult
+from sbtb.fighter.service import boxer_scraper_service, boxing_fight_card_service
+from sbtb.models.fight_organization import CombatSport
+
+logger = structlog.get_logger(__name__)
+
+
+class ScrapeSourceService(Protocol):
+    async def fetch(self) -> Any: ...
+
+    async def persist(self, session: DbSession, raw: Any, /) -> BaseSchema: ...
+
+
+@dataclass(frozen=True, slots=True)
+class ScrapeSource:
+    # Also the DataRefreshResult field the source's result is reported under
+    name: str
+    service: ScrapeSourceService
+    sport: CombatSport
+    depends_on: tuple[str, ...] = ()
+
+
+class ScrapeOrchestrator:
+    def __init__(self, sources: list[ScrapeSource], max_concurrency: int) -> None:
+        self.sources = {source.name: source for source in sources}
+        self.max_concurrency = max_concurrency
+
+        graph = TopologicalSorter({source.name: source.depends_on for source in sources})
+        for source in sources:
+            unknown = set(source.depends_on) - self.sources.keys()
+            if unknown:
+                raise ValueError(f"Scrape source {source.name!r} depends on unknown sources {sorted(unknown)}")
+        try:
+            self.persist_order = list(graph.static_order())
+        except CycleError as e:
+            raise ValueError(f"Scrape sources have a dependency cycle: {e.args[1]}") from None
+
+    async def refresh(
+        self,
+        session: DbSession,
+        names: Collection[str] | None = None,
+        sport: CombatSport | None = None,
+    ) -> DataRefreshResult:
+        """Fetch the selected sources concurrently, then persist them in dependency order.
+
+        Each persist runs in its own savepoint. A source whose fetch or persist raises
+        is reported in ``failed_sources``, and whatever it wrote is rolled back; the
+        other sources are still persisted and committed with the session. That includes
+        sources depending on a failed one: ``depends_on`` only orders the writes, and
+        every service creates any fighters it references (FighterRepo.get_or_create_many),
+        so a dependent never needs rows that only its dependency would have written.
+        """
+        selected = [
+            self.sources[name]
+            for name in self.persist_order
+            if (names is None or name in names) and (sport is None or self.sources[name].sport == sport)
+        ]
+        timings: dict[str, float] = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        start = time.perf_counter()
+
+        async def fetch(source: ScrapeSource) -> Any:
+            async with semaphore:
+                with timed(timings, f"fetch.{source.name}"):
+                    return await source.service.fetch()
+
+        fetched = await asyncio.gather(*(fetch(source) for source in selected), return_exceptions=True)
+
+        results: dict[str, BaseSchema] = {}
+        failed = []
+        for source, raw in zip(selected, fetched):
+            if isinstance(raw, BaseException):
+                logger.error("Scrape source fetch failed", source=source.name, exc_info=raw)
+                failed.append(source.name)
+                continue
+            try:
+                with timed(timings, f"persist.{source.name}"):
+                    async with session.begin_nested():
+                        results[source.name] = await source.service.persist(session, raw)
+            except Exception:
+                logger.exception("Scrape source persist failed", source=source.name)
+                failed.append(source.name)
+
+        timings["total"] = round((time.perf_counter() - start) * 1000, 2)
+        logger.info("Data refresh finished", sources=[s.name for s in selected], failed=failed, timings_ms=timings)
+        return DataRefreshResult(**results, failed_sources=failed, timings_ms=timings)
+
+
+scrape_orchestrator = ScrapeOrchestrator(
+    sources=[
+        ScrapeSource(name="ranks", service=boxer_scraper_service, sport=CombatSport.boxing),
+        # Ranked fighters are created by the rankings, so write them before bouts reference them
+        ScrapeSource(
+            name="fight_cards",
+            service=boxing_fight_card_service,
+            sport=CombatSport.boxing,
+            depends_on=("ranks",),
+        ),
+    ],
+    max_concurrency=settings.SCRAPE_MAX_CONCURRENCY,
+)
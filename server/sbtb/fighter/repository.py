@@ -1,21 +1,32 @@
-from datetime import datetime
-from typing import Sequence
+import dataclasses
+import hashlib
+import json
+from collections.abc import Callable
+from typing import Any, Iterable, Sequence, TypeVar
+from uuid import UUID
 
-from sqlalchemy import delete
+from sqlalchemy import Row, all_, any_, bindparam, delete, insert, or_, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, raiseload
 
-from sbtb.core.repository.base import BaseRepository
-from sbtb.fighter.schemas import BoutInput, RankInput
+from sbtb.core.repository.base import BaseRepository, array_param
+from sbtb.core.util import utc_now
+from sbtb.fighter.schemas import BoutInput, FightCardInput, FighterRead, RankDelta, RankInput
 from sbtb.models import Bout, FeaturedFighter, FightCard, Fighter, FightOrganization, Rank, WeightClass
 from sbtb.models.featured_fighter import FeaturedCollection
+from sbtb.models.fight_organization import CombatSport
+
+R = TypeVar("R")
 
 
 class FighterRepo(BaseRepository[Fighter]):
     model = Fighter
 
     async def get_by_name(self, name: str) -> Fighter | None:
-        return await self.get_one_or_none(self.get_base_statement().where(Fighter.name == name))
+        statement = self.prepared(
+            "get_by_name", lambda: self.get_base_statement().where(Fighter.name == bindparam("name"))
+        )
+        return await self.get_one_or_none(statement, {"name": name})
 
     async def get_or_create(self, name: str) -> Fighter:
         fighter = await self.get_by_name(name)
@@ -24,46 +35,149 @@ class FighterRepo(BaseRepository[Fighter]):
             await self.create(fighter, flush=True)
         return fighter
 
+    async def get_or_create_many(self, names: Iterable[str]) -> dict[str, Fighter]:
+        """Resolve a batch of fighter names in two round trips, keyed by name.
+
+        Inserts every name with ON CONFLICT (name) DO NOTHING so concurrent scrapes
+        can't race each other, then SELECTs the names that already existed (the
+        ones the INSERT skipped and therefore didn't RETURN).
+        """
+        unique_names = list(dict.fromkeys(name for name in names if name))
+        if not unique_names:
+            return {}
+
+        statement = (
+            pg_insert(Fighter)
+            .values([{"name": name} for name in unique_names])
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(Fighter)
+        )
+        result = await self.session.execute(statement)
+        fighters = {fighter.name: fighter for fighter in result.scalars().all()}
+
+        existing_names = [name for name in unique_names if name not in fighters]
+        if existing_names:
+            existing = await self.get_all(
+                self.get_base_statement().where(Fighter.name == any_(array_param(Fighter.name, existing_names)))
+            )
+            fighters.update({fighter.name: fighter for fighter in existing})
+
+        return fighters
+
     async def get_without_avatar(self) -> Sequence[Fighter]:
         return await self.get_all(self.get_base_statement().where(Fighter.avatar_url.is_(None)))
 
     async def upsert(self, name: str, **kwargs) -> Fighter:
-        fighter = await self.get_by_name(name)
-        if fighter:
-            await self.update(fighter, update_dict=kwargs, flush=True)
-        else:
-            fighter = Fighter(name=name, **kwargs)
-            await self.create(fighter, flush=True)
+        (fighter,) = await self.bulk_upsert([{"name": name, **kwargs}], conflict_cols=["name"])
         return fighter
 
 
 class FeaturedFighterRepo(BaseRepository[FeaturedFighter]):
     model = FeaturedFighter
 
-    async def get_by_collection(self, collection: FeaturedCollection) -> Sequence[FeaturedFighter]:
+    async def get_by_collection(self, collection: FeaturedCollection, record: Callable[..., R]) -> list[R]:
+        """The collection's fighters in display order, as ``record(id=, name=, avatar_url=)``."""
         statement = (
-            self.get_base_statement()
-            .options(joinedload(FeaturedFighter.fighter))
+            select(Fighter.id, Fighter.name, Fighter.avatar_url)
+            .join(FeaturedFighter, FeaturedFighter.fighter_id == Fighter.id)
             .where(FeaturedFighter.collection == collection)
             .order_by(FeaturedFighter.position.asc().nulls_last(), FeaturedFighter.created_at.asc())
         )
-        return await self.get_all(statement)
+        return await self.get_records(statement, record)
 
 
 class RankRepo(BaseRepository[Rank]):
     model = Rank
 
-    async def bulk_upsert(self, ranks: list[RankInput]) -> Sequence[Rank]:
+    async def get_reads(self, record: Callable[..., R], sport: CombatSport | None = None) -> list[R]:
+        """Every rank, heaviest weight class first, as ``record(rank_type=, position=, fighter_name=,
+        weight_class_name=, organization_name=)``.
+        """
+        statement = (
+            select(
+                Rank.rank_type,
+                Rank.position,
+                Fighter.name.label("fighter_name"),
+                WeightClass.name.label("weight_class_name"),
+                FightOrganization.name.label("organization_name"),
+            )
+            .join(Fighter, Rank.fighter_id == Fighter.id)
+            .join(WeightClass, Rank.weight_class_id == WeightClass.id)
+            .join(FightOrganization, Rank.organization_id == FightOrganization.id)
+            .order_by(
+                WeightClass.pounds.desc().nulls_first(),
+                FightOrganization.name,
+                Rank.rank_type,
+                Rank.position.asc().nulls_first(),
+            )
+        )
+        if sport is not None:
+            statement = statement.where(WeightClass.sport == sport)
+        return await self.get_records(statement, record)
+
+    async def reconcile(self, ranks: list[RankInput]) -> RankDelta:
+        """Bring the ranks table in line with a full scrape, touching only rows that moved.
+
+        Rows are matched on (weight_class_id, organization_id, rank_type, position). The
+        delta is computed in memory against the current table and applied as at most one
+        DELETE, one executemany UPDATE and one multi-row INSERT. An empty scrape is treated
+        as a failed run and leaves the table untouched.
+        """
         if not ranks:
-            return []
+            return RankDelta()
 
-        # Full refresh: scraper fetches all rankings each run, so delete and re-insert
-        await self.session.execute(delete(Rank))
+        current_rows = await self.session.execute(
+            select(
+                Rank.id,
+                Rank.weight_class_id,
+                Rank.organization_id,
+                Rank.rank_type,
+                Rank.position,
+                Rank.fighter_id,
+            )
+        )
+        current = {
+            (row.weight_class_id, row.organization_id, row.rank_type, row.position): (row.id, row.fighter_id)
+            for row in current_rows
+        }
+        # Last occurrence wins if the scrape lists the same slot twice
+        incoming = {(r.weight_class_id, r.organization_id, r.rank_type, r.position): r for r in ranks}
+
+        delta = RankDelta()
+        for key, rank in incoming.items():
+            if key not in current:
+                delta.inserted.append(rank)
+                continue
+            rank_id, fighter_id = current[key]
+            if fighter_id != rank.fighter_id:
+                delta.updated.append(dataclasses.replace(rank, id=rank_id))
+        delta.deleted = [rank_id for key, (rank_id, _) in current.items() if key not in incoming]
+
+        # Deletes go first so freed (weight class, org, position) slots can be reused by inserts
+        if delta.deleted:
+            await self.session.execute(delete(Rank).where(Rank.id == any_(array_param(Rank.id, delta.deleted))))
+        if delta.updated:
+            await self.session.execute(
+                update(Rank),
+                [{"id": r.id, "fighter_id": r.fighter_id} for r in delta.updated],
+            )
+        if delta.inserted:
+            await self.session.execute(
+                pg_insert(Rank).values(
+                    [
+                        {
+                            "rank_type": r.rank_type,
+                            "position": r.position,
+                            "fighter_id": r.fighter_id,
+                            "weight_class_id": r.weight_class_id,
+                            "organization_id": r.organization_id,
+                        }
+                        for r in delta.inserted
+                    ]
+                )
+            )
 
-        rank_dicts = [r.model_dump(exclude={"id"}) for r in ranks]
-        stmt = pg_insert(Rank).values(rank_dicts).returning(Rank)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return delta
 
 
 class FightOrganizationRepo(BaseRepository[FightOrganization]):
@@ -77,44 +191,135 @@ class WeightClassRepo(BaseRepository[WeightClass]):
 class FightCardRepo(BaseRepository[FightCard]):
     model = FightCard
 
-    async def get_or_create(
-        self,
-        *,
-        event_name: str,
-        event_date: datetime,
-        location: str | None = None,
-        network: str | None = None,
-    ) -> FightCard:
-        card = await self.get_one_or_none(
-            self.get_base_statement().where(
-                FightCard.event_name == event_name,
-                FightCard.event_date == event_date,
+    async def get_read_rows(self, ids: Sequence[UUID]) -> Sequence[Row[Any]]:
+        """One row per bout of the given cards (one bout-less row for a card without bouts).
+
+        Ordered by event date, then bout order, and grouped by card. Columns are labelled
+        ``card_*`` and ``bout_*``, plus one ``red_<field>`` and ``blue_<field>`` per
+        FighterRead field. Bout and corner columns are NULL for a card without bouts. See
+        ``BoxingFightCardService._fight_card_reads``.
+        """
+        if not ids:
+            return []
+        red, blue = aliased(Fighter), aliased(Fighter)
+        statement = (
+            select(
+                FightCard.id.label("card_id"),
+                FightCard.event_name.label("card_event_name"),
+                FightCard.location.label("card_location"),
+                FightCard.event_date.label("card_event_date"),
+                Bout.id.label("bout_id"),
+                Bout.bout_order.label("bout_order"),
+                Bout.is_title_fight.label("bout_is_title_fight"),
+                *(column.label(f"red_{field}") for field, column in _fighter_read_columns(red)),
+                *(column.label(f"blue_{field}") for field, column in _fighter_read_columns(blue)),
             )
+            .outerjoin(Bout, Bout.fight_card_id == FightCard.id)
+            .outerjoin(red, Bout.red_corner_id == red.id)
+            .outerjoin(blue, Bout.blue_corner_id == blue.id)
+            .where(FightCard.id == any_(array_param(FightCard.id, ids)))
+            .order_by(FightCard.event_date.asc(), FightCard.id, Bout.bout_order.asc().nulls_last(), Bout.id)
         )
-        if not card:
-            card = FightCard(
-                event_name=event_name,
-                event_date=event_date,
-                location=location,
-                network=network,
-            )
-            await self.create(card, flush=True)
-        return card
-
-    async def upsert_bouts(self, fight_card: FightCard, bouts: list[BoutInput]) -> FightCard:
-        await self.session.execute(delete(Bout).where(Bout.fight_card_id == fight_card.id))
-        for bout_input in bouts:
-            await self.create(
-                Bout(
-                    fight_card_id=fight_card.id,
-                    red_corner_id=bout_input.red_corner_id,
-                    blue_corner_id=bout_input.blue_corner_id,
-                    bout_order=bout_input.bout_order,
-                    is_title_fight=bout_input.is_title_fight,
-                )
+        return await self.get_rows(statement)
+
+    async def upsert_many(self, source: str, cards: list[FightCardInput]) -> dict[str, FightCard]:
+        """Insert or update a batch of scraped cards in one statement, keyed by external id.
+
+        INSERT ... ON CONFLICT (source, external_id) DO UPDATE, so a rescheduled card or
+        one with a new opponent updates its existing row (and keeps its bouts fingerprint)
+        instead of adding a new one. Every card comes back from RETURNING, inserted or not.
+        Bouts aren't loaded: they're rewritten by upsert_bouts_many and read back through
+        get_read_rows, so the usual selectin load would only cost a second round trip.
+        """
+        fight_cards = await self.bulk_upsert(
+            [{**dataclasses.asdict(card), "source": source} for card in cards],
+            conflict_cols=["source", "external_id"],
+            options=[raiseload(FightCard.bouts)],
+        )
+        return {card.external_id: card for card in fight_cards}
+
+    async def delete_unlisted(self, source: str, listed_ids: Sequence[str]) -> int:
+        """Delete ``source``'s upcoming cards (and their bouts) whose external id isn't in ``listed_ids``.
+
+        Only call this with the full upstream listing from a complete sync. Past cards
+        are kept: upstream only lists upcoming events. Cards without an external id
+        (from before the key existed) count as unlisted. An empty listing is treated as
+        a failed run and deletes nothing.
+        """
+        if not listed_ids:
+            return 0
+
+        unlisted = select(FightCard.id).where(
+            FightCard.source == source,
+            FightCard.event_date > utc_now(),
+            or_(
+                FightCard.external_id.is_(None),
+                FightCard.external_id != all_(array_param(FightCard.external_id, listed_ids)),
+            ),
+        )
+        await self.session.execute(delete(Bout).where(Bout.fight_card_id.in_(unlisted)))
+        result = await self.session.execute(delete(FightCard).where(FightCard.id.in_(unlisted)).returning(FightCard.id))
+        return len(result.all())
+
+    async def upsert_bouts(self, fight_card: FightCard, bouts: list[BoutInput], *, reload: bool = False) -> FightCard:
+        """Replace a card's bouts, skipping the write entirely when the bout list is unchanged.
+
+        Pass ``reload=True`` to get the card back with fresh bouts; otherwise
+        ``fight_card.bouts`` may be stale after a rewrite.
+        """
+        await self.upsert_bouts_many({fight_card: bouts})
+        if not reload:
+            return fight_card
+
+        return await self.get_one_or_none(
+            self.get_base_statement().where(FightCard.id == fight_card.id).execution_options(populate_existing=True)
+        )
+
+    async def upsert_bouts_many(self, bouts_by_card: dict[FightCard, list[BoutInput]]) -> list[FightCard]:
+        """Replace bouts for many cards at once, returning the cards whose bouts changed.
+
+        Each card's incoming bouts are fingerprinted and compared with the hash stored on
+        the card. Cards that match are skipped; the rest get one shared DELETE and one
+        batched INSERT covering every changed card.
+        """
+        changed: list[FightCard] = []
+        bout_rows: list[dict] = []
+        for fight_card, bouts in bouts_by_card.items():
+            fingerprint = _fingerprint_bouts(bouts)
+            if fight_card.bouts_fingerprint == fingerprint:
+                continue
+            changed.append(fight_card)
+            fight_card.bouts_fingerprint = fingerprint
+            bout_rows.extend(
+                {
+                    "fight_card_id": fight_card.id,
+                    "red_corner_id": bout_input.red_corner_id,
+                    "blue_corner_id": bout_input.blue_corner_id,
+                    "bout_order": bout_input.bout_order,
+                    "is_title_fight": bout_input.is_title_fight,
+                }
+                for bout_input in bouts
             )
 
-        await self.session.flush()
+        if not changed:
+            return []
+
+        changed_ids = array_param(Bout.fight_card_id, [card.id for card in changed])
+        await self.session.execute(delete(Bout).where(Bout.fight_card_id == any_(changed_ids)))
+        if bout_rows:
+            # executemany form: SQLAlchemy's insertmanyvalues batches this into multi-row INSERTs
+            await self.session.execute(insert(Bout), bout_rows)
+
+        return changed
+
+
+def _fighter_read_columns(fighter: Any) -> list[tuple[str, Any]]:
+    # (FighterRead field, column) pairs, so the read rows always line up with the schema
+    return [(field, getattr(fighter, field)) for field in FighterRead.model_fields]
+
 
-        # Re-query to get the card with freshly loaded bouts
-        return await self.get_one_or_none(self.get_base_statement().where(FightCard.id == fight_card.id))
+def _fingerprint_bouts(bouts: list[BoutInput]) -> str:
+    payload = sorted(
+        (bout.bout_order or 0, str(bout.red_corner_id), str(bout.blue_corner_id), bout.is_title_fight) for bout in bouts
+    )
+    return hashlib.sha256(json.dumps(payload).encode()).hexdigest()
@@ -2,11 +2,25 @@ from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse, Response
 
 from sbtb.auth.permissions import SuperuserDep
-from sbtb.core.database.session import DbSession
+from sbtb.core.database.session import BatchDbSession, ReadSession
 from sbtb.fighter.avatar_generators import gemini_fighter_image_generator
-from sbtb.fighter.schemas import AvatarGenerationResult, FeaturedFighterRead, FightCardRead, RankRead
-from sbtb.fighter.service import boxer_scraper_service, boxing_fight_card_service, featured_fighter_service
+from sbtb.fighter.orchestrator import scrape_orchestrator
+from sbtb.fighter.schemas import (
+    AvatarGenerationResult,
+    DataRefreshResult,
+    FeaturedFighterRead,
+    FightCardSyncResult,
+    RankRead,
+    RankSyncResult,
+)
+from sbtb.fighter.service import (
+    boxer_scraper_service,
+    boxing_fight_card_service,
+    featured_fighter_service,
+    rank_service,
+)
 from sbtb.models.featured_fighter import FeaturedCollection
+from sbtb.models.fight_organization import CombatSport
 
 router = APIRouter(prefix="/fighter")
 
@@ -22,29 +36,43 @@ async def fighter_root() -> Response:
 @router.get(
     "/update-boxing-ranks",
     response_description="Update boxing ranks",
-    response_model=list[RankRead],
+    response_model=RankSyncResult,
     tags=["fighters"],
 )
 async def scrape_and_save_boxing_ranks(
-    session: DbSession,
+    session: BatchDbSession,
     _superuser: SuperuserDep,
-) -> list[RankRead]:
+) -> RankSyncResult:
     return await boxer_scraper_service.scrape_and_update_boxing_ranks(session=session)
 
 
 @router.get(
     "/update-boxing-fight-cards",
     response_description="Update boxing fight cards",
-    response_model=list[FightCardRead],
+    response_model=FightCardSyncResult,
     tags=["fighters"],
 )
 async def scrape_and_save_boxing_fight_cards(
-    session: DbSession,
+    session: BatchDbSession,
     _superuser: SuperuserDep,
-) -> list[FightCardRead]:
+) -> FightCardSyncResult:
     return await boxing_fight_card_service.scrape_and_update_boxing_fight_cards(session=session)
 
 
+@router.get(
+    "/refresh-data",
+    response_description="Scrape every source concurrently and persist the results in dependency order",
+    response_model=DataRefreshResult,
+    tags=["fighters"],
+)
+async def refresh_scraped_data(
+    session: BatchDbSession,
+    _superuser: SuperuserDep,
+    sport: CombatSport | None = None,
+) -> DataRefreshResult:
+    return await scrape_orchestrator.refresh(session=session, sport=sport)
+
+
 @router.post(
     "/generate-avatars",
     response_description="Generate Ghibli avatars for fighters missing one",
@@ -52,7 +80,7 @@ async def scrape_and_save_boxing_fight_cards(
     tags=["fighters"],
 )
 async def generate_fighter_avatars(
-    session: DbSession,
+    session: BatchDbSession,
     _superuser: SuperuserDep,
 ) -> AvatarGenerationResult:
     return await gemini_fighter_image_generator.generate_fighter_avatars(session=session)
@@ -65,7 +93,20 @@ async def generate_fighter_avatars(
     tags=["fighters"],
 )
 async def get_featured_fighters(
-    session: DbSession,
+    session: ReadSession,
     collection: FeaturedCollection = FeaturedCollection.popular_fighters,
 ) -> list[FeaturedFighterRead]:
     return await featured_fighter_service.get_by_collection(session=session, collection=collection)
+
+
+@router.get(
+    "/rankings",
+    response_description="List current rankings, heaviest weight class first",
+    response_model=list[RankRead],
+    tags=["fighters"],
+)
+async def get_rankings(
+    session: ReadSession,
+    sport: CombatSport | None = None,
+) -> list[RankRead]:
+    return await rank_service.get_rankings(session=session, sport=sport)
@@ -1,20 +1,27 @@
 import datetime
-
-from pydantic import UUID4, BaseModel
+from dataclasses import dataclass, field
+from uuid import UUID
 
 from sbtb.core.schemas import BaseSchema, IDSchema
 from sbtb.models.rank import RankType
 
 # --- Internal DTOs (not for API responses) ---
+# Plain slotted dataclasses: scraper output and repository inputs are built by our own
+# code from already-typed values, so they skip pydantic validation. Validation happens
+# at the API boundary.
 
 
-class RawBoxerSchema(BaseModel):
+@dataclass(slots=True)
+class RawBoxerSchema:
     name: str
     rank_type: RankType
     position: int | None = None  # 1–15 for contenders, None for champion types
 
 
-class ParsedFightCard(BaseModel):
+@dataclass(slots=True)
+class ParsedFightCard:
+    # Upstream event id, stable across reschedules and opponent changes
+    external_id: str
     fight_date: datetime.datetime
     title_fighters: list[str]
     undercard_fighters: list[str]
@@ -22,18 +29,42 @@ class ParsedFightCard(BaseModel):
     network: str | None = None
 
 
-class RankInput(BaseSchema):
-    id: UUID4 | None = None
+@dataclass(slots=True, kw_only=True)
+class RankInput:
+    id: UUID | None = None
     rank_type: RankType
     position: int | None = None
-    fighter_id: UUID4
-    weight_class_id: UUID4
-    organization_id: UUID4
+    fighter_id: UUID
+    weight_class_id: UUID
+    organization_id: UUID
+
+
+@dataclass(slots=True)
+class RankDelta:
+    """Changes applied by RankRepo.reconcile, keyed by (weight class, org, rank type, position)."""
+
+    inserted: list[RankInput] = field(default_factory=list)
+    updated: list[RankInput] = field(default_factory=list)
+    deleted: list[UUID] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
 
 
-class BoutInput(BaseSchema):
-    red_corner_id: UUID4
-    blue_corner_id: UUID4
+@dataclass(slots=True)
+class FightCardInput:
+    external_id: str
+    event_name: str
+    event_date: datetime.datetime
+    location: str | None = None
+    network: str | None = None
+
+
+@dataclass(slots=True)
+class BoutInput:
+    red_corner_id: UUID
+    blue_corner_id: UUID
     bout_order: int | None = None
     is_title_fight: bool = False
 
@@ -77,6 +108,15 @@ class RankRead(BaseSchema):
     organization_name: str
 
 
+class RankSyncResult(BaseSchema):
+    ranks: list[RankRead] = []
+    # True when the rankings page was unchanged (304 or same content hash) and nothing was parsed or written
+    is_noop: bool = False
+    ranks_inserted: int = 0
+    ranks_updated: int = 0
+    ranks_deleted: int = 0
+
+
 class BoutRead(IDSchema):
     bout_order: int | None = None
     is_title_fight: bool
@@ -89,3 +129,22 @@ class FightCardRead(IDSchema):
     location: str | None = None
     event_date: datetime.datetime
     bouts: list[BoutRead] = []
+
+
+class FightCardSyncResult(BaseSchema):
+    fight_cards: list[FightCardRead] = []
+    cards_scraped: int = 0
+    cards_changed: int = 0
+    # Upcoming cards upstream no longer lists, removed after a full sync
+    cards_removed: int = 0
+    full_sync: bool = False
+    timings_ms: dict[str, float] = {}
+
+
+class DataRefreshResult(BaseSchema):
+    """One result field per scrape source (see sbtb.fighter.orchestrator); None if it was not run or failed."""
+
+    ranks: RankSyncResult | None = None
+    fight_cards: FightCardSyncResult | None = None
+    failed_sources: list[str] = []
+    timings_ms: dict[str, float] = {}
@@ -1,5 +1,19 @@
-from .base import BaseScraper
+from .base import BaseScraper, ScrapeResult
 from .boxers import BoxingRankScraper
 from .boxing_fight_cards import BoxingFightCardScraper
+from .executor import ParseExecutor, parse_executor
+from .http import ScraperHttpClient, scraper_http_client
+from .policy import RequestMetrics, RequestPolicy
 
-__all__ = ["BaseScraper", "BoxingRankScraper", "BoxingFightCardScraper"]
+__all__ = [
+    "BaseScraper",
+    "BoxingRankScraper",
+    "BoxingFightCardScraper",
+    "ParseExecutor",
+    "parse_executor",
+    "RequestMetrics",
+    "RequestPolicy",
+    "ScrapeResult",
+    "ScraperHttpClient",
+    "scraper_http_client",
+]
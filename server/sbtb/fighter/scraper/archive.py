@@ -0,0 +1,239 @@
+"""Local archive of every raw payload the scrapers download.
+
+Payloads are stored once per distinct content: zstd-compressed and keyed by the
+sha256 of the raw bytes, under ``blobs/<first two hex chars>/<digest>.zst``. Each
+scrape run writes a JSON manifest under ``runs/``. The manifest lists what was
+fetched, in order, and points at the blobs. A run can then be replayed through the
+scrapers' ``parse`` and the services without touching the network.
+
+Everything here is blocking file I/O and compression; the scrapers call it through
+``asyncio.to_thread`` (see sbtb.fighter.scraper.base.ScrapeResult). Streamed payloads
+are compressed chunk by chunk as they arrive. Once a run is saved the oldest runs
+past ``max_runs`` or ``max_bytes`` are pruned, along with the blobs only they used.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+import zstandard
+
+from sbtb.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(slots=True)
+class ArchiveEntry:
+    # What the payload is to the scraper, e.g. "rankings_html" or "rsc_page"
+    kind: str
+    url: str
+    sha256: str
+    size: int
+    method: str = "GET"
+    # JSON request body, for POSTs such as the Server Action pagination
+    request: Any = None
+
+
+@dataclass(slots=True)
+class RunManifest:
+    run_id: str
+    scraper: str
+    started_at: str
+    finished_at: str | None = None
+    entries: list[ArchiveEntry] = field(default_factory=list)
+
+    def entries_of(self, kind: str) -> list[ArchiveEntry]:
+        return [entry for entry in self.entries if entry.kind == kind]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RunManifest":
+        return cls(**{**data, "entries": [ArchiveEntry(**entry) for entry in data["entries"]]})
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+class PayloadWriter:
+    """Compresses one streamed payload into the archive chunk by chunk, never holding it whole.
+
+    The blob lands under its digest on ``finish``; ``abort`` throws the partial one away.
+    """
+
+    def __init__(self, archive: "ScrapeArchive", on_finish: Callable[[str, int], None]) -> None:
+        self.archive = archive
+        self.on_finish = on_finish
+        self._sha256 = hashlib.sha256()
+        self._size = 0
+        incoming = archive.directory / "blobs"
+        incoming.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=incoming, prefix=".incoming.", suffix=".tmp")
+        self._writer = zstandard.ZstdCompressor(level=archive.level).stream_writer(os.fdopen(fd, "wb"))
+
+    def write(self, chunk: bytes) -> None:
+        self._sha256.update(chunk)
+        self._size += len(chunk)
+        self._writer.write(chunk)
+
+    def finish(self) -> str:
+        self._writer.close()
+        digest = self._sha256.hexdigest()
+        path = self.archive._blob_path(digest)
+        if path.exists():
+            Path(self._tmp_path).unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp_path, path)
+        self.on_finish(digest, self._size)
+        return digest
+
+    def abort(self) -> None:
+        self._writer.close()
+        Path(self._tmp_path).unlink(missing_ok=True)
+
+
+class ScrapeRun:
+    """Records the payloads of one scrape run. The manifest is written on ``close``."""
+
+    def __init__(self, archive: "ScrapeArchive", scraper: str) -> None:
+        self.archive = archive
+        now = datetime.datetime.now(datetime.UTC)
+        self.manifest = RunManifest(
+            run_id=f"{now:%Y%m%dT%H%M%S}-{scraper}-{uuid.uuid4().hex[:8]}",
+            scraper=scraper,
+            started_at=now.isoformat(),
+        )
+
+    def record(self, kind: str, data: bytes, *, url: str, method: str = "GET", request: Any = None) -> None:
+        digest = self.archive.put(data)
+        self.manifest.entries.append(
+            ArchiveEntry(kind=kind, url=url, sha256=digest, size=len(data), method=method, request=request)
+        )
+
+    def stream(self, kind: str, *, url: str, method: str = "GET", request: Any = None) -> PayloadWriter:
+        """Like ``record``, for a payload written chunk by chunk. It is listed once ``finish`` is called."""
+
+        def add_entry(digest: str, size: int) -> None:
+            self.manifest.entries.append(
+                ArchiveEntry(kind=kind, url=url, sha256=digest, size=size, method=method, request=request)
+            )
+
+        return PayloadWriter(self.archive, on_finish=add_entry)
+
+    def close(self) -> None:
+        if not self.manifest.entries:
+            return
+        self.manifest.finished_at = datetime.datetime.now(datetime.UTC).isoformat()
+        self.archive.save_manifest(self.manifest)
+
+
+class ScrapeArchive:
+    def __init__(
+        self,
+        directory: str | Path,
+        level: int = 10,
+        max_runs: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.level = level
+        self.max_runs = max_runs
+        self.max_bytes = max_bytes
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.directory / "blobs" / digest[:2] / f"{digest}.zst"
+
+    def _manifest_path(self, run_id: str) -> Path:
+        return self.directory / "runs" / f"{run_id}.json"
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            _write_atomic(path, zstandard.ZstdCompressor(level=self.level).compress(data))
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        # decompressobj, since streamed blobs have no content size in their frame header
+        return zstandard.ZstdDecompressor().decompressobj().decompress(self._blob_path(digest).read_bytes())
+
+    def start_run(self, scraper: str) -> ScrapeRun:
+        return ScrapeRun(archive=self, scraper=scraper)
+
+    def save_manifest(self, manifest: RunManifest) -> None:
+        _write_atomic(self._manifest_path(manifest.run_id), json.dumps(asdict(manifest), indent=2).encode())
+        logger.info("Archived scrape run", run_id=manifest.run_id, payloads=len(manifest.entries))
+        self.prune()
+
+    def load_manifest(self, run_id: str) -> RunManifest:
+        return RunManifest.from_dict(json.loads(self._manifest_path(run_id).read_text()))
+
+    def runs(self, scraper: str | None = None) -> list[RunManifest]:
+        """Every archived run, oldest first, optionally only those of one scraper."""
+        manifests = [
+            RunManifest.from_dict(json.loads(path.read_text())) for path in (self.directory / "runs").glob("*.json")
+        ]
+        return sorted(
+            (m for m in manifests if scraper is None or m.scraper == scraper),
+            key=lambda m: m.started_at,
+        )
+
+    def prune(self) -> None:
+        """Drop the oldest runs past ``max_runs`` or ``max_bytes`` (compressed), and blobs only they used.
+
+        The newest run is always kept. Blobs shared by several runs count once.
+        """
+        if self.max_runs is None and self.max_bytes is None:
+            return
+        blob_sizes = {path.stem: path.stat().st_size for path in (self.directory / "blobs").rglob("*.zst")}
+        kept_digests: set[str] = set()
+        kept_bytes = 0
+        dropped = []
+        for i, manifest in enumerate(reversed(self.runs())):
+            digests = {entry.sha256 for entry in manifest.entries} - kept_digests
+            run_bytes = sum(blob_sizes.get(digest, 0) for digest in digests)
+            over_runs = self.max_runs is not None and i >= self.max_runs
+            over_bytes = self.max_bytes is not None and kept_bytes + run_bytes > self.max_bytes
+            if i > 0 and (dropped or over_runs or over_bytes):
+                dropped.append(manifest)
+                continue
+            kept_digests |= digests
+            kept_bytes += run_bytes
+
+        if not dropped:
+            return
+        for manifest in dropped:
+            self._manifest_path(manifest.run_id).unlink(missing_ok=True)
+        # Only blobs of dropped runs: others may belong to a run that is still in progress
+        dropped_digests = {entry.sha256 for manifest in dropped for entry in manifest.entries}
+        for digest in dropped_digests - kept_digests:
+            self._blob_path(digest).unlink(missing_ok=True)
+        logger.info("Pruned scrape archive", runs=len(dropped), kept_bytes=kept_bytes)
+
+
+scrape_archive = (
+    ScrapeArchive(
+        directory=settings.SCRAPE_ARCHIVE_DIR,
+        max_runs=settings.SCRAPE_ARCHIVE_MAX_RUNS,
+        max_bytes=settings.SCRAPE_ARCHIVE_MAX_MB * 1024 * 1024,
+    )
+    if settings.SCRAPE_ARCHIVE_ENABLED
+    else None
+)
@@ -1,33 +1,224 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from contextlib import AbstractAsyncContextManager, contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Generic, Self, TypeVar
 
 import aiohttp
 import bs4
 import structlog
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from sbtb.fighter.scraper.archive import PayloadWriter, RunManifest, ScrapeArchive, ScrapeRun, scrape_archive
+from sbtb.fighter.scraper.executor import ParseExecutor
+from sbtb.fighter.scraper.executor import parse_executor as shared_parse_executor
+from sbtb.fighter.scraper.http import ScraperHttpClient, scraper_http_client
+from sbtb.fighter.scraper.policy import RequestMetrics
+from sbtb.fighter.scraper.state import ScraperStateStore, scraper_state_store
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# Session.info key holding the (scraper, run) pairs waiting for the session's transaction to commit
+_PENDING_STATE_KEY = "scraper_pending_state"
+
+
+@dataclass(slots=True)
+class ScrapeResult(Generic[T]):
+    """One scraper run: what it fetched, and the state to save once that has been committed.
+
+    ``run_scraper`` creates one per call and the service hands it from ``fetch`` to
+    ``persist``, so nothing about a run is kept on the shared scraper instance.
+    """
+
+    payload: T | None = None
+    # Upstream had nothing new since the last committed run, so ``payload`` is None
+    unchanged: bool = False
+    # The run paged through the whole upstream listing
+    full_sync: bool = False
+    # Every upstream id seen, if the run was a complete full sync
+    listed_ids: list[str] | None = None
+    # Written to the state store by ``BaseScraper.commit_state`` once the payload is committed
+    staged_state: dict[str, Any] = field(default_factory=dict)
+    # Retries and throttling seen by the run
+    request_metrics: RequestMetrics = field(default_factory=RequestMetrics)
+    # Records the run's payloads while it is in progress, if the archive is enabled
+    archive_run: ScrapeRun | None = None
+
+    async def archive_payload(
+        self, kind: str, data: bytes, *, url: str, method: str = "GET", request: Any = None
+    ) -> None:
+        # Compression and the blob write are blocking, so they run on a worker thread
+        if self.archive_run is not None:
+            await asyncio.to_thread(self.archive_run.record, kind, data, url=url, method=method, request=request)
+
+    def archiving(
+        self, chunks: AsyncIterable[bytes], kind: str, *, url: str, method: str = "GET", request: Any = None
+    ) -> AsyncIterable[bytes]:
+        """Pass a streamed payload through, archiving it chunk by chunk as it arrives."""
+        if self.archive_run is None:
+            return chunks
+        return self._archive_stream(chunks, self.archive_run.stream(kind, url=url, method=method, request=request))
+
+    @staticmethod
+    async def _archive_stream(chunks: AsyncIterable[bytes], writer: PayloadWriter) -> AsyncIterator[bytes]:
+        finished = False
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(writer.write, chunk)
+                yield chunk
+            await asyncio.to_thread(writer.finish)
+            finished = True
+        finally:
+            if not finished:
+                writer.abort()
+
+    def stage_state(self, key: str, value: Any) -> None:
+        """Hold state for the state store until this run's results have been committed."""
+        self.staged_state[key] = value
+
 
 class BaseScraper(ABC):
     URL: str
     HEADERS: dict
 
+    def __init__(
+        self,
+        http_client: ScraperHttpClient | None = None,
+        state_store: ScraperStateStore | None = None,
+        parse_executor: ParseExecutor | None = None,
+        archive: ScrapeArchive | None = None,
+        url: str | None = None,
+    ) -> None:
+        # Lets one scraper class serve several sources that share a page layout
+        if url is not None:
+            self.URL = url
+        self.http_client = http_client or scraper_http_client
+        self.state_store = state_store or scraper_state_store
+        self.parse_executor = parse_executor or shared_parse_executor
+        self.archive = archive or scrape_archive
+        self._replay_manifest: RunManifest | None = None
+
+    # Scrapers are pickled when their bound ``parse`` is sent to a process pool. The
+    # process-local collaborators stay behind and are replaced with the module singletons.
+    _PROCESS_LOCAL = ("http_client", "state_store", "parse_executor", "archive")
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {k: v for k, v in self.__dict__.items() if k not in self._PROCESS_LOCAL}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.http_client = scraper_http_client
+        self.state_store = scraper_state_store
+        self.parse_executor = shared_parse_executor
+        self.archive = scrape_archive
+
     @staticmethod
     def load_soup(html_source: str) -> bs4.BeautifulSoup:
         return bs4.BeautifulSoup(html_source, "lxml")
 
-    async def request_data(self) -> str | None:
+    def request(
+        self, run: ScrapeResult[Any], method: str, url: str, **kwargs: Any
+    ) -> AbstractAsyncContextManager[aiohttp.ClientResponse]:
+        """``http_client.request``, counting retries and throttling into ``run.request_metrics``."""
+        return self.http_client.request(method, url, metrics=run.request_metrics, **kwargs)
+
+    async def request_data(self, run: ScrapeResult[Any], archive_kind: str = "page") -> str | None:
         try:
-            async with aiohttp.ClientSession(headers=self.HEADERS) as session:
-                async with session.get(self.URL, timeout=aiohttp.ClientTimeout(total=10)) as res:
-                    res.raise_for_status()
-                    return await res.text()
+            async with self.request(run, "GET", self.URL, headers=self.HEADERS) as res:
+                res.raise_for_status()
+                text = await res.text()
         except Exception:
             logger.exception(f"ERROR OCCURRED WHILE SCRAPING {self.__class__.__name__}")
-        return None
+            return None
+        await run.archive_payload(archive_kind, text.encode(), url=self.URL)
+        return text
+
+    async def run_scraper(self) -> ScrapeResult[Any]:
+        """Scrape upstream, archiving every payload, or replay an archived run when inside ``replaying``."""
+        run: ScrapeResult[Any] = ScrapeResult()
+        if self._replay_manifest is not None:
+            run.payload = await self.replay(self._replay_manifest)
+            return run
+
+        if self.archive is not None:
+            run.archive_run = self.archive.start_run(scraper=type(self).__name__)
+        try:
+            run.payload = await self.scrape(run)
+        finally:
+            if run.archive_run is not None:
+                # Writes the manifest and prunes old runs
+                await asyncio.to_thread(run.archive_run.close)
+                run.archive_run = None
+            logger.info("Scrape run finished", scraper=type(self).__name__, **asdict(run.request_metrics))
+        return run
+
+    @contextmanager
+    def replaying(self, manifest: RunManifest) -> Iterator[Self]:
+        """Make ``run_scraper`` (and so the services) read ``manifest``'s payloads instead of the network."""
+        if self.archive is None:
+            raise RuntimeError("Replaying a scrape run needs the scrape archive (SCRAPE_ARCHIVE_ENABLED)")
+        self._replay_manifest = manifest
+        try:
+            yield self
+        finally:
+            self._replay_manifest = None
+
+    def load_archived(self, manifest: RunManifest, kind: str) -> list[bytes]:
+        assert self.archive is not None
+        return [self.archive.get(entry.sha256) for entry in manifest.entries_of(kind)]
+
+    def commit_state(self, run: ScrapeResult[Any]) -> None:
+        """Write the state staged by ``run`` now. Services use ``commit_state_on_commit`` instead."""
+        for key, value in run.staged_state.items():
+            self.state_store.set(key, value)
+        run.staged_state.clear()
+
+    def commit_state_on_commit(self, session: AsyncSession, run: ScrapeResult[Any]) -> None:
+        """Write the state staged by ``run`` once ``session``'s transaction commits.
+
+        Services call this at the end of ``persist``. If the transaction rolls back, or
+        the commit fails, the state is dropped: the next run then sees the same upstream
+        changes again instead of skipping rows that were never saved.
+        """
+        if not run.staged_state:
+            return
+        sync_session = session.sync_session
+        pending = sync_session.info.get(_PENDING_STATE_KEY)
+        if pending is None:
+            pending = sync_session.info[_PENDING_STATE_KEY] = []
+            event.listen(sync_session, "after_commit", _write_pending_state)
+            event.listen(sync_session, "after_rollback", _drop_pending_state)
+        pending.append((self, run))
+
+    async def parse_off_loop(self, raw_data: Any) -> list[Any] | dict[str, Any]:
+        """Run ``parse`` on the parse executor so a long parse never blocks the event loop."""
+        return await self.parse_executor.run(self.parse, raw_data)
+
+    @abstractmethod
+    async def scrape(self, run: ScrapeResult[Any]) -> Any: ...
 
     @abstractmethod
-    async def run_scraper(self) -> list[Any]: ...
+    async def replay(self, manifest: RunManifest) -> Any: ...
 
     @abstractmethod
     def parse(self, raw_data: Any) -> list[Any]: ...
+
+
+# Savepoints fire after_commit / after_rollback too; only the outermost transaction decides
+def _write_pending_state(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    pending = session.info[_PENDING_STATE_KEY]
+    while pending:
+        scraper, run = pending.pop(0)
+        scraper.commit_state(run)
+
+
+def _drop_pending_state(session: Session) -> None:
+    if not session.in_nested_transaction():
+        session.info[_PENDING_STATE_KEY].clear()
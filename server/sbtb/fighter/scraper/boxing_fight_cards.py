@@ -1,6 +1,10 @@
 import datetime
+import hashlib
 import json
 import re
+import time
+from dataclasses import dataclass
+from typing import Any
 from urllib.parse import urlparse
 
 import aiohttp
@@ -8,16 +12,44 @@ import pytz
 import structlog
 
 from sbtb.core.config import settings
+from sbtb.core.logging import StageProgress
 from sbtb.fighter.schemas import ParsedFightCard
-from sbtb.fighter.scraper.base import BaseScraper
+from sbtb.fighter.scraper.archive import RunManifest
+from sbtb.fighter.scraper.base import BaseScraper, ScrapeResult
+from sbtb.fighter.scraper.rsc import extract_rsc_results, read_rsc_results
 
 logger = structlog.get_logger(__name__)
 
 
+class StaleActionIdError(Exception):
+    """The Server Action ID no longer resolves upstream (404 or an unparseable RSC payload)."""
+
+
+# Cursor sorting before every upcoming event: (event datetime, event id)
+_START_CURSOR = ("2000-01-01T00:00:00", 0)
+
+
+@dataclass(slots=True)
+class _PageRun:
+    events: list[dict]
+    # Cursor of the last event fetched (or the starting cursor if none were)
+    cursor: tuple[str, int]
+    # False if a page failed before the run reached its stopping point
+    complete: bool
+    # True if upstream has no events past ``cursor``
+    exhausted: bool
+
+
 class BoxingFightCardScraper(BaseScraper):
     URL = settings.BOXING_SCHEDULE_URL
     HEADERS = settings.BOXING_HEADERS
+    # FightCard.source for the cards this scraper produces
+    SOURCE = "boxing_schedule"
     PAGE_SIZE = 10
+    STREAM_CHUNK_SIZE = 16 * 1024
+    ACTION_ID_STATE_KEY = "boxing_schedule_action_id"
+    # Bump the version to force a full sync on the next run, e.g. when stored cards need rekeying
+    SYNC_STATE_KEY = "boxing_schedule_sync_v2"
 
     # Pattern to find the schedule page JS chunk in HTML
     _CHUNK_URL_PATTERN = re.compile(r"/_next/static/chunks/app/schedule/page-[a-f0-9]+\.js")
@@ -38,18 +70,67 @@ class BoxingFightCardScraper(BaseScraper):
         "UTC": "UTC",
     }
 
-    async def run_scraper(self) -> list[ParsedFightCard] | None:
-        action_id = await self._discover_action_id()
-        if not action_id:
+    async def scrape(self, run: ScrapeResult[list[ParsedFightCard]]) -> list[ParsedFightCard] | None:
+        """Scrape the schedule, returning only events that are new or changed since the last committed sync.
+
+        The new sync state is only staged on ``run``; ``commit_state_on_commit`` saves
+        it once the transaction holding the returned cards commits, otherwise the next
+        run starts from the previous state again.
+        """
+        action_id = self.state_store.get(self.ACTION_ID_STATE_KEY)
+        is_cached = action_id is not None
+        if not is_cached:
+            action_id = await self._refresh_action_id(run)
+            if not action_id:
+                return None
+
+        try:
+            events = await self._fetch_events(run, action_id=action_id)
+        except StaleActionIdError:
+            if not is_cached:
+                logger.error("Freshly discovered Server Action ID was rejected", action_id=action_id)
+                return None
+            # Upstream redeployed since we cached the ID: rediscover once and retry
+            logger.info("Cached Server Action ID is stale, rediscovering", action_id=action_id)
+            action_id = await self._refresh_action_id(run)
+            if not action_id:
+                return None
+            try:
+                events = await self._fetch_events(run, action_id=action_id)
+            except StaleActionIdError:
+                logger.error("Rediscovered Server Action ID was rejected", action_id=action_id)
+                return None
+
+        if not events:
             return None
-        events = await self._fetch_all_events(action_id=action_id)
+        return await self.parse_off_loop(raw_data=events)
+
+    async def replay(self, manifest: RunManifest) -> list[ParsedFightCard] | None:
+        """Parse every schedule page archived in ``manifest``. Sync state is left untouched."""
+        events = [
+            event
+            for raw_page in self.load_archived(manifest, "rsc_page")
+            for event in extract_rsc_results(raw_page.decode()) or []
+        ]
         if not events:
             return None
-        return self.parse(raw_data=events)
+        return await self.parse_off_loop(raw_data=events)
+
+    async def _refresh_action_id(self, run: ScrapeResult[Any]) -> str | None:
+        """Discover the Server Action ID and cache it so later runs can skip the page + chunk downloads."""
+        self.state_store.delete(self.ACTION_ID_STATE_KEY)
+        action_id = await self._discover_action_id(run)
+        if action_id:
+            self.state_store.set(
+                self.ACTION_ID_STATE_KEY,
+                action_id,
+                ttl_seconds=settings.BOXING_SCHEDULE_ACTION_ID_TTL_SECONDS,
+            )
+        return action_id
 
-    async def _discover_action_id(self) -> str | None:
+    async def _discover_action_id(self, run: ScrapeResult[Any]) -> str | None:
         """Fetch the schedule page and extract the Server Action ID from its JS chunk."""
-        html = await self.request_data()
+        html = await self.request_data(run, archive_kind="schedule_html")
         if not html:
             return None
 
@@ -62,13 +143,13 @@ class BoxingFightCardScraper(BaseScraper):
         chunk_url = f"{parsed.scheme}://{parsed.netloc}{chunk_match.group(0)}"
 
         try:
-            async with aiohttp.ClientSession(headers=self.HEADERS) as session:
-                async with session.get(chunk_url, timeout=aiohttp.ClientTimeout(total=10)) as res:
-                    res.raise_for_status()
-                    chunk_text = await res.text()
+            async with self.request(run, "GET", chunk_url, headers=self.HEADERS) as res:
+                res.raise_for_status()
+                chunk_text = await res.text()
         except Exception:
             logger.exception("Failed to fetch JS chunk")
             return None
+        await run.archive_payload("js_chunk", chunk_text.encode(), url=chunk_url)
 
         action_match = self._ACTION_ID_PATTERN.search(chunk_text)
         if not action_match:
@@ -79,13 +160,90 @@ class BoxingFightCardScraper(BaseScraper):
         logger.info(f"Discovered Server Action ID: {action_id}")
         return action_id
 
-    async def _fetch_all_events(self, action_id: str) -> list[dict] | None:
-        """Paginate through all upcoming events via the Next.js Server Action."""
-        all_events: list[dict] = []
-        last_event_id = 0
-        last_event_date = "2000-01-01T00:00:00"
+    async def _fetch_events(self, run: ScrapeResult[Any], action_id: str) -> list[dict] | None:
+        """Fetch the part of the schedule that may have changed and keep only new or changed events.
+
+        A full sync pages through every upcoming event. Between full syncs (every
+        ``BOXING_SCHEDULE_FULL_RESYNC_SECONDS``) only the next
+        ``BOXING_SCHEDULE_INCREMENTAL_WINDOW_WEEKS`` are re-fetched, plus anything
+        announced past the high-water mark left by the previous sync. Events whose
+        content hash is unchanged are dropped. If any page fails, whatever was
+        fetched is returned but no new state is staged. Staged state only reaches the
+        store once the cards are committed, so a failed persist or commit fetches the
+        same events again on the next run.
+        """
+        state = self.state_store.get(self.SYNC_STATE_KEY)
+        now = time.time()
+        full_sync = state is None or now - state["full_synced_at"] >= settings.BOXING_SCHEDULE_FULL_RESYNC_SECONDS
+
+        if full_sync:
+            pages = await self._fetch_pages(run, action_id=action_id)
+            events, complete, watermark = pages.events, pages.complete, pages.cursor
+            event_hashes: dict[str, list[str]] = {}
+            full_synced_at = now
+        else:
+            window_end = datetime.date.today() + datetime.timedelta(
+                weeks=settings.BOXING_SCHEDULE_INCREMENTAL_WINDOW_WEEKS
+            )
+            pages = await self._fetch_pages(run, action_id=action_id, until=window_end.isoformat())
+            events, complete = pages.events, pages.complete
+            watermark = max(pages.cursor, tuple(state["watermark"]))
+            if pages.complete and not pages.exhausted:
+                # Skip the settled middle of the schedule and pick up from the high-water mark
+                tail = await self._fetch_pages(run, action_id=action_id, after=watermark)
+                events, complete, watermark = events + tail.events, tail.complete, tail.cursor
+            event_hashes = dict(state["event_hashes"])
+            full_synced_at = state["full_synced_at"]
+
+        if not complete:
+            return events or None
+
+        changed = []
+        for event in events:
+            digest = self._hash_event(event)
+            if event_hashes.get(str(event["id"]), [None, None])[1] != digest:
+                changed.append(event)
+            event_hashes[str(event["id"])] = [event["event_date"], digest]
+
+        today = datetime.date.today().isoformat()
+        run.stage_state(
+            self.SYNC_STATE_KEY,
+            {
+                "watermark": list(watermark),
+                "full_synced_at": full_synced_at,
+                # Events that already happened can no longer change
+                "event_hashes": {id: entry for id, entry in event_hashes.items() if entry[0] >= today},
+            },
+        )
+        run.full_sync = full_sync
+        if full_sync:
+            run.listed_ids = [str(event["id"]) for event in events]
+        logger.info(
+            "Fetched boxing schedule",
+            full_sync=full_sync,
+            fetched=len(events),
+            changed=len(changed),
+        )
+        return changed
+
+    async def _fetch_pages(
+        self,
+        run: ScrapeResult[Any],
+        action_id: str,
+        after: tuple[str, int] = _START_CURSOR,
+        until: str | None = None,
+    ) -> _PageRun:
+        """Paginate through upcoming events via the Next.js Server Action.
+
+        Starts after the ``after`` cursor and stops at the end of the schedule, or once
+        a page reaches past the ``until`` date. Raises StaleActionIdError if upstream
+        404s the action, or if the first page comes back without a parseable results row.
+        """
+        events: list[dict] = []
+        cursor = after
 
         while True:
+            last_event_date, last_event_id = cursor
             payload = [
                 "get_upcoming_events",
                 {"last_event_id": last_event_id, "last_event_date": last_event_date},
@@ -93,59 +251,73 @@ class BoxingFightCardScraper(BaseScraper):
                 self.PAGE_SIZE,
             ]
             try:
-                async with aiohttp.ClientSession(headers=self.HEADERS) as session:
-                    async with session.post(
-                        self.URL,
-                        headers={"Accept": "text/x-component", "next-action": action_id},
-                        json=payload,
-                        timeout=aiohttp.ClientTimeout(total=15),
-                    ) as res:
-                        res.raise_for_status()
-                        text = await res.text()
+                async with self.request(
+                    run,
+                    "POST",
+                    self.URL,
+                    headers={**(self.HEADERS or {}), "Accept": "text/x-component", "next-action": action_id},
+                    json=payload,
+                ) as res:
+                    res.raise_for_status()
+                    chunks = run.archiving(
+                        res.content.iter_chunked(self.STREAM_CHUNK_SIZE),
+                        "rsc_page",
+                        url=self.URL,
+                        method="POST",
+                        request=payload,
+                    )
+                    results = await read_rsc_results(chunks)
+            except aiohttp.ClientResponseError as e:
+                if e.status == 404:
+                    raise StaleActionIdError(action_id) from e
+                logger.exception("Server Action POST failed")
+                return _PageRun(events=events, cursor=cursor, complete=False, exhausted=False)
             except Exception:
                 logger.exception("Server Action POST failed")
-                break
+                return _PageRun(events=events, cursor=cursor, complete=False, exhausted=False)
 
-            results = self._extract_results(rsc_text=text)
-            if not results:
-                break
+            if results is None:
+                if not events:
+                    raise StaleActionIdError(action_id)
+                logger.error("Server Action page without a results row", cursor=cursor)
+                return _PageRun(events=events, cursor=cursor, complete=False, exhausted=False)
 
-            all_events.extend(results)
-            logger.info(f"Fetched {len(all_events)} fight cards so far")
+            events.extend(results)
+            logger.info(f"Fetched {len(events)} fight cards so far")
+            if results:
+                cursor = self._event_cursor(results[-1])
 
             if len(results) < self.PAGE_SIZE:
-                break
+                return _PageRun(events=events, cursor=cursor, complete=True, exhausted=True)
+            if until is not None and cursor[0] >= until:
+                return _PageRun(events=events, cursor=cursor, complete=True, exhausted=False)
 
-            last = results[-1]
-            last_event_id = last["id"]
-            last_event_date = f"{last['event_date']}T{last.get('event_time', '00:00:00')}"
-
-        return all_events or None
+    @staticmethod
+    def _event_cursor(event: dict) -> tuple[str, int]:
+        return f"{event['event_date']}T{event.get('event_time', '00:00:00')}", event["id"]
 
     @staticmethod
-    def _extract_results(rsc_text: str) -> list[dict] | None:
-        """Parse the results list from the RSC Server Action payload."""
-        for line in rsc_text.split("\n"):
-            if '"results"' not in line:
-                continue
-            colon_idx = line.index(":")
-            try:
-                data = json.loads(line[colon_idx + 1 :])
-                return data.get("results")
-            except (json.JSONDecodeError, ValueError):
-                continue
-        return None
+    def _hash_event(event: dict) -> str:
+        return hashlib.sha256(json.dumps(event, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
 
     def parse(self, raw_data: list[dict]) -> list[ParsedFightCard]:
         parsed = []
+        progress = StageProgress(logger, "Parsed boxing fight cards")
         for i, event in enumerate(raw_data):
             try:
                 fight_card = self._parse_event(event=event)
-                if fight_card:
-                    parsed.append(fight_card)
-                    logger.info(f"parsed fight card {i + 1}/{len(raw_data)}: {fight_card.title_fighters}")
             except Exception:
+                progress.count("failed")
                 logger.exception(f"Failed to parse event {event.get('id')}")
+                continue
+            if fight_card:
+                parsed.append(fight_card)
+                progress.count("parsed")
+                progress.item("Parsed fight card", card=i + 1, cards=len(raw_data), title=fight_card.title_fighters)
+            else:
+                # No fights or no main event announced yet
+                progress.count("skipped")
+        progress.finish(events=len(raw_data))
         return parsed
 
     def _parse_event(self, event: dict) -> ParsedFightCard | None:
@@ -171,6 +343,7 @@ class BoxingFightCardScraper(BaseScraper):
         network = networks[0]["name"] if networks else None
 
         return ParsedFightCard(
+            external_id=str(event["id"]),
             fight_date=fight_date_utc,
             title_fighters=title_fighters,
             undercard_fighters=undercard_fighters,
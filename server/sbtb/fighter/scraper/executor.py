@@ -0,0 +1,93 @@
+import asyncio
+import functools
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal, ParamSpec, TypeVar
+
+import structlog
+
+from sbtb.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+ParseExecutorKind = Literal["thread", "process"]
+
+
+@dataclass(frozen=True, slots=True)
+class ParseExecutorStats:
+    kind: ParseExecutorKind
+    max_workers: int
+    # Parse jobs submitted and not yet finished (running + queued)
+    in_flight: int
+    # Jobs waiting for a free worker
+    queue_depth: int
+    completed: int
+
+
+class ParseExecutor:
+    """Runs CPU-bound scraper parsing in a worker pool so it never blocks the event loop.
+
+    ``thread`` keeps everything in-process. lxml releases the GIL while it builds
+    the tree, so most of the parse runs in parallel with the loop. ``process``
+    gives full isolation, but the callable, its arguments and its result must be
+    picklable. The pool is created lazily on first use and recreated after
+    ``shutdown``, the same way ``ScraperHttpClient`` handles its session.
+    """
+
+    def __init__(self, *, kind: ParseExecutorKind, max_workers: int) -> None:
+        self.kind = kind
+        self.max_workers = max_workers
+        self._pool: Executor | None = None
+        self._in_flight = 0
+        self._completed = 0
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scraper-parse")
+            logger.info("Parse executor started", kind=self.kind, max_workers=self.max_workers)
+        return self._pool
+
+    @property
+    def stats(self) -> ParseExecutorStats:
+        return ParseExecutorStats(
+            kind=self.kind,
+            max_workers=self.max_workers,
+            in_flight=self._in_flight,
+            queue_depth=max(0, self._in_flight - self.max_workers),
+            completed=self._completed,
+        )
+
+    async def run(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        queue_depth = self.stats.queue_depth
+        self._in_flight += 1
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            logger.info(
+                "Parse job finished",
+                fn=getattr(fn, "__qualname__", repr(fn)),
+                elapsed_ms=round((time.perf_counter() - start) * 1000, 2),
+                queue_depth_at_submit=queue_depth,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=not wait)
+            self._pool = None
+            logger.info("Parse executor shut down", kind=self.kind)
+
+
+parse_executor = ParseExecutor(kind=settings.SCRAPER_PARSE_EXECUTOR, max_workers=settings.SCRAPER_PARSE_WORKERS)
@@ -0,0 +1,181 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Self
+from urllib.parse import urlsplit
+
+import aiohttp
+import structlog
+
+from sbtb.core.config import settings
+from sbtb.fighter.scraper.policy import RETRYABLE_STATUSES, CircuitOpenError, RequestMetrics, RequestPolicy
+
+logger = structlog.get_logger(__name__)
+
+
+class ScraperHttpClient:
+    """Long-lived aiohttp session shared by every scraper.
+
+    Keeps connections alive between requests (so paginated Server Action POSTs
+    reuse one warm TCP+TLS connection), caps connections per upstream host and
+    caches DNS lookups. Open it once per process — the FastAPI lifespan does this,
+    and CLI runners can use it as an async context manager. If a scraper runs before
+    it has been opened, or on a different event loop (e.g. a fresh ``asyncio.run``),
+    the session is (re)created lazily on first request.
+
+    With a ``RequestPolicy`` every request is rate limited, retried and guarded by
+    a circuit breaker per host (see sbtb.fighter.scraper.policy).
+    """
+
+    def __init__(
+        self,
+        *,
+        limit_per_host: int,
+        dns_cache_ttl: int,
+        keepalive_timeout: float,
+        total_timeout: float,
+        connect_timeout: float,
+        policy: RequestPolicy | None = None,
+    ) -> None:
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self.policy = policy
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def open(self) -> None:
+        if self._session is not None and not self._session.closed and self._loop is asyncio.get_running_loop():
+            return
+        # A session left from another event loop would leak its connector if just replaced
+        try:
+            await self.close()
+        except RuntimeError:
+            logger.warning("Could not close scraper HTTP session from a previous event loop", exc_info=True)
+            self._session = None
+
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        self._loop = asyncio.get_running_loop()
+        logger.info("Scraper HTTP client opened", limit_per_host=self.limit_per_host)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("Scraper HTTP client closed")
+        self._session = None
+        self._loop = None
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, *, metrics: RequestMetrics | None = None, **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a request, retrying throttled and failed attempts under the policy.
+
+        Yields the first response that isn't retryable, or the last one once the
+        retries are used up, so callers still see the final status. Raises
+        CircuitOpenError without sending anything if the host's circuit is open.
+        ``metrics`` collects retry and throttling counts for the caller's run.
+        """
+        await self.open()
+        assert self._session is not None
+        if self.policy is None:
+            async with self._session.request(method, url, **kwargs) as response:
+                yield response
+            return
+
+        metrics = metrics if metrics is not None else RequestMetrics()
+        host = urlsplit(url).netloc
+        bucket, breaker = self.policy.bucket(host), self.policy.breaker(host)
+        attempt = 0
+        while True:
+            try:
+                breaker.before_request()
+            except CircuitOpenError:
+                metrics.circuit_rejections += 1
+                raise CircuitOpenError(f"Circuit open for {host}") from None
+            # Every attempt admitted by the breaker has to settle it, even when it's cut short by
+            # cancellation or an unexpected error, or a half-open trial would block the host for good
+            settled = False
+            try:
+                wait = bucket.reserve()
+                if wait:
+                    metrics.rate_limit_wait_seconds += wait
+                    await asyncio.sleep(wait)
+
+                metrics.requests += 1
+                try:
+                    response = await self._session.request(method, url, **kwargs)
+                except (aiohttp.ClientConnectionError, TimeoutError):
+                    breaker.record_failure()
+                    settled = True
+                    if attempt >= self.policy.max_retries or breaker.is_open:
+                        metrics.failures += 1
+                        raise
+                    delay = self.policy.backoff(attempt)
+                    logger.warning("Scraper request failed, retrying", url=url, attempt=attempt + 1, delay=delay)
+                else:
+                    if response.status not in RETRYABLE_STATUSES:
+                        breaker.record_success()
+                        settled = True
+                        bucket.speed_up()
+                        break
+                    breaker.record_failure()
+                    settled = True
+                    if response.status == 429:
+                        metrics.throttled += 1
+                        bucket.slow_down()
+                    delay = self.policy.retry_delay(response, attempt)
+                    if delay is None or breaker.is_open:
+                        metrics.failures += 1
+                        break
+                    response.release()
+                    logger.warning(
+                        "Scraper request throttled or failed upstream, retrying",
+                        url=url,
+                        status=response.status,
+                        attempt=attempt + 1,
+                        delay=delay,
+                    )
+            finally:
+                if not settled:
+                    breaker.record_failure()
+
+            metrics.retries += 1
+            metrics.backoff_seconds += delay
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        async with response:
+            yield response
+
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+
+scraper_http_client = ScraperHttpClient(
+    limit_per_host=settings.SCRAPER_HTTP_LIMIT_PER_HOST,
+    dns_cache_ttl=settings.SCRAPER_HTTP_DNS_CACHE_TTL_SECONDS,
+    keepalive_timeout=settings.SCRAPER_HTTP_KEEPALIVE_SECONDS,
+    total_timeout=settings.SCRAPER_HTTP_TIMEOUT_SECONDS,
+    connect_timeout=settings.SCRAPER_HTTP_CONNECT_TIMEOUT_SECONDS,
+    policy=RequestPolicy(
+        rate_per_second=settings.SCRAPER_RATE_LIMIT_PER_SECOND,
+        burst=settings.SCRAPER_RATE_LIMIT_BURST,
+        min_rate_per_second=settings.SCRAPER_RATE_LIMIT_MIN_PER_SECOND,
+        max_retries=settings.SCRAPER_MAX_RETRIES,
+        backoff_base_seconds=settings.SCRAPER_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds=settings.SCRAPER_BACKOFF_MAX_SECONDS,
+        failure_threshold=settings.SCRAPER_CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds=settings.SCRAPER_CIRCUIT_RESET_SECONDS,
+    ),
+)
@@ -0,0 +1,187 @@
+"""Request policy for upstream scraping: rate limiting, retries and a circuit breaker.
+
+Everything is tracked per upstream host:
+
+- an adaptive token bucket. It starts at the configured rate, halves on every 429
+  and creeps back up on successes, so runs settle near the highest rate upstream
+  tolerates.
+- bounded retries of 429/5xx responses and connection errors, waiting either what
+  ``Retry-After`` asks for or an exponential backoff with full jitter.
+- a circuit breaker that fails requests fast once a host keeps failing, and lets a
+  single trial request through after a cooldown.
+"""
+
+import datetime
+import email.utils
+import random
+import time
+from dataclasses import dataclass
+
+import aiohttp
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Upstream host failed too often recently; requests are short-circuited until the cooldown ends."""
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    # Attempts actually sent, retries included
+    requests: int = 0
+    retries: int = 0
+    # 429 responses
+    throttled: int = 0
+    # Time spent waiting on the rate limiter, and sleeping between retries
+    rate_limit_wait_seconds: float = 0.0
+    backoff_seconds: float = 0.0
+    # Requests rejected by an open circuit, and requests that gave up after their retries
+    circuit_rejections: int = 0
+    failures: int = 0
+
+
+class TokenBucket:
+    """Token bucket whose refill rate halves on throttling and recovers additively (AIMD)."""
+
+    def __init__(self, *, rate: float, burst: int, min_rate: float) -> None:
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it.
+
+        The balance is allowed to go negative, so concurrent callers queue up behind
+        each other without a lock.
+        """
+        self._refill()
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def slow_down(self) -> None:
+        self._refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+
+    def speed_up(self) -> None:
+        self._refill()
+        self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class CircuitBreaker:
+    def __init__(self, *, failure_threshold: int, reset_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_request(self) -> None:
+        if self._opened_at is None:
+            return
+        if self._trial_in_flight or time.monotonic() - self._opened_at < self.reset_seconds:
+            raise CircuitOpenError
+        # Half-open: let this one request through to probe the host
+        self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+
+class RequestPolicy:
+    def __init__(
+        self,
+        *,
+        rate_per_second: float,
+        burst: int,
+        min_rate_per_second: float,
+        max_retries: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float,
+        failure_threshold: int,
+        reset_seconds: float,
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.min_rate_per_second = min_rate_per_second
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._buckets: dict[str, TokenBucket] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(
+                rate=self.rate_per_second, burst=self.burst, min_rate=self.min_rate_per_second
+            )
+        return self._buckets[host]
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(
+                failure_threshold=self.failure_threshold, reset_seconds=self.reset_seconds
+            )
+        return self._breakers[host]
+
+    def backoff(self, attempt: int) -> float:
+        # Full jitter: uniform over [0, min(cap, base * 2^attempt)]
+        return random.uniform(0, min(self.backoff_max_seconds, self.backoff_base_seconds * 2**attempt))
+
+    def retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> float | None:
+        """How long to wait before retrying ``response``, or None if it shouldn't be retried.
+
+        Upstream's ``Retry-After`` wins over the computed backoff. If it asks for longer
+        than ``backoff_max_seconds`` we give up rather than stall the whole run.
+        """
+        if response.status not in RETRYABLE_STATUSES or attempt >= self.max_retries:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self.backoff(attempt)
+        if retry_after > self.backoff_max_seconds:
+            logger.warning("Retry-After exceeds the backoff cap, giving up", retry_after=retry_after)
+            return None
+        return retry_after
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header, given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.UTC)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.UTC)).total_seconds())
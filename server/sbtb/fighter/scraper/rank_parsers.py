@@ -0,0 +1,306 @@
+"""Interchangeable HTML backends for the boxing rankings page.
+
+Both backends walk the same page structure and share the rank classification
+logic, so they produce identical ``RawBoxerSchema`` output:
+
+- ``bs4`` builds a BeautifulSoup tree (the original implementation).
+- ``lxml`` works on the raw lxml tree with precompiled XPath/ElementPath lookups,
+  skipping BeautifulSoup's tree rebuild and its Python-level ``find`` calls.
+
+The backend is picked per deployment with ``BOXING_RANK_PARSER``.
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from typing import ClassVar
+
+import bs4
+import lxml.html
+import structlog
+from lxml import etree
+
+from sbtb.core.logging import StageProgress
+from sbtb.fighter.schemas import RawBoxerSchema
+from sbtb.models.rank import RankType
+
+logger = structlog.get_logger(__name__)
+
+# weight class -> organization -> ranked fighters
+ParsedRankings = dict[str, dict[str, list[RawBoxerSchema]]]
+
+
+# if str = "175lbs" or "175 lbs", return 175 (int)
+def extract_pounds(pounds_str: str) -> int:
+    return int("".join(c for c in pounds_str if c.isdigit()))
+
+
+def classify_fighter(raw_text: str, link_texts: list[str] | None, idx: int) -> list[RawBoxerSchema]:
+    """Turn one ranking slot into ranked fighters.
+
+    ``raw_text`` is the slot's name span text with whitespace stripped.
+    ``link_texts`` holds the span's link texts, and is only set when the span
+    contains a ``<br>``, which marks two champions sharing one slot.
+    """
+    # Skip vacant positions and unrated slots
+    if raw_text.upper() in ("VACANT", "NOT RATED", ""):
+        return []
+
+    # Dual champions in one slot: <a>Primary</a><br><a>Secondary (interim)</a>
+    if link_texts is not None:
+        if not link_texts:
+            return []
+        primary_name = link_texts[0].lower().split("(")[0].strip()
+        results = [RawBoxerSchema(name=primary_name, rank_type=RankType.champion)]
+        if len(link_texts) > 1:
+            secondary_name = link_texts[1].lower().split("(")[0].strip()
+            if secondary_name:
+                results.append(RawBoxerSchema(name=secondary_name, rank_type=RankType.interim_champion))
+        return results
+
+    # Single fighter — detect rank type from parenthetical designation
+    lower = raw_text.lower()
+    name = lower.split("(")[0].strip()
+
+    if "(champion in recess)" in lower:
+        return [RawBoxerSchema(name=name, rank_type=RankType.champion_in_recess)]
+
+    if "(interim)" in lower:
+        return [RawBoxerSchema(name=name, rank_type=RankType.interim_champion)]
+
+    if idx == 0:
+        return [RawBoxerSchema(name=name, rank_type=RankType.champion)]
+
+    # idx corresponds to actual position (1–15) since VACANT/NOT RATED divs
+    # are still enumerated, preserving correct position numbers
+    return [RawBoxerSchema(name=name, rank_type=RankType.contender, position=idx)]
+
+
+class RankPageParser(ABC):
+    name: ClassVar[str]
+
+    @abstractmethod
+    def parse(self, html: str) -> ParsedRankings: ...
+
+
+class Bs4RankPageParser(RankPageParser):
+    name = "bs4"
+
+    def parse(self, html: str) -> ParsedRankings:
+        parsed_rankings = {}
+        progress = StageProgress(logger, "Parsed boxing rankings")
+        soup = bs4.BeautifulSoup(html, "lxml")
+
+        # Main container holds weight-class headers and rankings divs as direct children.
+        # There are multiple div.relative.flex.flex-col on the page; find the one that
+        # actually contains weight-class h3 headers (class "font-medium").
+        main_container = None
+        for candidate in soup.select("div.relative.flex.flex-col"):
+            if candidate.find("h3", class_="font-medium"):
+                main_container = candidate
+                break
+
+        if main_container is None:
+            # Log all hidden div IDs and the top-level div classes to help diagnose structure changes
+            hidden_ids = [d.get("id") for d in soup.find_all("div", attrs={"hidden": True})]
+            top_divs = (
+                [d.get("class") for d in soup.find("body").find_all("div", recursive=False)][:5]
+                if soup.find("body")
+                else []
+            )
+            logger.error(f"main_container not found. Hidden div IDs: {hidden_ids}. Top-level body divs: {top_divs}")
+            return {}
+        section_divs = main_container.find_all("div", recursive=False)
+
+        i = 0
+        while i < len(section_divs) - 1:
+            division_div = section_divs[i]
+            division_name_h3 = division_div.find("h3", recursive=False)
+            if division_name_h3 is None:
+                i += 1
+                continue
+
+            rankings_div = section_divs[i + 1]
+            division = division_name_h3.text.lower()
+            pounds_span = division_div.find("span")
+            pounds = None
+
+            # if division is heavyweight, pounds is None (200+)
+            if division != "heavyweight" and pounds_span:
+                pounds = extract_pounds(pounds_str=pounds_span.text)
+
+            progress.item("Parsing weight class", division=division, pounds=pounds)
+            parsed_rankings[division] = self.parse_division(rankings_div=rankings_div, progress=progress)
+            progress.count(division, sum(len(boxers) for boxers in parsed_rankings[division].values()))
+            i += 2
+
+        progress.finish(parser=self.name, divisions=len(parsed_rankings))
+        return parsed_rankings
+
+    def parse_division(
+        self, rankings_div: bs4.element.Tag, progress: StageProgress | None = None
+    ) -> dict[str, list[RawBoxerSchema]]:
+        grouped_rankings = {}
+        # rankings_div wraps an inner orgs container (flex-row div with 4 org columns)
+        orgs_container = rankings_div.find("div", recursive=False)
+        organizations = orgs_container.find_all("div", recursive=False)
+        for organization_div in organizations:
+            organization_name = organization_div.find("h5").text.upper()
+            main_rankings_div = organization_div.find("div", recursive=False)
+            fighters = main_rankings_div.find_all("div", recursive=False)
+
+            processed_fighters = []
+            for i, fighter_div in enumerate(fighters):
+                if progress is not None:
+                    progress.item("Parsing fighter", slot=i + 1, slots=len(fighters), organization=organization_name)
+                processed_fighters.extend(self.parse_fighter(fighter_div=fighter_div, idx=i))
+            grouped_rankings[organization_name] = processed_fighters
+
+        return grouped_rankings
+
+    def parse_fighter(self, fighter_div: bs4.element.Tag, idx: int) -> list[RawBoxerSchema]:
+        name_container = fighter_div if idx == 0 else fighter_div.find("div", recursive=False)
+        if name_container is None:
+            return []
+
+        name_span = name_container.find("span")
+        if name_span is None:
+            return []
+
+        link_texts = [a.get_text(strip=True) for a in name_span.find_all("a")] if name_span.find("br") else None
+        return classify_fighter(raw_text=name_span.get_text(strip=True), link_texts=link_texts, idx=idx)
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _stripped_text(element: etree._Element) -> str:
+    # Same as bs4's get_text(strip=True): strip every text node, drop empty ones, join with no separator
+    return "".join(text for text in (t.strip() for t in element.itertext()) if text)
+
+
+_container_candidates = etree.XPath(
+    f"//div[{_has_class('relative')} and {_has_class('flex')} and {_has_class('flex-col')}]"
+)
+_has_weight_class_header = etree.XPath(f"boolean(.//h3[{_has_class('font-medium')}])")
+
+
+def find_rankings_container(root: lxml.html.HtmlElement) -> lxml.html.HtmlElement | None:
+    """The div holding every weight class section of a rankings page, or None if the layout changed.
+
+    See Bs4RankPageParser.parse for the page layout.
+    """
+    return next((c for c in _container_candidates(root) if _has_weight_class_header(c)), None)
+
+
+def rankings_fingerprint(html: str) -> str | None:
+    """Hash of the rankings container's tags and whitespace-normalized text.
+
+    Attributes (Tailwind classes, hrefs, build-specific ids) and everything outside
+    the container are ignored, so a page that was only rebuilt or re-styled upstream
+    hashes the same. Returns None if the container can't be found.
+    """
+    main_container = find_rankings_container(lxml.html.document_fromstring(html))
+    if main_container is None:
+        return None
+
+    digest = hashlib.sha256()
+    for node in main_container.iter():
+        tail = " ".join((node.tail or "").split())
+        if not isinstance(node.tag, str):
+            # Comment or processing instruction: only the text after it is content
+            digest.update(f"{tail}\n".encode())
+            continue
+        text = " ".join((node.text or "").split())
+        digest.update(f"<{node.tag}>{text}</>{tail}\n".encode())
+    return digest.hexdigest()
+
+
+class LxmlRankPageParser(RankPageParser):
+    name = "lxml"
+
+    def parse(self, html: str) -> ParsedRankings:
+        parsed_rankings = {}
+        progress = StageProgress(logger, "Parsed boxing rankings")
+        root = lxml.html.document_fromstring(html)
+        main_container = find_rankings_container(root)
+
+        if main_container is None:
+            hidden_ids = [d.get("id") for d in root.iterfind(".//div[@hidden]")]
+            body = root.find("body")
+            top_divs = (
+                [(d.get("class") or "").split() or None for d in body.iterfind("div")][:5] if body is not None else []
+            )
+            logger.error(f"main_container not found. Hidden div IDs: {hidden_ids}. Top-level body divs: {top_divs}")
+            return {}
+        section_divs = main_container.findall("div")
+
+        i = 0
+        while i < len(section_divs) - 1:
+            division_div = section_divs[i]
+            division_name_h3 = division_div.find("h3")
+            if division_name_h3 is None:
+                i += 1
+                continue
+
+            rankings_div = section_divs[i + 1]
+            division = division_name_h3.text_content().lower()
+            pounds_span = division_div.find(".//span")
+            pounds = None
+
+            # if division is heavyweight, pounds is None (200+)
+            if division != "heavyweight" and pounds_span is not None:
+                pounds = extract_pounds(pounds_str=pounds_span.text_content())
+
+            progress.item("Parsing weight class", division=division, pounds=pounds)
+            parsed_rankings[division] = self.parse_division(rankings_div=rankings_div, progress=progress)
+            progress.count(division, sum(len(boxers) for boxers in parsed_rankings[division].values()))
+            i += 2
+
+        progress.finish(parser=self.name, divisions=len(parsed_rankings))
+        return parsed_rankings
+
+    def parse_division(
+        self, rankings_div: lxml.html.HtmlElement, progress: StageProgress | None = None
+    ) -> dict[str, list[RawBoxerSchema]]:
+        grouped_rankings = {}
+        orgs_container = rankings_div.find("div")
+        for organization_div in orgs_container.iterfind("div"):
+            organization_name = organization_div.find(".//h5").text_content().upper()
+            fighters = organization_div.find("div").findall("div")
+
+            processed_fighters = []
+            for i, fighter_div in enumerate(fighters):
+                if progress is not None:
+                    progress.item("Parsing fighter", slot=i + 1, slots=len(fighters), organization=organization_name)
+                processed_fighters.extend(self.parse_fighter(fighter_div=fighter_div, idx=i))
+            grouped_rankings[organization_name] = processed_fighters
+
+        return grouped_rankings
+
+    def parse_fighter(self, fighter_div: lxml.html.HtmlElement, idx: int) -> list[RawBoxerSchema]:
+        name_container = fighter_div if idx == 0 else fighter_div.find("div")
+        if name_container is None:
+            return []
+
+        name_span = name_container.find(".//span")
+        if name_span is None:
+            return []
+
+        link_texts = (
+            [_stripped_text(a) for a in name_span.iterfind(".//a")] if name_span.find(".//br") is not None else None
+        )
+        return classify_fighter(raw_text=_stripped_text(name_span), link_texts=link_texts, idx=idx)
+
+
+RANK_PAGE_PARSERS: dict[str, type[RankPageParser]] = {
+    Bs4RankPageParser.name: Bs4RankPageParser,
+    LxmlRankPageParser.name: LxmlRankPageParser,
+}
+
+
+def get_rank_page_parser(name: str) -> RankPageParser:
+    try:
+        return RANK_PAGE_PARSERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown rank page parser {name!r}, expected one of {sorted(RANK_PAGE_PARSERS)}") from None
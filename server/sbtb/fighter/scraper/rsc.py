@@ -0,0 +1,60 @@
+"""Readers for React Server Components (RSC) payloads returned by Next.js Server Actions.
+
+An RSC payload is newline-delimited: each row is ``<id>:<json>``. The schedule
+Server Action puts the page of events in the one row holding a ``"results"`` key.
+Every other row is metadata that we skip without decoding it.
+"""
+
+import json
+from collections.abc import AsyncIterable
+
+_RESULTS_MARKER = b'"results"'
+
+
+def _decode_results_row(row: bytes) -> list[dict] | None:
+    if _RESULTS_MARKER not in row:
+        return None
+    colon_idx = row.find(b":")
+    if colon_idx == -1:
+        return None
+    try:
+        data = json.loads(row[colon_idx + 1 :])
+    except ValueError:
+        return None
+    return data.get("results") if isinstance(data, dict) else None
+
+
+def extract_rsc_results(rsc_text: str) -> list[dict] | None:
+    """Parse the results list from an RSC payload that is already fully in memory."""
+    for row in rsc_text.encode().split(b"\n"):
+        results = _decode_results_row(row)
+        if results is not None:
+            return results
+    return None
+
+
+async def read_rsc_results(chunks: AsyncIterable[bytes]) -> list[dict] | None:
+    """Parse the results list from an RSC payload as it streams in.
+
+    Rows are split out of the byte stream by hand, so only the row currently being
+    received is buffered. Only the results row is JSON-decoded. After that row is
+    found, the rest of the stream is still read to the end so the connection can
+    go back to the keep-alive pool.
+    """
+    results: list[dict] | None = None
+    buffer = bytearray()
+    async for chunk in chunks:
+        if results is not None:
+            continue
+        buffer += chunk
+        start = 0
+        while (newline := buffer.find(b"\n", start)) != -1:
+            results = _decode_results_row(bytes(buffer[start:newline]))
+            start = newline + 1
+            if results is not None:
+                break
+        del buffer[:start]
+
+    if results is None and buffer:
+        results = _decode_results_row(bytes(buffer))
+    return results
@@ -0,0 +1,63 @@
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from sbtb.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class ScraperStateStore:
+    """Small JSON key/value store on local disk for state scrapers carry between runs.
+
+    One file per key under ``directory``, written atomically (temp file + rename) so
+    a crashed run never leaves a half-written value behind. Values can carry a TTL;
+    expired or unreadable entries read back as ``None``.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        try:
+            entry = json.loads(self._path(key).read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Unreadable scraper state entry, ignoring", key=key)
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, *, ttl_seconds: float | None = None) -> None:
+        entry = {
+            "value": value,
+            "updated_at": time.time(),
+            "expires_at": time.time() + ttl_seconds if ttl_seconds is not None else None,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+scraper_state_store = ScraperStateStore(directory=settings.SCRAPER_STATE_DIR)
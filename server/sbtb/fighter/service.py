@@ -1,110 +1,186 @@
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
 import structlog
+from sqlalchemy import Row, RowMapping
 
 from sbtb.core.database.session import DbSession
-from sbtb.fighter.repository import (
-    FeaturedFighterRepo,
-    FightCardRepo,
-    FighterRepo,
-    FightOrganizationRepo,
-    RankRepo,
-    WeightClassRepo,
+from sbtb.core.reference_data import reference_data
+from sbtb.core.util import timed
+from sbtb.fighter.repository import FeaturedFighterRepo, FightCardRepo, FighterRepo, RankRepo
+from sbtb.fighter.schemas import (
+    BoutInput,
+    BoutRead,
+    FeaturedFighterRead,
+    FightCardInput,
+    FightCardRead,
+    FightCardSyncResult,
+    FighterRead,
+    ParsedFightCard,
+    RankInput,
+    RankRead,
+    RankSyncResult,
 )
-from sbtb.fighter.schemas import BoutInput, FeaturedFighterRead, ParsedFightCard, RankInput, RankRead
-from sbtb.fighter.scraper import BoxingFightCardScraper, BoxingRankScraper
-from sbtb.models import FightCard, Fighter
+from sbtb.fighter.scraper import BoxingFightCardScraper, BoxingRankScraper, ScrapeResult
+from sbtb.fighter.scraper.rank_parsers import ParsedRankings
+from sbtb.models import Fighter
 from sbtb.models.featured_fighter import FeaturedCollection
+from sbtb.models.fight_organization import CombatSport
 
 logger = structlog.get_logger(__name__)
 
+# (FighterRead field, FightCardRepo.get_read_rows label) pairs for each corner
+_CORNER_FIELDS = {
+    corner: tuple((field, f"{corner}_{field}") for field in FighterRead.model_fields) for corner in ("red", "blue")
+}
+
 
 class BoxerScraperService:
     def __init__(self, scraper: BoxingRankScraper):
         self.scraper = scraper
 
-    async def scrape_and_update_boxing_ranks(self, session: DbSession) -> list[RankRead]:
-        try:
-            grouped_rankings = await self.scraper.run_scraper()
-            if not grouped_rankings:
-                return []
-
-            fighter_repo = FighterRepo.from_session(session)
-            organization_repo = FightOrganizationRepo.from_session(session)
-            weight_class_repo = WeightClassRepo.from_session(session)
-            rank_repo = RankRepo.from_session(session)
-
-            organizations = await organization_repo.get_all(organization_repo.get_base_statement())
-            weight_classes = await weight_class_repo.get_all(weight_class_repo.get_base_statement())
-
-            rank_reads = []
-            ranks_to_upsert = []
-            for raw_weight_class, raw_organizations in grouped_rankings.items():
-                for raw_organization, raw_boxers in raw_organizations.items():
-                    for raw_boxer in raw_boxers:
-                        fighter = await fighter_repo.get_or_create(name=raw_boxer.name)
-                        if fighter is None:
-                            logger.error(f"Failed to save fighter: {raw_boxer.name}")
-                            continue
-
-                        organization = next(
-                            (org for org in organizations if org.name == raw_organization),
-                            None,
-                        )
-                        if organization is None:
-                            logger.error(f"Organization not found: {raw_organization}")
-                            continue
-
-                        weight_class = next((wc for wc in weight_classes if wc.name == raw_weight_class), None)
-                        if weight_class is None:
-                            logger.error(f"Weight class not found: {raw_weight_class}")
-                            continue
-
-                        ranks_to_upsert.append(
-                            RankInput(
-                                rank_type=raw_boxer.rank_type,
-                                position=raw_boxer.position,
-                                fighter_id=fighter.id,
-                                weight_class_id=weight_class.id,
-                                organization_id=organization.id,
-                            )
+    async def fetch(self) -> ScrapeResult[ParsedRankings]:
+        return await self.scraper.run_scraper()
+
+    async def persist(self, session: DbSession, scraped: ScrapeResult[ParsedRankings]) -> RankSyncResult:
+        """Write the rankings returned by ``fetch``: fighters first, then the reconciled ranks.
+
+        Raises on failure; the caller decides what to roll back.
+        """
+        if scraped.unchanged:
+            self.scraper.commit_state_on_commit(session, scraped)
+            return RankSyncResult(is_noop=True)
+        grouped_rankings = scraped.payload
+        if not grouped_rankings:
+            return RankSyncResult()
+
+        fighter_repo = FighterRepo.from_session(session)
+        rank_repo = RankRepo.from_session(session)
+        references = await reference_data.get(session)
+
+        # Resolve every scraped name up front: one INSERT + one SELECT instead of a round trip per boxer
+        fighters_by_name = await fighter_repo.get_or_create_many(
+            names=(
+                raw_boxer.name
+                for raw_organizations in grouped_rankings.values()
+                for raw_boxers in raw_organizations.values()
+                for raw_boxer in raw_boxers
+            )
+        )
+
+        rank_reads = []
+        ranks_to_upsert = []
+        for raw_weight_class, raw_organizations in grouped_rankings.items():
+            weight_class = references.weight_class_by_name(raw_weight_class)
+            if weight_class is None:
+                logger.error(f"Weight class not found: {raw_weight_class}")
+                continue
+
+            for raw_organization, raw_boxers in raw_organizations.items():
+                organization = references.organization_by_name(raw_organization)
+                if organization is None:
+                    logger.error(f"Organization not found: {raw_organization}")
+                    continue
+
+                for raw_boxer in raw_boxers:
+                    fighter = fighters_by_name.get(raw_boxer.name)
+                    if fighter is None:
+                        logger.error(f"Failed to save fighter: {raw_boxer.name}")
+                        continue
+
+                    ranks_to_upsert.append(
+                        RankInput(
+                            rank_type=raw_boxer.rank_type,
+                            position=raw_boxer.position,
+                            fighter_id=fighter.id,
+                            weight_class_id=weight_class.id,
+                            organization_id=organization.id,
                         )
-                        rank_reads.append(
-                            RankRead(
-                                rank_type=raw_boxer.rank_type,
-                                position=raw_boxer.position,
-                                fighter_name=fighter.name,
-                                organization_name=organization.name,
-                                weight_class_name=weight_class.name,
-                            )
+                    )
+                    # Built from already-typed DB values; FastAPI validates the response at the boundary
+                    rank_reads.append(
+                        RankRead.model_construct(
+                            rank_type=raw_boxer.rank_type,
+                            position=raw_boxer.position,
+                            fighter_name=fighter.name,
+                            organization_name=organization.name,
+                            weight_class_name=weight_class.name,
                         )
+                    )
 
-            saved_ranks = await rank_repo.bulk_upsert(ranks=ranks_to_upsert)
-            logger.info(f"Updated {len(saved_ranks)} boxing rankings")
-            return rank_reads
+        delta = await rank_repo.reconcile(ranks=ranks_to_upsert)
+        self.scraper.commit_state_on_commit(session, scraped)
+        logger.info(
+            "Reconciled boxing rankings",
+            inserted=len(delta.inserted),
+            updated=len(delta.updated),
+            deleted=len(delta.deleted),
+        )
+        return RankSyncResult(
+            ranks=rank_reads,
+            ranks_inserted=len(delta.inserted),
+            ranks_updated=len(delta.updated),
+            ranks_deleted=len(delta.deleted),
+        )
 
+    async def scrape_and_update_boxing_ranks(self, session: DbSession) -> RankSyncResult:
+        try:
+            scraped = await self.fetch()
         except Exception:
             logger.exception("ERROR OCCURRED WHILE SCRAPING BOXING RANKINGS")
-            return []
+            return RankSyncResult()
+        try:
+            # A failed persist leaves nothing half-written behind in the caller's transaction
+            async with session.begin_nested():
+                return await self.persist(session=session, scraped=scraped)
+        except Exception:
+            logger.exception("ERROR OCCURRED WHILE SAVING BOXING RANKINGS")
+            return RankSyncResult()
 
 
 class BoxingFightCardService:
-    async def _get_or_create_fighter(self, fighter_repo: FighterRepo, name: str) -> Fighter | None:
-        fighter = await fighter_repo.get_or_create(name=name.lower())
-        if fighter is None:
-            logger.error(f"Failed to save fighter: {name}")
-        return fighter
+    def __init__(self, scraper: BoxingFightCardScraper):
+        self.scraper = scraper
 
-    async def _build_bouts(
-        self,
-        fighter_repo: FighterRepo,
+    @staticmethod
+    def _card_input(parsed_fight_card: ParsedFightCard) -> FightCardInput:
+        title_fighters = parsed_fight_card.title_fighters
+        return FightCardInput(
+            external_id=parsed_fight_card.external_id,
+            event_name=f"{title_fighters[0]} vs {title_fighters[1]}",
+            event_date=parsed_fight_card.fight_date,
+            location=parsed_fight_card.location,
+            network=parsed_fight_card.network,
+        )
+
+    async def _remove_unlisted(
+        self, fight_card_repo: FightCardRepo, scraped: ScrapeResult[Any], timings: dict[str, float]
+    ) -> int:
+        """After a complete full sync, drop upcoming cards upstream no longer lists (cancelled events)."""
+        if not scraped.full_sync or scraped.listed_ids is None:
+            return 0
+        with timed(timings, "cleanup"):
+            return await fight_card_repo.delete_unlisted(source=self.scraper.SOURCE, listed_ids=scraped.listed_ids)
+
+    @staticmethod
+    def _build_bouts(
+        fighters_by_name: dict[str, Fighter],
         title_fighters: list[str],
         undercard_fighters: list[str],
     ) -> list[BoutInput]:
         bouts = []
 
+        def resolve(name: str) -> Fighter | None:
+            fighter = fighters_by_name.get(name.lower())
+            if fighter is None:
+                logger.error(f"Failed to save fighter: {name}")
+            return fighter
+
         # Title bout
         if len(title_fighters) == 2:
-            red_corner = await self._get_or_create_fighter(fighter_repo, title_fighters[0])
-            blue_corner = await self._get_or_create_fighter(fighter_repo, title_fighters[1])
+            red_corner = resolve(title_fighters[0])
+            blue_corner = resolve(title_fighters[1])
             if red_corner and blue_corner:
                 bouts.append(
                     BoutInput(
@@ -118,8 +194,8 @@ class BoxingFightCardService:
         # Undercard bouts — flat list, paired as (red, blue)
         undercard_pairs = list(zip(undercard_fighters[::2], undercard_fighters[1::2]))
         for i, (red_name, blue_name) in enumerate(undercard_pairs):
-            red_corner = await self._get_or_create_fighter(fighter_repo, red_name)
-            blue_corner = await self._get_or_create_fighter(fighter_repo, blue_name)
+            red_corner = resolve(red_name)
+            blue_corner = resolve(blue_name)
             if red_corner and blue_corner:
                 bouts.append(
                     BoutInput(
@@ -132,63 +208,157 @@ class BoxingFightCardService:
 
         return bouts
 
-    async def scrape_and_update_boxing_fight_cards(self, session: DbSession) -> list[FightCard]:
-        try:
-            scraper = BoxingFightCardScraper()
-            fighter_repo = FighterRepo.from_session(session)
-            fight_card_repo = FightCardRepo.from_session(session)
-
-            updated_fight_cards = []
-            parsed_fight_cards: list[ParsedFightCard] | None = await scraper.run_scraper()
-            if not parsed_fight_cards:
-                return []
-
-            for i, parsed_fight_card in enumerate(parsed_fight_cards):
-                logger.info(f"Updating fight card {i + 1}/{len(parsed_fight_cards)}")
-                title_fighters = parsed_fight_card.title_fighters
-                undercard_fighters = parsed_fight_card.undercard_fighters
-
-                fight_card = await fight_card_repo.get_or_create(
-                    event_name=f"{title_fighters[0]} vs {title_fighters[1]}",
-                    event_date=parsed_fight_card.fight_date,
-                    location=parsed_fight_card.location,
-                    network=parsed_fight_card.network,
+    @staticmethod
+    def _fight_card_reads(rows: Sequence[Row[Any]]) -> list[FightCardRead]:
+        """Group ``FightCardRepo.get_read_rows`` into cards with their bouts.
+
+        Values are looked up by column label, and each fighter's read is built once and
+        shared by all of their bouts. Built with ``model_construct`` from already-typed DB
+        values; FastAPI validates the response at the boundary.
+        """
+        cards: dict[UUID, FightCardRead] = {}
+        fighters: dict[UUID, FighterRead] = {}
+
+        def fighter_read(values: RowMapping, corner: str) -> FighterRead:
+            fighter_id = values[f"{corner}_id"]
+            fighter = fighters.get(fighter_id)
+            if fighter is None:
+                fields = {field: values[label] for field, label in _CORNER_FIELDS[corner]}
+                fighter = fighters[fighter_id] = FighterRead.model_construct(**fields)
+            return fighter
+
+        for row in rows:
+            values = row._mapping
+            card = cards.get(values["card_id"])
+            if card is None:
+                card = cards[values["card_id"]] = FightCardRead.model_construct(
+                    id=values["card_id"],
+                    event_name=values["card_event_name"],
+                    location=values["card_location"],
+                    event_date=values["card_event_date"],
+                    bouts=[],
+                )
+            if values["bout_id"] is not None:
+                card.bouts.append(
+                    BoutRead.model_construct(
+                        id=values["bout_id"],
+                        bout_order=values["bout_order"],
+                        is_title_fight=values["bout_is_title_fight"],
+                        red_corner=fighter_read(values, "red"),
+                        blue_corner=fighter_read(values, "blue"),
+                    )
                 )
+        return list(cards.values())
+
+    async def fetch(self) -> ScrapeResult[list[ParsedFightCard]]:
+        return await self.scraper.run_scraper()
+
+    async def persist(
+        self,
+        session: DbSession,
+        scraped: ScrapeResult[list[ParsedFightCard]],
+        timings: dict[str, float] | None = None,
+    ) -> FightCardSyncResult:
+        """Persist the cards returned by ``fetch`` in a fixed number of set-based stages.
+
+        Every fighter name across the whole scrape is resolved up front, every card is
+        upserted on its upstream id in one statement, then all bouts are written in one
+        batch. DB round trips no longer grow with the number of cards. After a full sync,
+        upcoming cards upstream stopped listing are removed. Per-stage wall times are
+        reported in the returned summary. Raises on failure; the caller decides what to
+        roll back.
+        """
+        timings = timings if timings is not None else {}
+        fighter_repo = FighterRepo.from_session(session)
+        fight_card_repo = FightCardRepo.from_session(session)
+
+        parsed_fight_cards = scraped.payload
+        if not parsed_fight_cards:
+            # Nothing new or changed upstream; still advance the incremental sync state once committed
+            cards_removed = await self._remove_unlisted(fight_card_repo, scraped, timings)
+            self.scraper.commit_state_on_commit(session, scraped)
+            return FightCardSyncResult(cards_removed=cards_removed, full_sync=scraped.full_sync, timings_ms=timings)
 
-                bouts = await self._build_bouts(
-                    fighter_repo=fighter_repo,
-                    title_fighters=title_fighters,
-                    undercard_fighters=undercard_fighters,
+        with timed(timings, "fighters"):
+            fighters_by_name = await fighter_repo.get_or_create_many(
+                names=(
+                    name.lower()
+                    for parsed_fight_card in parsed_fight_cards
+                    for name in (*parsed_fight_card.title_fighters, *parsed_fight_card.undercard_fighters)
                 )
+            )
+
+        with timed(timings, "fight_cards"):
+            fight_cards_by_id = await fight_card_repo.upsert_many(
+                source=self.scraper.SOURCE,
+                cards=[self._card_input(parsed_fight_card) for parsed_fight_card in parsed_fight_cards],
+            )
 
-                fight_card = await fight_card_repo.upsert_bouts(
-                    fight_card=fight_card,
-                    bouts=bouts,
+        with timed(timings, "bouts"):
+            bouts_by_card = {
+                fight_cards_by_id[parsed_fight_card.external_id]: self._build_bouts(
+                    fighters_by_name=fighters_by_name,
+                    title_fighters=parsed_fight_card.title_fighters,
+                    undercard_fighters=parsed_fight_card.undercard_fighters,
                 )
-                updated_fight_cards.append(fight_card)
+                for parsed_fight_card in parsed_fight_cards
+            }
+            changed_cards = await fight_card_repo.upsert_bouts_many(bouts_by_card)
 
-            logger.info(f"Updated {len(parsed_fight_cards)} boxing fight cards")
-            return updated_fight_cards
+        # One column-only read for the whole batch so the response carries the freshly written bouts
+        with timed(timings, "reload"):
+            fight_cards = self._fight_card_reads(
+                await fight_card_repo.get_read_rows(ids=[card.id for card in bouts_by_card])
+            )
+
+        cards_removed = await self._remove_unlisted(fight_card_repo, scraped, timings)
+        self.scraper.commit_state_on_commit(session, scraped)
+        logger.info(
+            "Updated boxing fight cards",
+            scraped=len(parsed_fight_cards),
+            changed=len(changed_cards),
+            removed=cards_removed,
+            timings_ms=timings,
+        )
+        return FightCardSyncResult(
+            fight_cards=fight_cards,
+            cards_scraped=len(parsed_fight_cards),
+            cards_changed=len(changed_cards),
+            cards_removed=cards_removed,
+            full_sync=scraped.full_sync,
+            timings_ms=timings,
+        )
 
+    async def scrape_and_update_boxing_fight_cards(self, session: DbSession) -> FightCardSyncResult:
+        timings: dict[str, float] = {}
+        try:
+            with timed(timings, "scrape"):
+                scraped = await self.fetch()
         except Exception:
             logger.exception("ERROR OCCURRED WHILE SCRAPING BOXING FIGHT CARDS")
-            return []
+            return FightCardSyncResult(timings_ms=timings)
+        try:
+            # A failed persist leaves nothing half-written behind in the caller's transaction
+            async with session.begin_nested():
+                return await self.persist(session=session, scraped=scraped, timings=timings)
+        except Exception:
+            logger.exception("ERROR OCCURRED WHILE SAVING BOXING FIGHT CARDS")
+            return FightCardSyncResult(timings_ms=timings)
 
 
 class FeaturedFighterService:
     async def get_by_collection(self, session: DbSession, collection: FeaturedCollection) -> list[FeaturedFighterRead]:
         repo = FeaturedFighterRepo.from_session(session)
-        featured = await repo.get_by_collection(collection=collection)
-        return [
-            FeaturedFighterRead(
-                id=entry.fighter.id,
-                name=entry.fighter.name,
-                avatar_url=entry.fighter.avatar_url,
-            )
-            for entry in featured
-        ]
+        return await repo.get_by_collection(collection=collection, record=FeaturedFighterRead.model_construct)
+
+
+class RankService:
+    async def get_rankings(self, session: DbSession, sport: CombatSport | None = None) -> list[RankRead]:
+        repo = RankRepo.from_session(session)
+        return await repo.get_reads(record=RankRead.model_construct, sport=sport)
 
 
 boxer_scraper_service = BoxerScraperService(scraper=BoxingRankScraper())
-boxing_fight_card_service = BoxingFightCardService()
+boxing_fight_card_service = BoxingFightCardService(scraper=BoxingFightCardScraper())
 featured_fighter_service = FeaturedFighterService()
+rank_service = RankService()
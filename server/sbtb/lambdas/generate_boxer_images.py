@@ -3,17 +3,17 @@ from typing import Any
 
 import structlog
 
-from sbtb.core.database.session import SessionLocal
-from sbtb.fighter.image_generator import fighter_image_generator
+from sbtb.core.database.session import BatchSessionLocal
+from sbtb.fighter.avatar_generators import gemini_fighter_image_generator
 
 logger = structlog.get_logger(__name__)
 
 
 async def _handler() -> dict[str, Any]:
-    async with SessionLocal() as session:
+    async with BatchSessionLocal() as session:
         try:
             logger.info("Starting boxer avatar generation")
-            result = await fighter_image_generator.generate_fighter_avatars(session=session)
+            result = await gemini_fighter_image_generator.generate_fighter_avatars(session=session)
             await session.commit()
             logger.info("Boxer avatar generation complete", updated=len(result.updated), skipped=len(result.skipped))
             return {
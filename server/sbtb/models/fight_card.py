@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, String
+from sqlalchemy import TIMESTAMP, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.schema import UniqueConstraint
 
@@ -11,11 +11,21 @@ from sbtb.models.bout import Bout
 class FightCard(RecordModel):
     __tablename__ = "fight_cards"
 
+    # Upstream that lists the card (e.g. "boxing_schedule") and its event id there. Scraped
+    # cards are upserted on this pair, so a reschedule or opponent swap updates the same row
+    source: Mapped[str | None] = mapped_column(String, nullable=True)
+    external_id: Mapped[str | None] = mapped_column(String, nullable=True)
     event_name: Mapped[str] = mapped_column(String, nullable=False)
     location: Mapped[str | None] = mapped_column(String, nullable=True)
     network: Mapped[str | None] = mapped_column(String, nullable=True)
     event_date: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    # sha256 of the bout list last written by FightCardRepo.upsert_bouts; lets unchanged cards skip the rewrite
+    bouts_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     bouts: Mapped[list["Bout"]] = relationship("Bout", back_populates="fight_card", lazy="selectin")
 
-    __table_args__ = (UniqueConstraint("event_name", "event_date", name="uq_fight_card_event"),)
+    __table_args__ = (
+        UniqueConstraint("source", "external_id", name="uq_fight_card_source_external_id"),
+        # Keyset pagination over cards by date (BaseRepository.paginate_keyset, id as tiebreaker)
+        Index("ix_fight_cards_event_date_id", "event_date", "id"),
+    )
@@ -1,6 +1,5 @@
 from uuid import UUID
 
-from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from sbtb.core.repository.base import BaseRepository
@@ -34,5 +33,5 @@ class UserRepository(BaseRepository[User]):
         if inserted is not None:
             return inserted
 
-        existing = (await self.session.execute(select(User).where(User.id == id))).scalar_one()
+        existing = (await self.session.execute(self.get_by_id_statement(), {"id": id})).scalar_one()
         return existing
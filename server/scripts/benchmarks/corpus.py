@@ -0,0 +1,52 @@
+"""Benchmark corpus: recorded payloads plus synthetic ones at 1x and 10x the live size.
+
+Recorded inputs are the parser test fixture page and, when an archive directory
+is given, the newest rankings and schedule runs in the scrape archive (see
+sbtb.fighter.scraper.archive). The live rankings page has 17 divisions x 4
+organizations x 16 slots, and a schedule sync returns a handful of RSC pages.
+The synthetic sets reproduce that size (1x) and ten times it (10x).
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sbtb.fighter.scraper.archive import ScrapeArchive
+from scripts.benchmarks.payloads import make_page, make_rankings_page
+
+_SERVER_DIR = Path(__file__).parent.parent.parent
+FIXTURE_RANKINGS_PAGE = _SERVER_DIR / "tests" / "fighter" / "scraper" / "data" / "boxing_rankings.html"
+
+LIVE_DIVISIONS = 17
+LIVE_SCHEDULE_PAGES = 4
+
+
+@dataclass(slots=True)
+class Corpus:
+    # name -> rankings page HTML
+    rankings_pages: dict[str, str] = field(default_factory=dict)
+    # name -> the RSC pages of one schedule sync
+    schedule_syncs: dict[str, list[str]] = field(default_factory=dict)
+
+
+def build_corpus(archive_dir: Path | None = None, scales: tuple[int, ...] = (1, 10)) -> Corpus:
+    corpus = Corpus()
+    corpus.rankings_pages["fixture"] = FIXTURE_RANKINGS_PAGE.read_text()
+
+    for scale in scales:
+        corpus.rankings_pages[f"synthetic_{scale}x"] = make_rankings_page(divisions=LIVE_DIVISIONS * scale)
+        corpus.schedule_syncs[f"synthetic_{scale}x"] = [
+            make_page(seed=seed) for seed in range(LIVE_SCHEDULE_PAGES * scale)
+        ]
+
+    if archive_dir is not None:
+        archive = ScrapeArchive(directory=archive_dir)
+        if rankings_runs := archive.runs(scraper="BoxingRankScraper"):
+            pages = rankings_runs[-1].entries_of("rankings_html")
+            if pages:
+                corpus.rankings_pages["recorded"] = archive.get(pages[-1].sha256).decode()
+        if schedule_runs := archive.runs(scraper="BoxingFightCardScraper"):
+            rsc_pages = [archive.get(e.sha256).decode() for e in schedule_runs[-1].entries_of("rsc_page")]
+            if rsc_pages:
+                corpus.schedule_syncs["recorded"] = rsc_pages
+
+    return corpus
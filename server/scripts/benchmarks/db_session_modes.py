@@ -0,0 +1,76 @@
+"""Per-query latency through the transaction pooler engine vs the session-mode batch engine.
+
+``engine`` (POSTGRES_PORT) runs with asyncpg's statement cache off and a fresh
+prepared statement name per query, as the transaction pooler requires, so the
+server parses and plans every query again. ``batch_engine`` (POSTGRES_SESSION_PORT)
+keeps the cache, so a repeated query costs one execute round trip. Each query runs
+in its own session, as it would in a request or a batch job. The statements run
+against whatever rows the configured database holds.
+
+Usage:
+    uv run --directory server/ -m scripts.benchmarks.db_session_modes [--queries N]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import joinedload
+
+from sbtb.core.database.session import batch_engine, engine
+from sbtb.models import FeaturedFighter, Fighter, Rank
+from sbtb.models.featured_fighter import FeaturedCollection
+
+STATEMENTS: dict[str, Select] = {
+    "fighter by id": select(Fighter).where(Fighter.id == uuid.uuid4()),
+    "featured fighters": (
+        select(FeaturedFighter)
+        .options(joinedload(FeaturedFighter.fighter))
+        .where(FeaturedFighter.collection == FeaturedCollection.popular_fighters)
+        .order_by(FeaturedFighter.position.asc().nulls_last(), FeaturedFighter.created_at.asc())
+    ),
+    "ranks with joins": select(Rank).options(
+        joinedload(Rank.fighter), joinedload(Rank.weight_class), joinedload(Rank.organization)
+    ),
+}
+
+
+async def _latencies_us(db_engine: AsyncEngine, statement: Select, queries: int) -> list[float]:
+    timings = []
+    for i in range(queries + 10):
+        start = time.perf_counter()
+        async with AsyncSession(db_engine) as session:
+            (await session.execute(statement)).unique().all()
+        if i >= 10:  # warm-up: pool connections and the first prepare
+            timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+async def main(queries: int) -> None:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    engine.echo = batch_engine.echo = False
+
+    print(f"{'query':<20}{'transaction pooler':>26}{'session pooler + cache':>26}")
+    try:
+        for name, statement in STATEMENTS.items():
+            cells = []
+            for db_engine in (engine, batch_engine):
+                timings = sorted(await _latencies_us(db_engine, statement, queries))
+                p95 = timings[int(len(timings) * 0.95) - 1]
+                cells.append(f"{statistics.median(timings):9.0f} us (p95 {p95:6.0f})")
+            print(f"{name:<20}" + "".join(f"{cell:>26}" for cell in cells))
+    finally:
+        await engine.dispose()
+        await batch_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=500, help="queries per statement and engine")
+    args = parser.parse_args()
+    asyncio.run(main(args.queries))
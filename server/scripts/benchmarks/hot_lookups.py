@@ -0,0 +1,82 @@
+"""Per-call CPU of building the hot repository lookups, before and after prepared().
+
+Every ``session.execute`` needs the statement object and its cache key before it can
+hit SQLAlchemy's compiled cache. The old lookups built a fresh ``select().where()``
+each call, and with it a fresh cache key. ``BaseRepository.prepared`` builds each
+statement once and its cache key is memoized. ``lambda_stmt`` is listed for
+comparison. A full compile, what a compiled-cache miss would cost, is shown as a
+reference. No database is needed.
+
+Usage:
+    uv run --directory server/ -m scripts.benchmarks.hot_lookups [--calls N]
+"""
+
+import argparse
+import timeit
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.dialects import postgresql
+
+from sbtb.fighter.repository import FighterRepo
+from sbtb.models import Fighter, User
+from sbtb.user.repository import UserRepository
+
+Case = Callable[[], Any]
+
+
+def _cases() -> dict[str, dict[str, Case]]:
+    user_id, fighter_id, name = uuid.uuid4(), uuid.uuid4(), "canelo alvarez"
+    # prepared() doesn't touch the session
+    users, fighters = UserRepository(session=None), FighterRepo(session=None)  # type: ignore
+    # Same statement FighterRepo.get_by_name prepares
+    by_name = fighters.prepared("get_by_name", lambda: select(Fighter).where(Fighter.name == bindparam("name")))
+
+    def adhoc(model: Any, column: Any, value: Any) -> Case:
+        return lambda: select(model).where(column == value)._generate_cache_key()
+
+    def lambda_case(model: Any, column: Any, value: Any) -> Case:
+        return lambda: lambda_stmt(lambda: select(model).where(column == value))._generate_cache_key()
+
+    return {
+        "UserRepository.get_by_id": {
+            "select() per call": adhoc(User, User.id, user_id),
+            "lambda_stmt": lambda_case(User, User.id, user_id),
+            "prepared": lambda: users.get_by_id_statement()._generate_cache_key(),
+        },
+        "FighterRepo.get_by_id": {
+            "select() per call": adhoc(Fighter, Fighter.id, fighter_id),
+            "lambda_stmt": lambda_case(Fighter, Fighter.id, fighter_id),
+            "prepared": lambda: fighters.get_by_id_statement()._generate_cache_key(),
+        },
+        "FighterRepo.get_by_name": {
+            "select() per call": adhoc(Fighter, Fighter.name, name),
+            "lambda_stmt": lambda_case(Fighter, Fighter.name, name),
+            "prepared": lambda: by_name._generate_cache_key(),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    dialect = postgresql.asyncpg.dialect()
+    compile_us = (
+        timeit.timeit(lambda: select(User).where(User.id == uuid.uuid4()).compile(dialect=dialect), number=1000)
+        / 1000
+        * 1e6
+    )
+
+    print(f"{'lookup':<28}{'select() per call':>20}{'lambda_stmt':>14}{'prepared':>12}")
+    for lookup, variants in _cases().items():
+        timings = [timeit.timeit(case, number=args.calls) / args.calls * 1e6 for case in variants.values()]
+        print(f"{lookup:<28}" + "".join(f"{us:>{width}.2f} us" for us, width in zip(timings, (17, 11, 9))))
+    print(f"\nFor reference, a compiled-cache miss (full compile) costs {compile_us:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
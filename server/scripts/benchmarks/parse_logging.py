@@ -0,0 +1,79 @@
+"""Measure what per-item logging costs the scraper parsers.
+
+Configures the production logging pipeline (full structlog processor chain,
+including CallsiteParameterAdder, rendered as JSON to /dev/null, with the handler
+at DEBUG so nothing is dropped early). Then it times each parser at several
+``LOG_ITEM_SAMPLE_RATE`` values:
+
+- 1.0 logs every item, which is what the parsers did before StageProgress
+- 0.01 is a sampled debug trail
+- 0.0 leaves only the per-stage summaries
+
+Usage:
+    uv run --directory server/ -m scripts.benchmarks.parse_logging [--rounds N]
+"""
+
+import argparse
+import datetime
+import logging
+import os
+import random
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sbtb.core.config import settings
+from sbtb.core.logging import Production
+from sbtb.fighter.scraper import BoxingFightCardScraper, BoxingRankScraper
+from sbtb.fighter.scraper.rank_parsers import RANK_PAGE_PARSERS
+from scripts.benchmarks.payloads import make_event, make_rankings_page
+
+SAMPLE_RATES = (1.0, 0.01, 0.0)
+
+
+def _median_ms(fn: Callable[[], Any], rounds: int) -> float:
+    fn()
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--events", type=int, default=400, help="schedule events to parse")
+    args = parser.parse_args()
+
+    Production.configure()
+    devnull = open(os.devnull, "w")
+    for handler in logging.getLogger("sbtb").handlers:
+        handler.setLevel(logging.DEBUG)
+        handler.setStream(devnull)
+
+    rankings_html = make_rankings_page()
+    rng = random.Random(0)
+    today = datetime.date.today()
+    events = [
+        make_event(rng, id=i, event_date=today + datetime.timedelta(days=i), bouts=12) for i in range(args.events)
+    ]
+    cases: dict[str, Callable[[], Any]] = {
+        f"BoxingRankScraper.parse[{name}]": lambda p=parser_cls(): BoxingRankScraper(parser=p).parse(rankings_html)
+        for name, parser_cls in RANK_PAGE_PARSERS.items()
+    }
+    cases[f"BoxingFightCardScraper.parse ({args.events} events)"] = lambda: BoxingFightCardScraper().parse(events)
+
+    print(f"{'case':<45}" + "".join(f"{f'rate={rate}':>14}" for rate in SAMPLE_RATES))
+    for name, fn in cases.items():
+        timings = []
+        for rate in SAMPLE_RATES:
+            settings.LOG_ITEM_SAMPLE_RATE = rate
+            timings.append(_median_ms(fn, rounds=args.rounds))
+        print(f"{name:<45}" + "".join(f"{ms:11.2f} ms" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Synthetic scraper payloads shaped like the recorded upstream responses.
+
+Schedule pages mirror what ``get_upcoming_events`` returns upstream: a metadata
+row, a results row with ``page_size`` events (venue, networks and a full
+undercard), and a trailing row. Rankings pages reproduce the live page's nesting
+and Tailwind class noise. Every generator is seeded, so every run benchmarks the
+same bytes.
+"""
+
+import datetime
+import json
+import random
+
+
+def make_event(rng: random.Random, id: int, event_date: datetime.date, bouts: int) -> dict:
+    return {
+        "id": id,
+        "slug": f"event-{id}",
+        "event_date": event_date.isoformat(),
+        "event_time": f"{rng.randint(12, 23):02d}:00:00",
+        "event_timezone": rng.choice(["EST", "PST", "GMT"]),
+        "venue": {
+            "name": f"Arena {rng.randint(1, 500)}",
+            "region_display_name": rng.choice(["Las Vegas, NV", "London, UK", "Riyadh, SA", "Tokyo, JP"]),
+            "capacity": rng.randint(2_000, 80_000),
+        },
+        "networks": [{"name": rng.choice(["DAZN", "ESPN", "Sky Sports", "PPV"]), "url": "https://example.com"}],
+        "fights": [
+            {
+                "id": id * 100 + i,
+                "event_fight_type": "Main Event" if i == 0 else "Undercard",
+                "fighter1_name": f"Fighter {rng.randint(1, 5_000)}",
+                "fighter2_name": f"Fighter {rng.randint(1, 5_000)}",
+                "weight_class": rng.choice(["Heavyweight", "Welterweight", "Bantamweight"]),
+                "scheduled_rounds": rng.choice([4, 6, 8, 10, 12]),
+                "notes": "x" * rng.randint(0, 200),
+            }
+            for i in range(bouts)
+        ],
+    }
+
+
+def make_page(page_size: int = 10, bouts: int = 12, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    start = datetime.date(2026, 1, 1)
+    events = [
+        make_event(rng, id=i, event_date=start + datetime.timedelta(days=i), bouts=bouts) for i in range(page_size)
+    ]
+    return (
+        '0:{"a":"$@1","f":"","b":"'
+        + "b" * 21
+        + '"}\n'
+        + f"1:{json.dumps({'results': events, 'has_more': True})}\n"
+        + '2:{"revalidate":false}\n'
+    )
+
+
+def make_rankings_page(divisions: int = 17, organizations: int = 4, fighters: int = 16, seed: int = 0) -> str:
+    """A rankings page with the same nesting and Tailwind class noise as the live one."""
+    rng = random.Random(seed)
+
+    def slot(idx: int) -> str:
+        roll = rng.random()
+        if roll < 0.05:
+            text = "VACANT"
+        elif roll < 0.1:
+            text = "NOT RATED"
+        elif idx == 0 and roll < 0.2:
+            text = f'<a href="/b/{rng.randint(1, 9999)}">Fighter {rng.randint(1, 9999)}</a><br>' + (
+                f'<a href="/b/{rng.randint(1, 9999)}">Fighter {rng.randint(1, 9999)} (Interim)</a>'
+            )
+        else:
+            link_class = "hover:underline text-sm"
+            text = f'<a class="{link_class}" href="/b/{rng.randint(1, 9999)}">Fighter {rng.randint(1, 9999)}</a>'
+        span = f'<span class="truncate font-semibold">{text}</span>'
+        inner = f'<img class="h-6 w-6 rounded-full" src="/flag.svg" alt="">{span}<span class="text-xs">{idx}</span>'
+        if idx == 0:
+            return f'<div class="flex items-center gap-2 p-2">{inner}</div>'
+        return f'<div class="flex items-center border-b"><div class="flex gap-2 p-1">{inner}</div></div>'
+
+    sections = []
+    for d in range(divisions):
+        sections.append(
+            f'<div class="flex items-baseline gap-2"><h3 class="text-xl font-medium">Division {d}</h3>'
+            f'<span class="text-sm text-gray-500">{100 + d * 7} lbs</span></div>'
+        )
+        columns = "".join(
+            f'<div class="flex-1 min-w-0"><h5 class="uppercase font-bold">org{o}</h5>'
+            f'<div class="flex flex-col">{"".join(slot(i) for i in range(fighters))}</div></div>'
+            for o in range(organizations)
+        )
+        sections.append(f'<div class="mt-2"><div class="flex flex-row gap-4">{columns}</div></div>')
+
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>'
+        '<div class="relative flex flex-col"><nav><a href="/">Home</a></nav></div>'
+        f'<div class="relative flex flex-col gap-6 mx-auto max-w-7xl">{"".join(sections)}</div>'
+        '<footer class="p-4">footer</footer></body></html>'
+    )
@@ -0,0 +1,56 @@
+"""Compare the rankings page parser backends (see sbtb.fighter.scraper.rank_parsers).
+
+Parses each page with every backend, checks they agree, and reports the median
+wall time per page. Pass saved rankings pages with ``--html``. Without them, a
+seeded synthetic page shaped like the live one is used.
+
+Usage:
+    uv run --directory server/ -m scripts.benchmarks.rank_parsing [--html page.html ...]
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from pathlib import Path
+
+import structlog
+
+from sbtb.fighter.scraper.rank_parsers import RANK_PAGE_PARSERS
+from scripts.benchmarks.payloads import make_rankings_page
+
+
+def run(pages: list[str], rounds: int) -> dict[str, float]:
+    parsers = {name: parser_cls() for name, parser_cls in RANK_PAGE_PARSERS.items()}
+    for page in pages:
+        outputs = [parser.parse(html=page) for parser in parsers.values()]
+        assert all(output == outputs[0] for output in outputs), "parser backends disagree"
+
+    results = {}
+    for name, parser in parsers.items():
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for page in pages:
+                parser.parse(html=page)
+            timings.append((time.perf_counter() - start) / len(pages))
+        results[name] = statistics.median(timings) * 1000
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--html", type=Path, nargs="*", default=[], help="saved rankings pages")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    # Per-fighter info logs would dominate the measurement
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    pages = [path.read_text() for path in args.html] or [make_rankings_page()]
+    for name, median_ms in run(pages=pages, rounds=args.rounds).items():
+        print(f"{name:<6} median {median_ms:8.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
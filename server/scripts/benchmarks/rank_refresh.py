@@ -0,0 +1,132 @@
+"""Object count, memory and CPU of the in-memory part of a rankings refresh.
+
+For every ranked boxer on a rankings page, a refresh builds one scraped boxer,
+one RankInput for the DB and one RankRead for the response. This compares the
+pydantic models those used to be (kept below as ``Legacy*``) with the slotted
+dataclasses and ``RankRead.model_construct`` used now. It reports:
+
+- median wall time per refresh and per boxer
+- GC-tracked objects and traced bytes still held by the result
+
+Usage:
+    uv run --directory server/ -m scripts.benchmarks.rank_refresh [--scale N] [--rounds N]
+"""
+
+import argparse
+import gc
+import logging
+import statistics
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+from pydantic import UUID4, BaseModel
+
+from sbtb.core.schemas import BaseSchema
+from sbtb.fighter.schemas import RankInput, RankRead, RawBoxerSchema
+from sbtb.fighter.scraper.rank_parsers import LxmlRankPageParser
+from sbtb.models.rank import RankType
+from scripts.benchmarks.payloads import make_rankings_page
+
+
+class LegacyRawBoxerSchema(BaseModel):
+    name: str
+    rank_type: RankType
+    position: int | None = None
+
+
+class LegacyRankInput(BaseSchema):
+    id: UUID4 | None = None
+    rank_type: RankType
+    position: int | None = None
+    fighter_id: UUID4
+    weight_class_id: UUID4
+    organization_id: UUID4
+
+
+# (name, rank_type, position, weight class, organization) for every ranked boxer
+Slot = tuple[str, RankType, int | None, str, str]
+
+
+def _slots(scale: int) -> list[Slot]:
+    parsed = LxmlRankPageParser().parse(html=make_rankings_page(divisions=17 * scale))
+    return [
+        (boxer.name, boxer.rank_type, boxer.position, weight_class, organization)
+        for weight_class, organizations in parsed.items()
+        for organization, boxers in organizations.items()
+        for boxer in boxers
+    ]
+
+
+def _refresh(slots: list[Slot], ids: dict[str, uuid.UUID], legacy: bool) -> list[Any]:
+    raw_cls = LegacyRawBoxerSchema if legacy else RawBoxerSchema
+    input_cls = LegacyRankInput if legacy else RankInput
+    make_read = RankRead if legacy else RankRead.model_construct
+    built = []
+    for name, rank_type, position, weight_class, organization in slots:
+        raw = raw_cls(name=name, rank_type=rank_type, position=position)
+        built.append(raw)
+        built.append(
+            input_cls(
+                rank_type=raw.rank_type,
+                position=raw.position,
+                fighter_id=ids[name],
+                weight_class_id=ids[weight_class],
+                organization_id=ids[organization],
+            )
+        )
+        built.append(
+            make_read(
+                rank_type=raw.rank_type,
+                position=raw.position,
+                fighter_name=name,
+                organization_name=organization,
+                weight_class_name=weight_class,
+            )
+        )
+    return built
+
+
+def _retained(build: Callable[[], list[Any]]) -> tuple[int, float]:
+    gc.collect()
+    objects_before = len(gc.get_objects())
+    tracemalloc.start()
+    result = build()
+    retained_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects = len(gc.get_objects()) - objects_before
+    del result
+    return objects, retained_bytes / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1, help="multiple of the live page's division count")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    slots = _slots(args.scale)
+    ids = {key: uuid.uuid4() for slot in slots for key in (slot[0], slot[3], slot[4])}
+    print(f"{len(slots)} ranked boxers per refresh")
+
+    for label, legacy in (("pydantic (before)", True), ("dataclasses (after)", False)):
+        timings = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            _refresh(slots, ids, legacy=legacy)
+            timings.append(time.perf_counter() - start)
+        median_ms = statistics.median(timings) * 1000
+        objects, retained_kib = _retained(lambda legacy=legacy: _refresh(slots, ids, legacy=legacy))
+        print(
+            f"{label:<22} {median_ms:8.2f} ms/refresh {median_ms * 1000 / len(slots):7.2f} us/boxer"
+            f" {objects:8d} objects {retained_kib:9.0f} KiB retained"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Time and memory of reading rankings and fight cards through the ORM vs the Core read path.
+
+Seeds a scratch database with ``--rows`` ranks and as many bouts (``--rows / 10`` cards of
+ten bouts each), then builds the response schemas both ways:
+
+- ORM (before): load entities with their relationships (``joinedload`` for a rank's
+  fighter, weight class and organization; ``FightCard.bouts`` via ``selectin`` with
+  joined corners) into the identity map, then validate the schemas from them
+- Core (after): ``RankRepo.get_reads`` and ``FightCardRepo.get_read_rows``, which select
+  only the response columns as plain rows and ``model_construct`` the schemas
+
+Reports the median wall time over ``--rounds`` and the peak traced allocations of one
+read, both per 10k rows. Needs a PostgreSQL server (the configured one); the scratch
+database is dropped afterwards.
+
+Usage:
+    uv run --directory server/ -m scripts.benchmarks.read_path [--rows N] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from pydantic_core import Url
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import joinedload
+from sqlalchemy_utils import create_database, database_exists, drop_database
+
+from sbtb.core.config import settings
+from sbtb.core.database.base import BaseModel
+from sbtb.fighter.repository import FightCardRepo, RankRepo
+from sbtb.fighter.schemas import FightCardRead, RankRead
+from sbtb.fighter.service import BoxingFightCardService
+from sbtb.models import Bout, FightCard, Fighter, FightOrganization, Rank, WeightClass
+from sbtb.models.fight_organization import CombatSport
+from sbtb.models.rank import RankType
+
+Read = Callable[[AsyncSession], Awaitable[list[Any]]]
+
+
+def _database_url(driver: str) -> str:
+    return str(
+        Url.build(
+            scheme=f"postgresql+{driver}",
+            username=settings.POSTGRES_USER,
+            password=settings.POSTGRES_PASSWORD,
+            host=settings.POSTGRES_HOST,
+            port=int(settings.POSTGRES_SESSION_PORT),
+            path="sbtb_read_path_bench",
+        )
+    )
+
+
+async def _seed(engine: AsyncEngine, rows: int) -> list[uuid.UUID]:
+    """``rows`` ranks over 25 weight classes x 10 positions, and ``rows / 10`` cards of 10 bouts."""
+    organizations = [
+        {"id": uuid.uuid4(), "name": f"ORG {i}", "sport": CombatSport.boxing} for i in range(-(-rows // 250))
+    ]
+    weight_classes = [
+        {"id": uuid.uuid4(), "name": f"weight class {i}", "pounds": 100 + 5 * i, "sport": CombatSport.boxing}
+        for i in range(25)
+    ]
+    fighters = [{"id": uuid.uuid4(), "name": f"fighter {i}", "wins": i % 40} for i in range(rows)]
+    ranks = [
+        {
+            "fighter_id": fighter["id"],
+            "weight_class_id": weight_classes[i % 25]["id"],
+            "organization_id": organizations[i // 250]["id"],
+            "rank_type": RankType.contender,
+            "position": (i // 25) % 10 + 1,
+        }
+        for i, fighter in enumerate(fighters)
+    ]
+    now = datetime.now(UTC)
+    cards = [
+        {"id": uuid.uuid4(), "event_name": f"Card {i}", "event_date": now + timedelta(days=i), "location": "Las Vegas"}
+        for i in range(rows // 10)
+    ]
+    bouts = [
+        {
+            "fight_card_id": card["id"],
+            "red_corner_id": fighters[(i * 10 + order) % rows]["id"],
+            "blue_corner_id": fighters[(i * 10 + order + 1) % rows]["id"],
+            "bout_order": order + 1,
+            "is_title_fight": order == 0,
+        }
+        for i, card in enumerate(cards)
+        for order in range(10)
+    ]
+    async with engine.begin() as connection:
+        await connection.run_sync(BaseModel.metadata.create_all)
+        for model, values in (
+            (FightOrganization, organizations),
+            (WeightClass, weight_classes),
+            (Fighter, fighters),
+            (Rank, ranks),
+            (FightCard, cards),
+            (Bout, bouts),
+        ):
+            await connection.execute(insert(model), values)
+    return [card["id"] for card in cards]
+
+
+def _cases(card_ids: list[uuid.UUID]) -> dict[str, tuple[Read, Read]]:
+    async def ranks_orm(session: AsyncSession) -> list[RankRead]:
+        statement = select(Rank).options(
+            joinedload(Rank.fighter), joinedload(Rank.weight_class), joinedload(Rank.organization)
+        )
+        return [
+            RankRead(
+                rank_type=rank.rank_type,
+                position=rank.position,
+                fighter_name=rank.fighter.name,
+                weight_class_name=rank.weight_class.name,
+                organization_name=rank.organization.name,
+            )
+            for rank in (await session.execute(statement)).scalars().unique()
+        ]
+
+    async def ranks_core(session: AsyncSession) -> list[RankRead]:
+        return await RankRepo.from_session(session).get_reads(record=RankRead.model_construct)
+
+    async def cards_orm(session: AsyncSession) -> list[FightCardRead]:
+        statement = select(FightCard).where(FightCard.id.in_(card_ids)).order_by(FightCard.event_date)
+        return [FightCardRead.model_validate(card) for card in (await session.execute(statement)).scalars()]
+
+    async def cards_core(session: AsyncSession) -> list[FightCardRead]:
+        rows = await FightCardRepo.from_session(session).get_read_rows(ids=card_ids)
+        return BoxingFightCardService._fight_card_reads(rows)
+
+    return {"rankings": (ranks_orm, ranks_core), "fight cards + bouts": (cards_orm, cards_core)}
+
+
+async def _measure(engine: AsyncEngine, read: Read, rounds: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(rounds):
+        async with AsyncSession(engine) as session:
+            start = time.perf_counter()
+            await read(session)
+            timings.append(time.perf_counter() - start)
+    async with AsyncSession(engine) as session:
+        tracemalloc.start()
+        await read(session)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return statistics.median(timings) * 1000, peak / 1024 / 1024
+
+
+async def main(rows: int, rounds: int) -> None:
+    sync_url = _database_url("psycopg2")
+    if database_exists(sync_url):
+        drop_database(sync_url)
+    create_database(sync_url)
+    engine = create_async_engine(_database_url("asyncpg"))
+    try:
+        card_ids = await _seed(engine, rows)
+        per_10k = 10_000 / rows
+        print(f"{rows} ranks, {len(card_ids)} cards with {len(card_ids) * 10} bouts; figures per 10k rows")
+        print(f"{'read':<22}{'ORM (before)':>26}{'Core (after)':>26}")
+        for name, reads in _cases(card_ids).items():
+            cells = []
+            for read in reads:
+                ms, peak_mib = await _measure(engine, read, rounds)
+                cells.append(f"{ms * per_10k:8.1f} ms {peak_mib * per_10k:6.1f} MiB")
+            print(f"{name:<22}" + "".join(f"{cell:>26}" for cell in cells))
+    finally:
+        await engine.dispose()
+        drop_database(sync_url)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    asyncio.run(main(args.rows, args.rounds))
@@ -0,0 +1,76 @@
+"""Compare buffered vs streaming parsing of schedule Server Action payloads.
+
+Buffered is the old path: ``await res.text()`` followed by ``extract_rsc_results``.
+Streaming is what the scraper does now: ``read_rsc_results`` over the response
+chunks. Reports the median wall time and the peak traced memory for each.
+
+Usage:
+    uv run --directory server/ -m scripts.benchmarks.rsc_parsing [--pages N] [--bouts N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from sbtb.fighter.scraper.rsc import extract_rsc_results, read_rsc_results
+from scripts.benchmarks.payloads import make_page
+
+CHUNK_SIZE = 16 * 1024
+
+
+async def _chunks(payload: bytes) -> AsyncIterator[bytes]:
+    for i in range(0, len(payload), CHUNK_SIZE):
+        yield payload[i : i + CHUNK_SIZE]
+
+
+async def buffered(payload: bytes) -> list[dict] | None:
+    body = b"".join([chunk async for chunk in _chunks(payload)])
+    return extract_rsc_results(body.decode())
+
+
+async def streaming(payload: bytes) -> list[dict] | None:
+    return await read_rsc_results(_chunks(payload))
+
+
+async def measure(parser: Callable[[bytes], Awaitable[list[dict] | None]], payloads: list[bytes], rounds: int) -> dict:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for payload in payloads:
+            await parser(payload)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    for payload in payloads:
+        await parser(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"median_ms": statistics.median(timings) * 1000, "peak_kib": peak / 1024}
+
+
+async def run(pages: int, bouts: int, rounds: int) -> dict[str, dict]:
+    payloads = [make_page(bouts=bouts, seed=seed).encode() for seed in range(pages)]
+    assert await buffered(payloads[0]) == await streaming(payloads[0])
+    return {
+        "buffered": await measure(buffered, payloads, rounds),
+        "streaming": await measure(streaming, payloads, rounds),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--bouts", type=int, default=12)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(pages=args.pages, bouts=args.bouts, rounds=args.rounds))
+    for name, result in results.items():
+        print(f"{name:<10} median {result['median_ms']:8.2f} ms   peak {result['peak_kib']:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
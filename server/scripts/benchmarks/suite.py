@@ -0,0 +1,282 @@
+"""Offline benchmark suite for the scraper parsers, with regression thresholds.
+
+Runs every parser stage over the benchmark corpus (see scripts.benchmarks.corpus)
+and reports two numbers per case:
+
+- median wall time over ``--rounds``
+- peak traced Python allocations during one run of that case alone
+
+Schedule pages go through ``read_rsc_results`` in the chunk size the scraper
+streams them with, as in production.
+
+``--check`` compares the results with the committed baseline and exits 1 when a
+case is slower than ``--time-tolerance`` (and by more than ``--min-delta-ms``) or
+allocates more than ``--memory-tolerance`` (and more than ``--min-delta-kib``) over it.
+
+The baseline records the Python version and machine it was measured on. Allocation
+peaks vary far less between machines than wall times do, but they shift between
+interpreter (and library) versions, so ``--check`` refuses a baseline from another
+Python minor version. A timed check also needs the baseline's machine.
+CI runs ``--check --memory-only`` on Python 3.12, and the committed baseline is
+recorded on 3.12 to match. Regenerate it with ``--update-baseline`` under that
+interpreter.
+
+Usage:
+    uv run --directory server/ -m scripts.benchmarks.suite [--check [--memory-only]] [--update-baseline] [--archive DIR]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import bs4
+import lxml.html
+import structlog
+
+from sbtb.fighter.scraper import BoxingFightCardScraper, BoxingRankScraper
+from sbtb.fighter.scraper.rank_parsers import (
+    RANK_PAGE_PARSERS,
+    Bs4RankPageParser,
+    LxmlRankPageParser,
+    RankPageParser,
+    find_rankings_container,
+)
+from sbtb.fighter.scraper.rsc import read_rsc_results
+from scripts.benchmarks.corpus import Corpus, build_corpus
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    name: str
+    run: Callable[[], Any]
+
+
+@dataclass(slots=True)
+class CaseResult:
+    median_ms: float
+    alloc_peak_kib: float
+
+
+def measure(case: Case, rounds: int) -> CaseResult:
+    case.run()  # warm-up: imports, XPath compilation, caches
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        case.run()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    case.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return CaseResult(
+        median_ms=round(statistics.median(timings) * 1000, 3),
+        alloc_peak_kib=round(peak / 1024, 1),
+    )
+
+
+def _cpu_model() -> str:
+    try:
+        for line in Path("/proc/cpuinfo").read_text().splitlines():
+            if line.startswith("model name"):
+                return line.partition(":")[2].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def environment() -> dict[str, str]:
+    """What a baseline's numbers depend on, recorded with it and compared by ``--check``."""
+    return {
+        "python": f"{platform.python_implementation()} {sys.version_info.major}.{sys.version_info.minor}",
+        "machine": f"{platform.machine()} {_cpu_model()}".strip(),
+    }
+
+
+def _bs4_division_divs(html: str) -> Iterator[bs4.element.Tag]:
+    soup = bs4.BeautifulSoup(html, "lxml")
+    container = next(c for c in soup.select("div.relative.flex.flex-col") if c.find("h3", class_="font-medium"))
+    sections = container.find_all("div", recursive=False)
+    for header, rankings in zip(sections, sections[1:]):
+        if header.find("h3", recursive=False) is not None:
+            yield rankings
+
+
+def _lxml_division_divs(html: str) -> Iterator[lxml.html.HtmlElement]:
+    sections = find_rankings_container(lxml.html.document_fromstring(html)).findall("div")
+    for header, rankings in zip(sections, sections[1:]):
+        if header.find("h3") is not None:
+            yield rankings
+
+
+def _fighter_divs(division_divs: list[Any], is_bs4: bool) -> list[tuple[Any, int]]:
+    fighters = []
+    for division in division_divs:
+        orgs = division.find("div", recursive=False) if is_bs4 else division.find("div")
+        for org in orgs.find_all("div", recursive=False) if is_bs4 else orgs.findall("div"):
+            column = org.find("div", recursive=False) if is_bs4 else org.find("div")
+            slots = column.find_all("div", recursive=False) if is_bs4 else column.findall("div")
+            fighters.extend((slot, idx) for idx, slot in enumerate(slots))
+    return fighters
+
+
+async def _stream(page: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(page), chunk_size):
+        yield page[start : start + chunk_size]
+
+
+def _read_rsc_pages(loop: asyncio.AbstractEventLoop, pages: list[bytes]) -> list[list[dict] | None]:
+    chunk_size = BoxingFightCardScraper.STREAM_CHUNK_SIZE
+    return [loop.run_until_complete(read_rsc_results(_stream(page, chunk_size))) for page in pages]
+
+
+def build_cases(corpus: Corpus) -> list[Case]:
+    cases = []
+
+    for page_name, html in corpus.rankings_pages.items():
+        for backend, parser_cls in RANK_PAGE_PARSERS.items():
+            scraper = BoxingRankScraper(parser=parser_cls())
+            cases.append(Case(f"BoxingRankScraper.parse[{backend}]/{page_name}", lambda s=scraper, h=html: s.parse(h)))
+
+        backends: list[tuple[str, RankPageParser, list[Any], bool]] = [
+            ("bs4", Bs4RankPageParser(), list(_bs4_division_divs(html)), True),
+            ("lxml", LxmlRankPageParser(), list(_lxml_division_divs(html)), False),
+        ]
+        for backend, parser, divisions, is_bs4 in backends:
+            fighters = _fighter_divs(divisions, is_bs4=is_bs4)
+            cases.append(
+                Case(
+                    f"parse_division[{backend}]/{page_name}",
+                    lambda p=parser, d=divisions: [p.parse_division(rankings_div=div) for div in d],
+                )
+            )
+            cases.append(
+                Case(
+                    f"parse_fighter[{backend}]/{page_name}",
+                    lambda p=parser, f=fighters: [p.parse_fighter(fighter_div=div, idx=idx) for div, idx in f],
+                )
+            )
+
+    schedule_scraper = BoxingFightCardScraper()
+    # One loop for every run, so the cases time the reader rather than event loop setup
+    loop = asyncio.new_event_loop()
+    for sync_name, rsc_pages in corpus.schedule_syncs.items():
+        raw_pages = [page.encode() for page in rsc_pages]
+        events = [event for results in _read_rsc_pages(loop, raw_pages) for event in results or []]
+        cases.append(Case(f"read_rsc_results/{sync_name}", lambda pages=raw_pages: _read_rsc_pages(loop, pages)))
+        cases.append(Case(f"BoxingFightCardScraper.parse/{sync_name}", lambda e=events: schedule_scraper.parse(e)))
+
+    return cases
+
+
+def find_regressions(
+    results: dict[str, CaseResult],
+    baseline: dict[str, dict[str, float]],
+    time_tolerance: float,
+    memory_tolerance: float,
+    min_delta_ms: float,
+    min_delta_kib: float,
+    memory_only: bool = False,
+) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        slower_by = result.median_ms - expected["median_ms"]
+        too_slow = result.median_ms > expected["median_ms"] * (1 + time_tolerance)
+        # Sub-millisecond cases jitter by more than any sensible percentage, hence the absolute floor
+        if not memory_only and slower_by > min_delta_ms and too_slow:
+            regressions.append(f"{name}: {result.median_ms:.2f} ms vs baseline {expected['median_ms']:.2f} ms")
+        # Likewise for allocations: a few KiB of interpreter noise is a large share of the smallest cases
+        grew_by = result.alloc_peak_kib - expected["alloc_peak_kib"]
+        if grew_by > min_delta_kib and result.alloc_peak_kib > expected["alloc_peak_kib"] * (1 + memory_tolerance):
+            regressions.append(
+                f"{name}: {result.alloc_peak_kib:.0f} KiB allocated vs baseline {expected['alloc_peak_kib']:.0f} KiB"
+            )
+    return regressions
+
+
+def check_environment(baseline: dict[str, Any], current: dict[str, str], memory_only: bool) -> None:
+    """Exit with an explanation when the baseline wasn't measured somewhere comparable to here."""
+    if baseline.get("python") != current["python"]:
+        sys.exit(
+            f"The baseline was recorded on {baseline.get('python')}, this is {current['python']}: allocation peaks "
+            "differ between interpreter versions. Regenerate it with --update-baseline on the interpreter CI uses."
+        )
+    if not memory_only and baseline.get("machine") != current["machine"]:
+        sys.exit(
+            f"The baseline was timed on {baseline.get('machine')!r}, this is {current['machine']!r}. "
+            "Pass --memory-only, or regenerate it with --update-baseline on this machine."
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--archive", type=Path, help="scrape archive to take recorded payloads from")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--check", action="store_true", help="exit 1 on a regression past the tolerances")
+    parser.add_argument(
+        "--memory-only", action="store_true", help="only check allocations, for machines the baseline wasn't timed on"
+    )
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--time-tolerance", type=float, default=0.5)
+    parser.add_argument("--memory-tolerance", type=float, default=0.1)
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="ignore slowdowns smaller than this")
+    parser.add_argument("--min-delta-kib", type=float, default=8.0, help="ignore allocation growth smaller than this")
+    args = parser.parse_args()
+
+    if args.check:
+        baseline = json.loads(args.baseline.read_text())
+        check_environment(baseline, environment(), memory_only=args.memory_only)
+
+    # Per-fighter info logs would dominate the measurement
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    results = {}
+    for case in build_cases(build_corpus(archive_dir=args.archive)):
+        if args.filter not in case.name:
+            continue
+        results[case.name] = result = measure(case, rounds=args.rounds)
+        print(f"{case.name:<55} {result.median_ms:9.2f} ms {result.alloc_peak_kib:10.0f} KiB")
+
+    if args.update_baseline:
+        recorded = {**environment(), "cases": {name: asdict(result) for name, result in sorted(results.items())}}
+        args.baseline.write_text(json.dumps(recorded, indent=2) + "\n")
+        print(f"Wrote baseline for {len(results)} cases to {args.baseline}")
+
+    if args.check:
+        regressions = find_regressions(
+            results,
+            baseline["cases"],
+            time_tolerance=args.time_tolerance,
+            memory_tolerance=args.memory_tolerance,
+            min_delta_ms=args.min_delta_ms,
+            min_delta_kib=args.min_delta_kib,
+            memory_only=args.memory_only,
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions across {len(results)} cases")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Replay archived scrape runs through the scrapers and services, without network access.
+
+Every run recorded in the scrape archive (see sbtb.fighter.scraper.archive) is
+parsed again with the current scraper code. Unless ``--parse-only`` is passed,
+each run is then ingested through its service in its own transaction, oldest
+first. Prints per-run timings, so replaying a fixed set of runs doubles as a
+deterministic ingest benchmark.
+
+Usage:
+    uv run --directory server/ -m scripts.replay_scrapes rankings|schedule [--since 2026-01-01] [--parse-only]
+"""
+
+import argparse
+import asyncio
+import time
+
+from sbtb.core.database.session import BatchSessionLocal
+from sbtb.fighter.scraper import BoxingFightCardScraper, BoxingRankScraper, parse_executor
+from sbtb.fighter.scraper.archive import RunManifest
+from sbtb.fighter.service import BoxerScraperService, BoxingFightCardService
+
+SCRAPERS = {"rankings": BoxingRankScraper, "schedule": BoxingFightCardScraper}
+
+
+async def replay_run(scraper_name: str, manifest: RunManifest, parse_only: bool) -> str:
+    if scraper_name == "rankings":
+        service = BoxerScraperService(scraper=BoxingRankScraper())
+    else:
+        service = BoxingFightCardService(scraper=BoxingFightCardScraper())
+
+    with service.scraper.replaying(manifest):
+        if parse_only:
+            scraped = await service.scraper.run_scraper()
+            return f"parsed {len(scraped.payload or [])} items"
+
+        async with BatchSessionLocal() as session:
+            if isinstance(service, BoxerScraperService):
+                rank_result = await service.scrape_and_update_boxing_ranks(session=session)
+                summary = f"{len(rank_result.ranks)} ranks, +{rank_result.ranks_inserted}/~{rank_result.ranks_updated}"
+            else:
+                card_result = await service.scrape_and_update_boxing_fight_cards(session=session)
+                summary = f"{card_result.cards_scraped} cards, {card_result.cards_changed} changed"
+            await session.commit()
+            return summary
+
+
+async def main(scraper_name: str, since: str | None, parse_only: bool) -> None:
+    archive = SCRAPERS[scraper_name]().archive
+    if archive is None:
+        raise SystemExit("The scrape archive is disabled (SCRAPE_ARCHIVE_ENABLED=false)")
+
+    manifests = [
+        m for m in archive.runs(scraper=SCRAPERS[scraper_name].__name__) if since is None or m.started_at >= since
+    ]
+    total_start = time.perf_counter()
+    try:
+        for manifest in manifests:
+            start = time.perf_counter()
+            summary = await replay_run(scraper_name, manifest, parse_only=parse_only)
+            print(f"{manifest.run_id}: {summary} in {(time.perf_counter() - start) * 1000:.1f} ms")
+    finally:
+        parse_executor.shutdown()
+    print(f"Replayed {len(manifests)} runs in {time.perf_counter() - total_start:.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scraper", choices=sorted(SCRAPERS))
+    parser.add_argument("--since", help="only runs started at or after this ISO date")
+    parser.add_argument("--parse-only", action="store_true", help="parse without writing to the database")
+    args = parser.parse_args()
+    asyncio.run(main(args.scraper, since=args.since, parse_only=args.parse_only))
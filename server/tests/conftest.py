@@ -3,3 +3,4 @@ import os
 os.environ["SBTB_ENV"] = "testing"
 
 from tests.fixtures import *  # noqa
+from tests.fixtures.scraper import *  # noqa
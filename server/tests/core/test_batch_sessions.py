@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sbtb.core.database.session import BatchSessionLocal, SessionLocal, batch_engine, engine
+from sbtb.fighter.schemas import AvatarGenerationResult
+from sbtb.lambdas import generate_boxer_images
+from scripts import replay_scrapes
+
+
+class TestBatchSessions:
+    def test_batch_session_maker_binds_to_batch_engine(self):
+        assert BatchSessionLocal.kw["bind"] is batch_engine
+        assert SessionLocal.kw["bind"] is engine
+
+    def test_replay_script_uses_batch_sessions(self):
+        assert replay_scrapes.BatchSessionLocal is BatchSessionLocal
+
+    @pytest.mark.asyncio
+    async def test_avatar_lambda_uses_batch_engine(self, monkeypatch):
+        sessions: list[AsyncSession] = []
+
+        async def generate_fighter_avatars(session: AsyncSession) -> AvatarGenerationResult:
+            sessions.append(session)
+            return AvatarGenerationResult(updated=[], skipped=[])
+
+        monkeypatch.setattr(
+            generate_boxer_images.gemini_fighter_image_generator,
+            "generate_fighter_avatars",
+            generate_fighter_avatars,
+        )
+
+        response = await generate_boxer_images._handler()
+
+        assert response["statusCode"] == 200
+        assert len(sessions) == 1
+        assert sessions[0].bind is batch_engine
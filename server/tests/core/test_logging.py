@@ -0,0 +1,40 @@
+import structlog
+from structlog.testing import capture_logs
+
+from sbtb.core.logging import StageProgress
+from sbtb.fighter.scraper.rank_parsers import Bs4RankPageParser
+from tests.fixtures.scraper import RANKINGS_HTML
+
+logger = structlog.get_logger(__name__)
+
+
+class TestStageProgress:
+    def test_emits_one_summary_with_counts(self) -> None:
+        with capture_logs() as logs:
+            progress = StageProgress(logger, "Parsed things", sample_rate=0.0)
+            for group in ("a", "a", "b"):
+                progress.count(group)
+                progress.item("Parsed thing", group=group)
+            progress.finish(source="test")
+
+        assert len(logs) == 1
+        assert logs[0]["event"] == "Parsed things"
+        assert logs[0]["log_level"] == "info"
+        assert logs[0]["counts"] == {"a": 2, "b": 1}
+        assert logs[0]["total"] == 3
+        assert logs[0]["source"] == "test"
+
+    def test_samples_item_events_at_debug(self) -> None:
+        with capture_logs() as logs:
+            progress = StageProgress(logger, "Parsed things", sample_rate=1.0)
+            progress.item("Parsed thing", idx=1)
+
+        assert logs == [{"event": "Parsed thing", "idx": 1, "sampled": True, "log_level": "debug"}]
+
+    def test_rankings_parse_logs_a_single_summary(self) -> None:
+        with capture_logs() as logs:
+            parsed = Bs4RankPageParser().parse(html=RANKINGS_HTML)
+
+        assert [log["event"] for log in logs] == ["Parsed boxing rankings"]
+        assert logs[0]["divisions"] == len(parsed)
+        assert set(logs[0]["counts"]) == set(parsed)
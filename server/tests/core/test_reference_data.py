@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sbtb.core.reference_data import ReferenceDataRegistry
+from sbtb.models.fight_organization import CombatSport
+from tests.factories import create_test_fight_organization, create_test_weight_class
+from tests.fixtures.database import SaveFixture
+
+
+@pytest.mark.asyncio
+class TestReferenceDataRegistry:
+    async def test_lookups_by_name_and_id(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        wbc = await create_test_fight_organization(save_fixture, name="WBC")
+        boxing_lightweight = await create_test_weight_class(save_fixture, name="lightweight", pounds=135)
+        mma_lightweight = await create_test_weight_class(save_fixture, name="lightweight", sport=CombatSport.mma)
+        registry = ReferenceDataRegistry(recheck_seconds=300)
+
+        snapshot = await registry.get(session)
+
+        assert snapshot.organization_by_name("WBC").id == wbc.id
+        assert snapshot.organization_by_id(wbc.id).name == "WBC"
+        assert snapshot.organization_by_name("IBF") is None
+        assert snapshot.weight_class_by_name("lightweight").id == boxing_lightweight.id
+        assert snapshot.weight_class_by_name("lightweight", sport=CombatSport.mma).id == mma_lightweight.id
+        assert snapshot.weight_class_by_id(boxing_lightweight.id).pounds == 135
+
+    async def test_serves_cached_snapshot_within_recheck_window(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        await create_test_fight_organization(save_fixture, name="WBC")
+        registry = ReferenceDataRegistry(recheck_seconds=300)
+        first = await registry.get(session)
+
+        await create_test_fight_organization(save_fixture, name="WBO")
+
+        assert await registry.get(session) is first
+
+    async def test_reloads_when_reference_data_changes(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        await create_test_fight_organization(save_fixture, name="WBC")
+        registry = ReferenceDataRegistry(recheck_seconds=0)
+        first = await registry.get(session)
+
+        await create_test_fight_organization(save_fixture, name="WBO")
+        second = await registry.get(session)
+
+        assert second is not first
+        assert second.organization_by_name("WBO") is not None
+
+    async def test_keeps_snapshot_when_fingerprint_unchanged(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        await create_test_fight_organization(save_fixture, name="WBC")
+        registry = ReferenceDataRegistry(recheck_seconds=0)
+        first = await registry.get(session)
+
+        assert await registry.get(session) is first
+
+    async def test_reloads_after_raw_sql_migration_without_timestamps(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        weight_class = await create_test_weight_class(save_fixture, name="lightweight", pounds=135)
+        registry = ReferenceDataRegistry(recheck_seconds=0)
+        await registry.get(session)
+
+        # A seed migration that fixes a value in place: counts and timestamps stay the same
+        await session.execute(text("UPDATE weight_classes SET pounds = 134 WHERE id = :id"), {"id": weight_class.id})
+        await session.execute(text("UPDATE alembic_version SET version_num = 'test_next'"))
+        snapshot = await registry.get(session)
+
+        assert snapshot.weight_class_by_id(weight_class.id).pounds == 134
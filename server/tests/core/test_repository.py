@@ -0,0 +1,248 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import any_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sbtb.core.repository.base import InvalidCursor, KeysetPage, array_param, encode_cursor
+from sbtb.fighter.repository import FightCardRepo, FighterRepo
+from sbtb.models import FightCard, Fighter
+from tests.factories import create_test_fight_card, create_test_fighter
+from tests.fixtures.database import SaveFixture, count_statements
+
+
+async def _all_pages(page: KeysetPage, fetch) -> list:
+    items = list(page.items)
+    while page.next_cursor is not None:
+        page = await fetch(page.next_cursor)
+        items.extend(page.items)
+    return items
+
+
+@pytest.mark.asyncio
+class TestPaginateKeyset:
+    async def test_walks_every_row_once_in_order(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        names = [f"fighter {i:02d}" for i in range(7)]
+        for name in reversed(names):
+            await create_test_fighter(save_fixture, name=name)
+        repo = FighterRepo.from_session(session)
+
+        async def fetch(cursor: str | None) -> KeysetPage:
+            return await repo.paginate_keyset(
+                repo.get_base_statement(), order_by=[repo.model.name], limit=3, cursor=cursor
+            )
+
+        first = await fetch(None)
+        fighters = await _all_pages(first, fetch)
+
+        assert len(first.items) == 3
+        assert [fighter.name for fighter in fighters] == names
+
+    async def test_last_page_has_no_cursor(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        for _ in range(3):
+            await create_test_fighter(save_fixture)
+        repo = FighterRepo.from_session(session)
+
+        page = await repo.paginate_keyset(repo.get_base_statement(), order_by=[repo.model.name], limit=3)
+
+        assert len(page.items) == 3
+        assert page.next_cursor is None
+        assert page.total is None
+
+    async def test_breaks_ties_on_id_in_descending_order(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        same_day = now + timedelta(days=3)
+        cards = [await create_test_fight_card(save_fixture, event_date=same_day) for _ in range(4)]
+        cards.append(await create_test_fight_card(save_fixture, event_date=now + timedelta(days=1)))
+        repo = FightCardRepo.from_session(session)
+
+        async def fetch(cursor: str | None) -> KeysetPage:
+            return await repo.paginate_keyset(
+                repo.get_base_statement(), order_by=[FightCard.event_date.desc()], limit=2, cursor=cursor
+            )
+
+        result = await _all_pages(await fetch(None), fetch)
+
+        expected = sorted(cards, key=lambda card: (card.event_date, card.id), reverse=True)
+        assert [card.id for card in result] == [card.id for card in expected]
+
+    async def test_mixed_directions(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        now = datetime.now(timezone.utc)
+        cards = [
+            await create_test_fight_card(save_fixture, event_name=name, event_date=now + timedelta(days=days))
+            for name, days in (("b", 1), ("a", 1), ("c", 2), ("a", 2))
+        ]
+        repo = FightCardRepo.from_session(session)
+
+        async def fetch(cursor: str | None) -> KeysetPage:
+            return await repo.paginate_keyset(
+                repo.get_base_statement(),
+                order_by=[FightCard.event_date.desc(), FightCard.event_name],
+                limit=1,
+                cursor=cursor,
+            )
+
+        result = await _all_pages(await fetch(None), fetch)
+
+        assert [card.id for card in result] == [cards[3].id, cards[2].id, cards[1].id, cards[0].id]
+
+    async def test_respects_statement_filters_and_counts(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        for i in range(5):
+            await create_test_fighter(save_fixture, name=f"counted {i}")
+        await create_test_fighter(save_fixture, name="other")
+        repo = FighterRepo.from_session(session)
+        statement = repo.get_base_statement().where(repo.model.name.startswith("counted"))
+
+        exact = await repo.paginate_keyset(statement, order_by=[repo.model.name], limit=2, count="exact")
+        estimate = await repo.paginate_keyset(statement, order_by=[repo.model.name], limit=2, count="estimate")
+
+        assert exact.total == 5
+        assert estimate.total is not None and estimate.total >= 1
+
+    async def test_estimate_count_binds_uuid_and_array_filters(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        fighters = [await create_test_fighter(save_fixture, name=f"estimated {i}") for i in range(3)]
+        repo = FighterRepo.from_session(session)
+        statement = repo.get_base_statement().where(
+            repo.model.id == any_(array_param(repo.model.id, [fighter.id for fighter in fighters])),
+            repo.model.id != fighters[0].id,
+            repo.model.name.in_(["estimated 1", "estimated 2"]),
+            repo.model.created_at > datetime.now(timezone.utc) - timedelta(days=1),
+        )
+
+        page = await repo.paginate_keyset(statement, order_by=[repo.model.name], limit=2, count="estimate")
+
+        assert [fighter.id for fighter in page.items] == [fighters[1].id, fighters[2].id]
+        assert page.total is not None and page.total >= 1
+
+    @pytest.mark.parametrize("cursor", ["not base64!", encode_cursor(["only one value"]), encode_cursor([1, 2])])
+    async def test_rejects_malformed_cursor(self, session: AsyncSession, cursor: str) -> None:
+        repo = FighterRepo.from_session(session)
+
+        with pytest.raises(InvalidCursor):
+            await repo.paginate_keyset(repo.get_base_statement(), order_by=[repo.model.name], limit=2, cursor=cursor)
+
+
+@pytest.mark.asyncio
+class TestBulkUpsert:
+    async def test_inserts_and_updates_in_input_order(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        existing = await create_test_fighter(save_fixture, name="gervonta davis", wins=1)
+        repo = FighterRepo.from_session(session)
+
+        fighters = await repo.bulk_upsert(
+            [{"name": "shakur stevenson", "wins": 24}, {"name": "gervonta davis", "wins": 30}],
+            conflict_cols=["name"],
+        )
+
+        assert [fighter.name for fighter in fighters] == ["shakur stevenson", "gervonta davis"]
+        assert fighters[1] is existing
+        assert existing.wins == 30
+        assert existing.modified_at is not None
+        assert fighters[0].id is not None
+
+    async def test_only_updates_listed_columns(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        existing = await create_test_fighter(save_fixture, name="devin haney", wins=31, losses=0)
+        repo = FighterRepo.from_session(session)
+
+        await repo.bulk_upsert(
+            [{"name": "devin haney", "wins": 32, "losses": 1}], conflict_cols=["name"], update_cols=["losses"]
+        )
+
+        assert (existing.wins, existing.losses) == (31, 1)
+
+    async def test_returns_existing_rows_when_nothing_to_update(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        existing = await create_test_fighter(save_fixture, name="jake paul")
+        repo = FighterRepo.from_session(session)
+
+        rows = await repo.bulk_upsert(
+            [{"name": "jake paul"}, {"name": "jake paul"}, {"name": "tommy fury"}],
+            conflict_cols=["name"],
+            as_rows=True,
+        )
+
+        assert [(row.id == existing.id, row.name) for row in rows] == [(True, "jake paul"), (False, "tommy fury")]
+
+    async def test_sends_one_statement_per_chunk(self, session: AsyncSession, monkeypatch: pytest.MonkeyPatch) -> None:
+        names = [f"bulk fighter {i:04d}" for i in range(2500)]
+        repo = FighterRepo.from_session(session)
+
+        with count_statements(session) as statements:
+            fighters = await repo.bulk_upsert([{"name": name} for name in names], conflict_cols=["name"])
+        assert [fighter.name for fighter in fighters] == names
+        assert len(statements) == 1
+
+        monkeypatch.setattr(FighterRepo, "bulk_max_params", 1000 * len(Fighter.__table__.columns))
+        with count_statements(session) as statements:
+            rows = await repo.bulk_upsert(
+                [{"name": name, "wins": 1} for name in reversed(names)], conflict_cols=["name"], as_rows=True
+            )
+        assert [row.name for row in rows] == names[::-1]
+        assert {row.wins for row in rows} == {1}
+        assert len(statements) == 3
+
+    async def test_matches_non_canonical_keys_to_returned_rows(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        existing = await create_test_fighter(save_fixture, name="terence crawford", wins=40)
+        new_id = uuid4()
+        repo = FighterRepo.from_session(session)
+
+        # Ids as strings: the database hands them back as UUIDs
+        fighters = await repo.bulk_upsert(
+            [
+                {"id": str(new_id), "name": "errol spence", "wins": 28},
+                {"id": str(existing.id), "name": "terence crawford", "wins": 41},
+                {"id": str(new_id).upper(), "name": "errol spence jr", "wins": 28},
+            ],
+            conflict_cols=["id"],
+        )
+
+        assert [(fighter.id, fighter.name) for fighter in fighters] == [
+            (new_id, "errol spence jr"),
+            (existing.id, "terence crawford"),
+        ]
+        assert existing.wins == 41
+
+    async def test_returns_empty_for_no_rows(self, session: AsyncSession) -> None:
+        assert await FighterRepo.from_session(session).bulk_upsert([], conflict_cols=["name"]) == []
+
+
+@pytest.mark.asyncio
+class TestGetManyByIds:
+    async def test_fetches_objects_and_rows(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        fighters = [await create_test_fighter(save_fixture) for _ in range(3)]
+        repo = FighterRepo.from_session(session)
+        ids = [fighters[0].id, fighters[2].id, uuid4()]
+
+        objects = await repo.get_many_by_ids(ids)
+        rows = await repo.get_many_by_ids(ids, as_rows=True)
+
+        assert set(objects) == {fighters[0], fighters[2]}
+        assert {row.name for row in rows} == {fighters[0].name, fighters[2].name}
+        assert await repo.get_many_by_ids([]) == []
+
+
+@pytest.mark.asyncio
+class TestPreparedStatements:
+    async def test_lookups_reuse_one_statement_per_repository(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        fighter = await create_test_fighter(save_fixture, name="jaron ennis")
+        card = await create_test_fight_card(save_fixture)
+        first, second = FighterRepo.from_session(session), FighterRepo.from_session(session)
+
+        assert await first.get_by_id(fighter.id) is fighter
+        assert await second.get_by_id(uuid4()) is None
+        assert await second.get_by_name("jaron ennis") is fighter
+        assert await FightCardRepo.from_session(session).get_by_id(card.id) is card
+
+        assert first.get_by_id_statement() is second.get_by_id_statement()
+        assert first.get_by_id_statement() is not FightCardRepo.from_session(session).get_by_id_statement()
@@ -1,4 +1,10 @@
-from tests.factories.fighter import create_test_featured_fighter, create_test_fighter
+from tests.factories.fighter import (
+    create_test_featured_fighter,
+    create_test_fight_card,
+    create_test_fight_organization,
+    create_test_fighter,
+    create_test_weight_class,
+)
 from tests.factories.jwt import create_test_jwt
 from tests.factories.user import create_test_user
 
@@ -6,5 +12,8 @@ __all__ = [
     "create_test_user",
     "create_test_fighter",
     "create_test_featured_fighter",
+    "create_test_fight_card",
+    "create_test_fight_organization",
+    "create_test_weight_class",
     "create_test_jwt",
 ]
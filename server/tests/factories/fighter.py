@@ -1,7 +1,9 @@
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
-from sbtb.models import FeaturedFighter, Fighter
+from sbtb.models import FeaturedFighter, FightCard, Fighter, FightOrganization, WeightClass
 from sbtb.models.featured_fighter import FeaturedCollection
+from sbtb.models.fight_organization import CombatSport
 from tests.fixtures.database import SaveFixture
 
 
@@ -39,3 +41,55 @@ async def create_test_featured_fighter(
     )
     await save_fixture(featured)
     return featured
+
+
+async def create_test_fight_organization(
+    save_fixture: SaveFixture,
+    name: str | None = None,
+    sport: CombatSport | None = CombatSport.boxing,
+) -> FightOrganization:
+    organization = FightOrganization(
+        id=uuid4(),
+        name=name or f"ORG-{uuid4().hex[:6]}",
+        sport=sport,
+    )
+    await save_fixture(organization)
+    return organization
+
+
+async def create_test_weight_class(
+    save_fixture: SaveFixture,
+    name: str | None = None,
+    pounds: int | None = None,
+    sport: CombatSport = CombatSport.boxing,
+) -> WeightClass:
+    weight_class = WeightClass(
+        id=uuid4(),
+        name=name or f"weight class {uuid4().hex[:6]}",
+        pounds=pounds,
+        sport=sport,
+    )
+    await save_fixture(weight_class)
+    return weight_class
+
+
+async def create_test_fight_card(
+    save_fixture: SaveFixture,
+    event_name: str | None = None,
+    event_date: datetime | None = None,
+    location: str | None = "Las Vegas, NV",
+    network: str | None = None,
+    source: str | None = None,
+    external_id: str | None = None,
+) -> FightCard:
+    fight_card = FightCard(
+        id=uuid4(),
+        source=source,
+        external_id=external_id,
+        event_name=event_name or f"Test Card {uuid4().hex[:8]}",
+        event_date=event_date or datetime.now(timezone.utc) + timedelta(days=30),
+        location=location,
+        network=network,
+    )
+    await save_fixture(fight_card)
+    return fight_card
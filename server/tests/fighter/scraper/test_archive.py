@@ -0,0 +1,139 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sbtb.fighter.scraper import BoxingFightCardScraper, BoxingRankScraper
+from sbtb.fighter.scraper.archive import ScrapeArchive
+from sbtb.fighter.service import BoxingFightCardService
+from sbtb.models import FightCard
+from tests.fixtures.scraper import ScheduleUpstream, make_schedule_event
+
+
+class TestScrapeArchive:
+    def test_stores_identical_payloads_once(self, scrape_archive: ScrapeArchive) -> None:
+        first = scrape_archive.put(b"<html>same</html>")
+        second = scrape_archive.put(b"<html>same</html>")
+
+        assert first == second
+        assert scrape_archive.get(first) == b"<html>same</html>"
+        assert len(list((scrape_archive.directory / "blobs").rglob("*.zst"))) == 1
+
+    def test_run_manifest_round_trips(self, scrape_archive: ScrapeArchive) -> None:
+        run = scrape_archive.start_run(scraper="BoxingFightCardScraper")
+        run.record("rsc_page", b"1:{}", url="https://example.com", method="POST", request=["get_upcoming_events"])
+        run.close()
+
+        (manifest,) = scrape_archive.runs(scraper="BoxingFightCardScraper")
+
+        assert manifest == scrape_archive.load_manifest(run.manifest.run_id)
+        assert [(e.kind, e.method, e.request) for e in manifest.entries] == [
+            ("rsc_page", "POST", ["get_upcoming_events"])
+        ]
+
+    def test_empty_run_writes_no_manifest(self, scrape_archive: ScrapeArchive) -> None:
+        scrape_archive.start_run(scraper="BoxingRankScraper").close()
+
+        assert scrape_archive.runs() == []
+
+    def test_streamed_payload_is_stored_like_a_put_one(self, scrape_archive: ScrapeArchive) -> None:
+        run = scrape_archive.start_run(scraper="BoxingFightCardScraper")
+        writer = run.stream("rsc_page", url="https://example.com", method="POST")
+        for chunk in (b"0:[]\n", b'1:{"results"', b": []}\n"):
+            writer.write(chunk)
+        digest = writer.finish()
+        aborted = run.stream("rsc_page", url="https://example.com", method="POST")
+        aborted.write(b"half a page")
+        aborted.abort()
+
+        payload = b'0:[]\n1:{"results": []}\n'
+        assert digest == scrape_archive.put(payload)
+        assert scrape_archive.get(digest) == payload
+        assert [(e.sha256, e.size) for e in run.manifest.entries] == [(digest, len(payload))]
+        assert [path.name for path in (scrape_archive.directory / "blobs").rglob("*") if path.is_file()] == [
+            f"{digest}.zst"
+        ]
+
+    def test_prunes_oldest_runs_and_the_blobs_only_they_used(self, tmp_path: Path) -> None:
+        archive = ScrapeArchive(directory=tmp_path, max_runs=2)
+        digests = []
+        for i in range(3):
+            run = archive.start_run(scraper="BoxingRankScraper")
+            run.record("rankings_html", b"shared", url="https://example.com")
+            run.record("rankings_html", f"page {i}".encode(), url="https://example.com")
+            run.close()
+            digests.append(run.manifest.entries[1].sha256)
+
+        assert [len(m.entries) for m in archive.runs()] == [2, 2]
+        assert not archive._blob_path(digests[0]).exists()
+        assert archive.get(digests[2]) == b"page 2"
+        assert archive.get(archive.runs()[0].entries[0].sha256) == b"shared"
+
+    def test_size_limit_always_keeps_the_newest_run(self, tmp_path: Path) -> None:
+        archive = ScrapeArchive(directory=tmp_path, max_bytes=1)
+        for i in range(2):
+            run = archive.start_run(scraper="BoxingRankScraper")
+            run.record("rankings_html", f"page {i}".encode(), url="https://example.com")
+            run.close()
+
+        (manifest,) = archive.runs()
+        assert archive.get(manifest.entries[0].sha256) == b"page 1"
+
+
+class _OfflineHttpClient:
+    def request(self, *args, **kwargs) -> Iterator[None]:
+        raise AssertionError("replay must not touch the network")
+
+
+@pytest.mark.asyncio
+class TestScraperReplay:
+    async def test_schedule_run_is_archived_and_replayed_offline(
+        self,
+        schedule_scraper: BoxingFightCardScraper,
+        schedule_upstream: ScheduleUpstream,
+        scrape_archive: ScrapeArchive,
+    ) -> None:
+        schedule_upstream.events = [make_schedule_event(i, f"2026-11-{i:02d}") for i in range(1, 13)]
+        scraped = (await schedule_scraper.run_scraper()).payload
+
+        (manifest,) = scrape_archive.runs(scraper="BoxingFightCardScraper")
+        assert [e.kind for e in manifest.entries] == ["schedule_html", "js_chunk", "rsc_page", "rsc_page"]
+
+        schedule_scraper.http_client = _OfflineHttpClient()
+        with schedule_scraper.replaying(manifest):
+            replayed = (await schedule_scraper.run_scraper()).payload
+
+        assert replayed == scraped
+
+    async def test_rankings_run_is_archived_and_replayed_offline(
+        self, rankings_scraper: BoxingRankScraper, scrape_archive: ScrapeArchive
+    ) -> None:
+        scraped = (await rankings_scraper.run_scraper()).payload
+        (manifest,) = scrape_archive.runs(scraper="BoxingRankScraper")
+
+        rankings_scraper.http_client = _OfflineHttpClient()
+        with rankings_scraper.replaying(manifest):
+            assert (await rankings_scraper.run_scraper()).payload == scraped
+
+    async def test_replay_feeds_the_service(
+        self,
+        session: AsyncSession,
+        schedule_scraper: BoxingFightCardScraper,
+        schedule_upstream: ScheduleUpstream,
+        scrape_archive: ScrapeArchive,
+    ) -> None:
+        schedule_upstream.events = [make_schedule_event(1, "2026-11-01"), make_schedule_event(2, "2026-11-08")]
+        await schedule_scraper.run_scraper()
+        (manifest,) = scrape_archive.runs()
+
+        schedule_scraper.http_client = _OfflineHttpClient()
+        with schedule_scraper.replaying(manifest):
+            result = await BoxingFightCardService(scraper=schedule_scraper).scrape_and_update_boxing_fight_cards(
+                session=session
+            )
+
+        assert result.cards_scraped == 2
+        assert not result.full_sync
+        assert (await session.execute(select(func.count()).select_from(FightCard))).scalar_one() == 2
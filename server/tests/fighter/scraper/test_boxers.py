@@ -0,0 +1,67 @@
+import pytest
+
+from sbtb.fighter.scraper import BoxingRankScraper
+from tests.fixtures.scraper import RankingsUpstream
+
+
+@pytest.mark.asyncio
+class TestBoxingRankScraperShortCircuit:
+    async def test_parses_on_first_run(self, rankings_scraper: BoxingRankScraper) -> None:
+        run = await rankings_scraper.run_scraper()
+
+        assert list(run.payload) == ["heavyweight", "super middleweight"]
+        assert not run.unchanged
+
+    async def test_not_modified_skips_parse(
+        self, rankings_scraper: BoxingRankScraper, rankings_upstream: RankingsUpstream
+    ) -> None:
+        rankings_scraper.commit_state(await rankings_scraper.run_scraper())
+
+        run = await rankings_scraper.run_scraper()
+
+        assert run.payload is None
+        assert run.unchanged
+        assert rankings_upstream.statuses == [200, 304]
+
+    async def test_same_content_hash_skips_parse(
+        self, rankings_scraper: BoxingRankScraper, rankings_upstream: RankingsUpstream
+    ) -> None:
+        rankings_scraper.commit_state(await rankings_scraper.run_scraper())
+        # New deploy upstream: fresh ETag and restyled markup, same rankings
+        rankings_upstream.etag = '"v2"'
+        rankings_upstream.html = rankings_upstream.html.replace("mx-auto", "mx-8")
+
+        run = await rankings_scraper.run_scraper()
+
+        assert run.payload is None
+        assert run.unchanged
+
+    async def test_each_run_keeps_its_own_result(self, rankings_scraper: BoxingRankScraper) -> None:
+        first = await rankings_scraper.run_scraper()
+        rankings_scraper.commit_state(first)
+
+        second = await rankings_scraper.run_scraper()
+
+        assert (first.unchanged, second.unchanged) == (False, True)
+        assert first.payload is not None and second.payload is None
+
+    async def test_changed_content_is_parsed(
+        self, rankings_scraper: BoxingRankScraper, rankings_upstream: RankingsUpstream
+    ) -> None:
+        rankings_scraper.commit_state(await rankings_scraper.run_scraper())
+        rankings_upstream.etag = None
+        rankings_upstream.html = rankings_upstream.html.replace("Fabio Wardley", "Jared Anderson")
+
+        rankings = (await rankings_scraper.run_scraper()).payload
+
+        assert rankings["heavyweight"]["WBO"][0].name == "jared anderson"
+
+    async def test_uncommitted_run_is_not_remembered(
+        self, rankings_scraper: BoxingRankScraper, rankings_upstream: RankingsUpstream
+    ) -> None:
+        await rankings_scraper.run_scraper()
+
+        rankings = (await rankings_scraper.run_scraper()).payload
+
+        assert rankings is not None
+        assert rankings_upstream.statuses == [200, 200]
@@ -0,0 +1,228 @@
+import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from sbtb.fighter.repository import FightCardRepo
+from sbtb.fighter.scraper import BoxingFightCardScraper
+from sbtb.fighter.scraper.state import ScraperStateStore
+from sbtb.fighter.service import BoxingFightCardService
+from tests.fixtures.scraper import CHUNK_PATH, ScheduleUpstream, make_schedule_event
+
+
+@pytest.mark.asyncio
+class TestBoxingFightCardScraperActionId:
+    async def test_discovers_and_caches_action_id(
+        self,
+        schedule_scraper: BoxingFightCardScraper,
+        schedule_upstream: ScheduleUpstream,
+        scraper_state_store: ScraperStateStore,
+    ) -> None:
+        schedule_upstream.events = [make_schedule_event(1, "2026-11-01")]
+
+        cards = (await schedule_scraper.run_scraper()).payload
+
+        assert [card.title_fighters for card in cards] == [["Main A1", "Main B1"]]
+        assert scraper_state_store.get(BoxingFightCardScraper.ACTION_ID_STATE_KEY) == schedule_upstream.action_id
+
+    async def test_reuses_cached_action_id_without_discovery(
+        self, schedule_scraper: BoxingFightCardScraper, schedule_upstream: ScheduleUpstream
+    ) -> None:
+        schedule_upstream.events = [make_schedule_event(1, "2026-11-01")]
+        await schedule_scraper.run_scraper()
+
+        await schedule_scraper.run_scraper()
+
+        assert schedule_upstream.count("GET", "/schedule") == 1
+        assert schedule_upstream.count("GET", CHUNK_PATH) == 1
+
+    async def test_rediscovers_when_cached_action_id_is_stale(
+        self,
+        schedule_scraper: BoxingFightCardScraper,
+        schedule_upstream: ScheduleUpstream,
+        scraper_state_store: ScraperStateStore,
+    ) -> None:
+        schedule_upstream.events = [make_schedule_event(1, "2026-11-01")]
+        scraper_state_store.set(BoxingFightCardScraper.ACTION_ID_STATE_KEY, "deadbeef")
+
+        cards = (await schedule_scraper.run_scraper()).payload
+
+        assert len(cards) == 1
+        assert scraper_state_store.get(BoxingFightCardScraper.ACTION_ID_STATE_KEY) == schedule_upstream.action_id
+
+    async def test_paginates_through_all_events(
+        self, schedule_scraper: BoxingFightCardScraper, schedule_upstream: ScheduleUpstream
+    ) -> None:
+        schedule_upstream.events = [make_schedule_event(i, f"2026-11-{i:02d}") for i in range(1, 26)]
+
+        cards = (await schedule_scraper.run_scraper()).payload
+
+        assert len(cards) == 25
+        assert schedule_upstream.count("POST", "/schedule") == 3
+
+    async def test_retries_throttled_pages_instead_of_truncating(
+        self, schedule_scraper: BoxingFightCardScraper, schedule_upstream: ScheduleUpstream
+    ) -> None:
+        schedule_upstream.events = [make_schedule_event(i, f"2026-11-{i:02d}") for i in range(1, 26)]
+        schedule_upstream.action_failures = [429, 503]
+
+        run = await schedule_scraper.run_scraper()
+
+        assert len(run.payload) == 25
+        assert run.request_metrics.retries == 2
+        assert run.request_metrics.throttled == 1
+        assert run.full_sync is True
+
+
+def _weekly_events(count: int) -> list[dict]:
+    today = datetime.date.today()
+    return [make_schedule_event(i, (today + datetime.timedelta(weeks=i)).isoformat()) for i in range(1, count + 1)]
+
+
+@pytest.mark.asyncio
+class TestBoxingFightCardScraperIncrementalSync:
+    async def test_first_run_is_full_sync(
+        self, schedule_scraper: BoxingFightCardScraper, schedule_upstream: ScheduleUpstream
+    ) -> None:
+        schedule_upstream.events = _weekly_events(30)
+
+        run = await schedule_scraper.run_scraper()
+
+        assert len(run.payload) == 30
+        assert [card.external_id for card in run.payload] == [str(i) for i in range(1, 31)]
+        assert run.full_sync
+        assert run.listed_ids == [str(i) for i in range(1, 31)]
+        assert schedule_upstream.count("POST", "/schedule") == 4
+
+    async def test_incremental_run_fetches_window_and_tail_only(
+        self, schedule_scraper: BoxingFightCardScraper, schedule_upstream: ScheduleUpstream
+    ) -> None:
+        schedule_upstream.events = _weekly_events(30)
+        schedule_scraper.commit_state(await schedule_scraper.run_scraper())
+        schedule_upstream.requests.clear()
+
+        run = await schedule_scraper.run_scraper()
+
+        assert run.payload is None
+        assert not run.full_sync
+        # One page covering the window, one page past the high-water mark
+        assert schedule_upstream.count("POST", "/schedule") == 2
+
+    async def test_incremental_run_returns_only_changed_and_new_events(
+        self, schedule_scraper: BoxingFightCardScraper, schedule_upstream: ScheduleUpstream
+    ) -> None:
+        schedule_upstream.events = _weekly_events(30)
+        schedule_scraper.commit_state(await schedule_scraper.run_scraper())
+
+        schedule_upstream.events[1] = make_schedule_event(
+            2, schedule_upstream.events[1]["event_date"], fighters=[("Replacement A", "Main B2")]
+        )
+        schedule_upstream.events.append(_weekly_events(31)[-1])
+
+        cards = (await schedule_scraper.run_scraper()).payload
+
+        assert [card.title_fighters for card in cards] == [["Replacement A", "Main B2"], ["Main A31", "Main B31"]]
+
+    async def test_uncommitted_run_does_not_advance_state(
+        self, schedule_scraper: BoxingFightCardScraper, schedule_upstream: ScheduleUpstream
+    ) -> None:
+        schedule_upstream.events = _weekly_events(5)
+        await schedule_scraper.run_scraper()
+
+        run = await schedule_scraper.run_scraper()
+
+        assert len(run.payload) == 5
+        assert run.full_sync
+
+    async def test_full_resync_after_interval(
+        self,
+        schedule_scraper: BoxingFightCardScraper,
+        schedule_upstream: ScheduleUpstream,
+        scraper_state_store: ScraperStateStore,
+    ) -> None:
+        schedule_upstream.events = _weekly_events(5)
+        schedule_scraper.commit_state(await schedule_scraper.run_scraper())
+        state = scraper_state_store.get(BoxingFightCardScraper.SYNC_STATE_KEY)
+        scraper_state_store.set(BoxingFightCardScraper.SYNC_STATE_KEY, {**state, "full_synced_at": 0})
+
+        run = await schedule_scraper.run_scraper()
+
+        assert len(run.payload) == 5
+        assert run.full_sync
+
+    async def test_state_from_before_external_ids_forces_a_full_sync(
+        self,
+        schedule_scraper: BoxingFightCardScraper,
+        schedule_upstream: ScheduleUpstream,
+        scraper_state_store: ScraperStateStore,
+    ) -> None:
+        # Cards stored before the external id key have none, so incremental runs would duplicate them
+        schedule_upstream.events = _weekly_events(5)
+        schedule_scraper.commit_state(await schedule_scraper.run_scraper())
+        state = scraper_state_store.get(BoxingFightCardScraper.SYNC_STATE_KEY)
+        scraper_state_store.delete(BoxingFightCardScraper.SYNC_STATE_KEY)
+        scraper_state_store.set("boxing_schedule_sync", state)
+
+        run = await schedule_scraper.run_scraper()
+
+        assert len(run.payload) == 5
+        assert run.full_sync
+        assert run.listed_ids == [str(event["id"]) for event in schedule_upstream.events]
+
+    @pytest.mark.parametrize("failure", ["persist", "commit"])
+    async def test_events_from_a_failed_sync_are_fetched_again(
+        self,
+        session: AsyncSession,
+        schedule_scraper: BoxingFightCardScraper,
+        schedule_upstream: ScheduleUpstream,
+        monkeypatch: pytest.MonkeyPatch,
+        failure: str,
+    ) -> None:
+        # Commits and rolls back a savepoint, so the fixture's outer transaction survives the rollback
+        own_session = AsyncSession(bind=session.bind, join_transaction_mode="create_savepoint")
+        service = BoxingFightCardService(scraper=schedule_scraper)
+        schedule_upstream.events = _weekly_events(5)
+        await service.scrape_and_update_boxing_fight_cards(session=own_session)
+        await own_session.commit()
+        schedule_upstream.events[1] = make_schedule_event(
+            2, schedule_upstream.events[1]["event_date"], fighters=[("Replacement A", "Main B2")]
+        )
+
+        async def upsert_bouts_many(self, bouts_by_card):
+            raise RuntimeError("bout write failed")
+
+        def fail_commit(session: Session) -> None:
+            raise RuntimeError("commit failed")
+
+        with monkeypatch.context() as patch:
+            if failure == "persist":
+                patch.setattr(FightCardRepo, "upsert_bouts_many", upsert_bouts_many)
+            await service.scrape_and_update_boxing_fight_cards(session=own_session)
+            if failure == "commit":
+                event.listen(own_session.sync_session, "before_commit", fail_commit, once=True)
+            try:
+                await own_session.commit()
+            except RuntimeError:
+                await own_session.rollback()
+
+        result = await service.scrape_and_update_boxing_fight_cards(session=own_session)
+        await own_session.close()
+
+        assert not result.full_sync
+        assert [card.event_name for card in result.fight_cards] == ["Replacement A vs Main B2"]
+
+
+class TestScraperStateStore:
+    def test_round_trips_and_deletes(self, scraper_state_store: ScraperStateStore) -> None:
+        scraper_state_store.set("key", {"a": 1})
+        assert scraper_state_store.get("key") == {"a": 1}
+
+        scraper_state_store.delete("key")
+        assert scraper_state_store.get("key") is None
+
+    def test_expired_entries_read_as_missing(self, scraper_state_store: ScraperStateStore) -> None:
+        scraper_state_store.set("key", "value", ttl_seconds=-1)
+
+        assert scraper_state_store.get("key") is None
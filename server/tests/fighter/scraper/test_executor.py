@@ -0,0 +1,62 @@
+import asyncio
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sbtb.fighter.scraper import BoxingRankScraper, ParseExecutor
+from sbtb.fighter.scraper.rank_parsers import LxmlRankPageParser
+
+RANKINGS_HTML = (Path(__file__).parent / "data" / "boxing_rankings.html").read_text()
+
+
+@pytest.fixture
+def thread_executor() -> Iterator[ParseExecutor]:
+    executor = ParseExecutor(kind="thread", max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+class TestParseExecutor:
+    async def test_runs_callable_in_pool(self, thread_executor: ParseExecutor) -> None:
+        loop_thread = threading.get_ident()
+
+        worker_thread = await thread_executor.run(threading.get_ident)
+
+        assert worker_thread != loop_thread
+        assert thread_executor.stats.completed == 1
+
+    async def test_reports_queue_depth(self, thread_executor: ParseExecutor) -> None:
+        release = threading.Event()
+        jobs = [asyncio.ensure_future(thread_executor.run(release.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        stats = thread_executor.stats
+        release.set()
+        await asyncio.gather(*jobs)
+
+        assert (stats.in_flight, stats.queue_depth) == (3, 2)
+        assert thread_executor.stats.in_flight == 0
+
+    async def test_event_loop_stays_responsive_during_parse(self, thread_executor: ParseExecutor) -> None:
+        release = threading.Event()
+        parse = asyncio.ensure_future(thread_executor.run(release.wait, 5))
+
+        # The loop keeps serving other coroutines while the worker is busy
+        await asyncio.sleep(0.01)
+        assert not parse.done()
+        release.set()
+        assert await parse is True
+
+    async def test_process_pool_parses_with_pickled_scraper(self) -> None:
+        executor = ParseExecutor(kind="process", max_workers=1)
+        scraper = BoxingRankScraper(parser=LxmlRankPageParser(), parse_executor=executor)
+        try:
+            result = await scraper.parse_off_loop(raw_data=RANKINGS_HTML)
+        finally:
+            executor.shutdown()
+
+        assert result == scraper.parse(raw_data=RANKINGS_HTML)
+        assert scraper.parse_executor is executor
@@ -0,0 +1,65 @@
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sbtb.fighter.scraper.http import ScraperHttpClient
+
+
+async def _peer_port(request: web.Request) -> web.Response:
+    return web.Response(text=str(request.transport.get_extra_info("peername")[1]))
+
+
+@pytest_asyncio.fixture
+async def stub_server() -> AsyncIterator[TestServer]:
+    app = web.Application()
+    app.router.add_get("/", _peer_port)
+    async with TestServer(app) as server:
+        yield server
+
+
+def _client() -> ScraperHttpClient:
+    return ScraperHttpClient(
+        limit_per_host=2,
+        dns_cache_ttl=60,
+        keepalive_timeout=30,
+        total_timeout=5,
+        connect_timeout=1,
+    )
+
+
+@pytest.mark.asyncio
+class TestScraperHttpClient:
+    async def test_reuses_connection_across_requests(self, stub_server: TestServer) -> None:
+        async with _client() as client:
+            ports = []
+            for _ in range(3):
+                async with client.request("GET", str(stub_server.make_url("/"))) as res:
+                    ports.append(await res.text())
+
+        assert len(set(ports)) == 1
+
+    async def test_opens_lazily_and_reopens_after_close(self, stub_server: TestServer) -> None:
+        client = _client()
+
+        async with client.request("GET", str(stub_server.make_url("/"))) as res:
+            assert res.status == 200
+        await client.close()
+        async with client.request("GET", str(stub_server.make_url("/"))) as res:
+            assert res.status == 200
+        await client.close()
+
+    async def test_reopening_on_another_loop_closes_the_previous_session(self) -> None:
+        client = _client()
+        await client.open()
+        stale = client._session
+        # As if it had been opened under an earlier asyncio.run
+        client._loop = None
+
+        await client.open()
+
+        assert stale is not None and stale.closed
+        assert client._session is not stale
+        await client.close()
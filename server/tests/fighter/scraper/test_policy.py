@@ -0,0 +1,208 @@
+import asyncio
+import datetime
+import email.utils
+from collections.abc import AsyncIterator
+from urllib.parse import urlsplit
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sbtb.fighter.scraper.http import ScraperHttpClient
+from sbtb.fighter.scraper.policy import CircuitBreaker, CircuitOpenError, RequestMetrics, TokenBucket, parse_retry_after
+from tests.fixtures.scraper import fast_request_policy
+
+
+class FlakyUpstream:
+    """Answers with the queued statuses first, then 200. While ``hold`` is unset, requests hang."""
+
+    def __init__(self) -> None:
+        self.statuses: list[int] = []
+        self.retry_after: str | None = None
+        self.hits = 0
+        self.hold = asyncio.Event()
+        self.hold.set()
+        self.received = asyncio.Event()
+        self.app = web.Application()
+        self.app.router.add_get("/", self._handle)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.hits += 1
+        self.received.set()
+        await self.hold.wait()
+        if self.statuses:
+            headers = {"Retry-After": self.retry_after} if self.retry_after is not None else {}
+            return web.Response(status=self.statuses.pop(0), headers=headers)
+        return web.Response(text="ok")
+
+
+@pytest_asyncio.fixture
+async def flaky_upstream() -> AsyncIterator[FlakyUpstream]:
+    upstream = FlakyUpstream()
+    async with TestServer(upstream.app) as server:
+        upstream.url = str(server.make_url("/"))
+        yield upstream
+
+
+def _client(**policy_overrides: float) -> ScraperHttpClient:
+    return ScraperHttpClient(
+        limit_per_host=2,
+        dns_cache_ttl=60,
+        keepalive_timeout=30,
+        total_timeout=5,
+        connect_timeout=1,
+        policy=fast_request_policy(**policy_overrides),
+    )
+
+
+@pytest.mark.asyncio
+class TestRequestPolicy:
+    async def test_retries_until_success(self, flaky_upstream: FlakyUpstream) -> None:
+        flaky_upstream.statuses = [503, 502]
+        metrics = RequestMetrics()
+
+        async with _client() as client, client.request("GET", flaky_upstream.url, metrics=metrics) as res:
+            assert res.status == 200
+
+        assert flaky_upstream.hits == 3
+        assert metrics.requests == 3
+        assert metrics.retries == 2
+        assert metrics.failures == 0
+
+    async def test_yields_last_response_once_retries_are_used_up(self, flaky_upstream: FlakyUpstream) -> None:
+        flaky_upstream.statuses = [500] * 5
+        metrics = RequestMetrics()
+
+        async with _client(max_retries=2) as client, client.request("GET", flaky_upstream.url, metrics=metrics) as res:
+            assert res.status == 500
+
+        assert flaky_upstream.hits == 3
+        assert metrics.failures == 1
+
+    async def test_does_not_retry_client_errors(self, flaky_upstream: FlakyUpstream) -> None:
+        flaky_upstream.statuses = [404]
+
+        async with _client() as client, client.request("GET", flaky_upstream.url) as res:
+            assert res.status == 404
+
+        assert flaky_upstream.hits == 1
+
+    async def test_honors_retry_after_and_slows_down_on_429(self, flaky_upstream: FlakyUpstream) -> None:
+        flaky_upstream.statuses = [429]
+        flaky_upstream.retry_after = "0.02"
+        metrics = RequestMetrics()
+        client = _client()
+
+        async with client, client.request("GET", flaky_upstream.url, metrics=metrics) as res:
+            assert res.status == 200
+
+        assert metrics.throttled == 1
+        assert metrics.backoff_seconds == pytest.approx(0.02)
+        assert client.policy.bucket(flaky_upstream.url.split("/")[2]).rate < 1000.0
+
+    async def test_gives_up_when_retry_after_exceeds_backoff_cap(self, flaky_upstream: FlakyUpstream) -> None:
+        flaky_upstream.statuses = [429]
+        flaky_upstream.retry_after = "3600"
+
+        async with _client() as client, client.request("GET", flaky_upstream.url) as res:
+            assert res.status == 429
+
+        assert flaky_upstream.hits == 1
+
+    async def test_circuit_opens_after_repeated_failures(self, flaky_upstream: FlakyUpstream) -> None:
+        flaky_upstream.statuses = [503] * 10
+        metrics = RequestMetrics()
+
+        async with _client(failure_threshold=2, max_retries=5) as client:
+            async with client.request("GET", flaky_upstream.url, metrics=metrics) as res:
+                assert res.status == 503
+            with pytest.raises(CircuitOpenError):
+                async with client.request("GET", flaky_upstream.url, metrics=metrics):
+                    pass
+
+        assert flaky_upstream.hits == 2
+        assert metrics.circuit_rejections == 1
+
+    async def test_cancelled_half_open_trial_releases_the_circuit(self, flaky_upstream: FlakyUpstream) -> None:
+        async def fetch(client: ScraperHttpClient) -> int:
+            async with client.request("GET", flaky_upstream.url) as res:
+                return res.status
+
+        async with _client(failure_threshold=1, reset_seconds=0.0) as client:
+            breaker = client.policy.breaker(urlsplit(flaky_upstream.url).netloc)
+            breaker.record_failure()
+            flaky_upstream.hold.clear()
+
+            trial = asyncio.create_task(fetch(client))
+            await flaky_upstream.received.wait()
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+            flaky_upstream.hold.set()
+
+            assert breaker.is_open
+            assert await fetch(client) == 200
+            assert not breaker.is_open
+
+    async def test_retries_connection_errors(self) -> None:
+        metrics = RequestMetrics()
+
+        async with _client(max_retries=1) as client:
+            with pytest.raises(aiohttp.ClientConnectionError):
+                async with client.request("GET", "http://127.0.0.1:1/", metrics=metrics):
+                    pass
+
+        assert metrics.requests == 2
+        assert metrics.failures == 1
+
+
+class TestTokenBucket:
+    def test_waits_once_burst_is_spent(self) -> None:
+        bucket = TokenBucket(rate=10.0, burst=2, min_rate=1.0)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_halves_on_throttling_and_recovers_additively(self) -> None:
+        bucket = TokenBucket(rate=10.0, burst=2, min_rate=1.0)
+
+        for _ in range(5):
+            bucket.slow_down()
+        assert bucket.rate == 1.0
+
+        bucket.speed_up()
+        assert bucket.rate == pytest.approx(2.0)
+        for _ in range(20):
+            bucket.speed_up()
+        assert bucket.rate == 10.0
+
+
+class TestCircuitBreaker:
+    def test_half_open_lets_one_trial_through(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.0)
+        breaker.record_failure()
+
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert not breaker.is_open
+        breaker.before_request()
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self) -> None:
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_http_date(self) -> None:
+        retry_at = datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=30)
+
+        assert parse_retry_after(email.utils.format_datetime(retry_at, usegmt=True)) == pytest.approx(30, abs=2)
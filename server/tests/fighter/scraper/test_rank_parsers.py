@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from sbtb.fighter.schemas import RawBoxerSchema
+from sbtb.fighter.scraper import BoxingRankScraper
+from sbtb.fighter.scraper.rank_parsers import (
+    RANK_PAGE_PARSERS,
+    Bs4RankPageParser,
+    LxmlRankPageParser,
+    RankPageParser,
+    get_rank_page_parser,
+)
+from sbtb.models.rank import RankType
+
+RANKINGS_HTML = (Path(__file__).parent / "data" / "boxing_rankings.html").read_text()
+
+
+@pytest.fixture(params=sorted(RANK_PAGE_PARSERS))
+def parser(request: pytest.FixtureRequest) -> RankPageParser:
+    return get_rank_page_parser(request.param)
+
+
+class TestRankPageParsers:
+    def test_parses_rankings_page(self, parser: RankPageParser) -> None:
+        rankings = parser.parse(html=RANKINGS_HTML)
+
+        assert list(rankings) == ["heavyweight", "super middleweight"]
+        assert list(rankings["heavyweight"]) == ["WBA", "WBC", "IBF", "WBO"]
+        assert rankings["heavyweight"]["WBA"] == [
+            RawBoxerSchema(name="oleksandr usyk", rank_type=RankType.champion),
+            RawBoxerSchema(name="daniel dubois", rank_type=RankType.contender, position=1),
+            RawBoxerSchema(name="josephparker", rank_type=RankType.contender, position=3),
+            RawBoxerSchema(name="filiphrgović", rank_type=RankType.contender, position=5),
+        ]
+        assert rankings["heavyweight"]["WBC"] == [
+            RawBoxerSchema(name="oleksandr usyk", rank_type=RankType.champion),
+            RawBoxerSchema(name="agit kabayel", rank_type=RankType.interim_champion),
+            RawBoxerSchema(name="zhilei zhang", rank_type=RankType.interim_champion),
+            RawBoxerSchema(name="martin bakole", rank_type=RankType.contender, position=3),
+        ]
+        assert rankings["heavyweight"]["IBF"][0] == RawBoxerSchema(
+            name="daniel dubois", rank_type=RankType.champion_in_recess
+        )
+        assert rankings["heavyweight"]["WBO"] == [
+            RawBoxerSchema(name="fabio wardley", rank_type=RankType.contender, position=1)
+        ]
+        assert rankings["super middleweight"]["WBA"][0].name == "canelo álvarez"
+
+    def test_returns_empty_without_main_container(self, parser: RankPageParser) -> None:
+        assert parser.parse(html="<html><body><div class='flex'><h3>Nope</h3></div></body></html>") == {}
+
+    def test_backends_agree(self) -> None:
+        assert LxmlRankPageParser().parse(html=RANKINGS_HTML) == Bs4RankPageParser().parse(html=RANKINGS_HTML)
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        get_rank_page_parser("regex")
+
+
+def test_scraper_uses_injected_backend() -> None:
+    scraper = BoxingRankScraper(parser=LxmlRankPageParser())
+
+    assert scraper.parse(raw_data=RANKINGS_HTML) == Bs4RankPageParser().parse(html=RANKINGS_HTML)
@@ -0,0 +1,39 @@
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+
+from sbtb.fighter.scraper.rsc import extract_rsc_results, read_rsc_results
+
+RESULTS = [{"id": 1, "event_date": "2026-11-01"}, {"id": 2, "event_date": "2026-11-08"}]
+PAYLOAD = '0:{"a":"$@1","f":"","b":"build"}\n' + f"1:{json.dumps({'results': RESULTS})}\n" + '2:{"trailer":true}\n'
+
+
+async def _chunked(payload: str, size: int) -> AsyncIterator[bytes]:
+    data = payload.encode()
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def test_extract_results_from_text() -> None:
+    assert extract_rsc_results(PAYLOAD) == RESULTS
+
+
+@pytest.mark.asyncio
+class TestReadRscResults:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+    async def test_matches_buffered_parser_at_any_chunk_size(self, chunk_size: int) -> None:
+        assert await read_rsc_results(_chunked(PAYLOAD, chunk_size)) == RESULTS
+
+    async def test_results_row_without_trailing_newline(self) -> None:
+        payload = f"1:{json.dumps({'results': RESULTS})}"
+
+        assert await read_rsc_results(_chunked(payload, 5)) == RESULTS
+
+    async def test_returns_none_without_results_row(self) -> None:
+        assert await read_rsc_results(_chunked('0:{"a":"$@1"}\n1:"not found"\n', 4)) is None
+
+    async def test_skips_undecodable_results_row(self) -> None:
+        payload = '1:{"results": [\n' + f"2:{json.dumps({'results': RESULTS})}\n"
+
+        assert await read_rsc_results(_chunked(payload, 3)) == RESULTS
@@ -0,0 +1,209 @@
+import asyncio
+import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sbtb.core.schemas import BaseSchema
+from sbtb.fighter.orchestrator import ScrapeOrchestrator, ScrapeSource
+from sbtb.fighter.repository import FightCardRepo
+from sbtb.fighter.schemas import FightCardSyncResult, ParsedFightCard, RankSyncResult, RawBoxerSchema
+from sbtb.fighter.scraper import BoxingFightCardScraper, BoxingRankScraper, ScrapeResult
+from sbtb.fighter.service import BoxerScraperService, BoxingFightCardService
+from sbtb.models import Bout, FightCard, Fighter, Rank
+from sbtb.models.fight_organization import CombatSport
+from sbtb.models.rank import RankType
+from tests.factories import create_test_fight_organization, create_test_weight_class
+from tests.fixtures.database import SaveFixture
+
+
+class FakeSourceService:
+    def __init__(
+        self,
+        result: BaseSchema,
+        log: list[str],
+        name: str,
+        delay: float = 0.0,
+        fails: bool = False,
+        persist_fails: bool = False,
+    ) -> None:
+        self.result = result
+        self.log = log
+        self.name = name
+        self.delay = delay
+        self.fails = fails
+        self.persist_fails = persist_fails
+        self.persisted: Any = None
+
+    async def fetch(self) -> str:
+        self.log.append(f"fetch-start:{self.name}")
+        await asyncio.sleep(self.delay)
+        if self.fails:
+            raise RuntimeError("upstream down")
+        self.log.append(f"fetch-end:{self.name}")
+        return f"raw-{self.name}"
+
+    async def persist(self, session: AsyncSession, raw: Any, /) -> BaseSchema:
+        self.log.append(f"persist:{self.name}")
+        self.persisted = raw
+        session.add(Fighter(name=f"written by {self.name}"))
+        await session.flush()
+        if self.persist_fails:
+            raise RuntimeError("constraint violated")
+        return self.result
+
+
+def _orchestrator(log: list[str], **service_options: dict[str, Any]) -> ScrapeOrchestrator:
+    ranks = FakeSourceService(RankSyncResult(ranks_inserted=3), log, "ranks", **service_options.get("ranks", {}))
+    fight_cards = FakeSourceService(
+        FightCardSyncResult(cards_scraped=2), log, "fight_cards", **service_options.get("fight_cards", {})
+    )
+    return ScrapeOrchestrator(
+        sources=[
+            # Registered out of order on purpose: persistence must follow depends_on, not registration
+            ScrapeSource(name="fight_cards", service=fight_cards, sport=CombatSport.boxing, depends_on=("ranks",)),
+            ScrapeSource(name="ranks", service=ranks, sport=CombatSport.boxing),
+        ],
+        max_concurrency=4,
+    )
+
+
+@pytest.mark.asyncio
+class TestScrapeOrchestrator:
+    async def test_fetches_concurrently_and_persists_in_dependency_order(self, session: AsyncSession) -> None:
+        log: list[str] = []
+        orchestrator = _orchestrator(log, ranks={"delay": 0.05}, fight_cards={"delay": 0.05})
+
+        result = await orchestrator.refresh(session)
+
+        # Both fetches start before either finishes, and nothing is persisted until all fetches are done
+        assert log[:2] == ["fetch-start:ranks", "fetch-start:fight_cards"]
+        assert log[-2:] == ["persist:ranks", "persist:fight_cards"]
+        assert result.ranks.ranks_inserted == 3
+        assert result.fight_cards.cards_scraped == 2
+        assert result.timings_ms["total"] < result.timings_ms["fetch.ranks"] + result.timings_ms["fetch.fight_cards"]
+
+    async def test_concurrency_cap_serializes_fetches(self, session: AsyncSession) -> None:
+        log: list[str] = []
+        orchestrator = _orchestrator(log)
+        orchestrator.max_concurrency = 1
+
+        await orchestrator.refresh(session)
+
+        assert log[:4] == ["fetch-start:ranks", "fetch-end:ranks", "fetch-start:fight_cards", "fetch-end:fight_cards"]
+
+    async def test_failed_fetch_is_reported_and_others_still_persist(self, session: AsyncSession) -> None:
+        log: list[str] = []
+        orchestrator = _orchestrator(log, ranks={"fails": True})
+
+        result = await orchestrator.refresh(session)
+
+        assert result.failed_sources == ["ranks"]
+        assert result.ranks is None
+        assert result.fight_cards.cards_scraped == 2
+        assert "persist:ranks" not in log
+
+    async def test_failed_persist_is_rolled_back_and_others_still_persist(self, session: AsyncSession) -> None:
+        log: list[str] = []
+        orchestrator = _orchestrator(log, ranks={"persist_fails": True})
+
+        result = await orchestrator.refresh(session)
+
+        assert result.failed_sources == ["ranks"]
+        assert result.ranks is None
+        assert result.fight_cards.cards_scraped == 2
+        names = (await session.execute(select(Fighter.name))).scalars().all()
+        assert names == ["written by fight_cards"]
+
+    async def test_failed_persist_of_a_real_service_is_rolled_back(
+        self, session: AsyncSession, save_fixture: SaveFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await create_test_fight_organization(save_fixture, name="WBC")
+        await create_test_weight_class(save_fixture, name="lightweight", pounds=135)
+        rankings = {"lightweight": {"WBC": [RawBoxerSchema(name="shakur stevenson", rank_type=RankType.champion)]}}
+        cards = [
+            ParsedFightCard(
+                external_id="1",
+                fight_date=datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=30),
+                title_fighters=["Naoya Inoue", "Junto Nakatani"],
+                undercard_fighters=[],
+                location="Tokyo",
+                network="ESPN",
+            )
+        ]
+
+        async def fetch_rankings(self) -> ScrapeResult[Any]:
+            return ScrapeResult(payload=rankings)
+
+        async def fetch_cards(self) -> ScrapeResult[Any]:
+            return ScrapeResult(payload=cards)
+
+        async def upsert_bouts_many(self, bouts_by_card: Any) -> Any:
+            raise RuntimeError("bout write failed")
+
+        monkeypatch.setattr(BoxerScraperService, "fetch", fetch_rankings)
+        monkeypatch.setattr(BoxingFightCardService, "fetch", fetch_cards)
+        # Fails after the card itself has been upserted
+        monkeypatch.setattr(FightCardRepo, "upsert_bouts_many", upsert_bouts_many)
+        orchestrator = ScrapeOrchestrator(
+            sources=[
+                ScrapeSource(
+                    name="ranks", service=BoxerScraperService(scraper=BoxingRankScraper()), sport=CombatSport.boxing
+                ),
+                ScrapeSource(
+                    name="fight_cards",
+                    service=BoxingFightCardService(scraper=BoxingFightCardScraper()),
+                    sport=CombatSport.boxing,
+                    depends_on=("ranks",),
+                ),
+            ],
+            max_concurrency=2,
+        )
+
+        result = await orchestrator.refresh(session)
+
+        assert result.failed_sources == ["fight_cards"]
+        assert result.fight_cards is None
+        assert result.ranks.ranks_inserted == 1
+        assert (await session.execute(select(func.count()).select_from(FightCard))).scalar_one() == 0
+        assert (await session.execute(select(func.count()).select_from(Bout))).scalar_one() == 0
+        assert (await session.execute(select(func.count()).select_from(Rank))).scalar_one() == 1
+        names = (await session.execute(select(Fighter.name))).scalars().all()
+        assert names == ["shakur stevenson"]
+
+    async def test_refreshes_only_selected_sources(self, session: AsyncSession) -> None:
+        log: list[str] = []
+        orchestrator = _orchestrator(log)
+
+        result = await orchestrator.refresh(session, names={"fight_cards"})
+        assert log == ["fetch-start:fight_cards", "fetch-end:fight_cards", "persist:fight_cards"]
+        assert result.ranks is None
+
+        log.clear()
+        await orchestrator.refresh(session, sport=CombatSport.mma)
+        assert log == []
+
+
+class TestScrapeOrchestratorRegistry:
+    def test_rejects_unknown_dependency(self) -> None:
+        service = FakeSourceService(RankSyncResult(), [], "ranks")
+
+        with pytest.raises(ValueError, match="unknown sources"):
+            ScrapeOrchestrator(
+                sources=[ScrapeSource(name="ranks", service=service, sport=CombatSport.boxing, depends_on=("mma",))],
+                max_concurrency=1,
+            )
+
+    def test_rejects_dependency_cycle(self) -> None:
+        service = FakeSourceService(RankSyncResult(), [], "ranks")
+
+        with pytest.raises(ValueError, match="cycle"):
+            ScrapeOrchestrator(
+                sources=[
+                    ScrapeSource(name="ranks", service=service, sport=CombatSport.boxing, depends_on=("fight_cards",)),
+                    ScrapeSource(name="fight_cards", service=service, sport=CombatSport.boxing, depends_on=("ranks",)),
+                ],
+                max_concurrency=1,
+            )
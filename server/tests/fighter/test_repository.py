@@ -0,0 +1,307 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sbtb.fighter.repository import FightCardRepo, FighterRepo, RankRepo
+from sbtb.fighter.schemas import BoutInput, FightCardInput, RankInput, RankRead
+from sbtb.models import Bout, FightCard, Fighter, Rank
+from sbtb.models.rank import RankType
+from tests.factories import (
+    create_test_fight_card,
+    create_test_fight_organization,
+    create_test_fighter,
+    create_test_weight_class,
+)
+from tests.fixtures.database import SaveFixture, count_statements
+
+
+@pytest.mark.asyncio
+class TestFighterRepoGetOrCreateMany:
+    async def test_returns_empty_for_no_names(self, session: AsyncSession) -> None:
+        repo = FighterRepo.from_session(session)
+
+        assert await repo.get_or_create_many(names=[]) == {}
+
+    async def test_creates_missing_fighters(self, session: AsyncSession) -> None:
+        repo = FighterRepo.from_session(session)
+
+        result = await repo.get_or_create_many(names=["canelo alvarez", "terence crawford"])
+
+        assert set(result) == {"canelo alvarez", "terence crawford"}
+        assert all(fighter.id is not None for fighter in result.values())
+        count = (await session.execute(select(func.count()).select_from(Fighter))).scalar_one()
+        assert count == 2
+
+    async def test_returns_existing_fighters_without_duplicating(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        existing = await create_test_fighter(save_fixture, name="naoya inoue")
+        repo = FighterRepo.from_session(session)
+
+        result = await repo.get_or_create_many(names=["naoya inoue", "junto nakatani"])
+
+        assert result["naoya inoue"].id == existing.id
+        assert result["junto nakatani"].id != existing.id
+        count = (await session.execute(select(func.count()).select_from(Fighter))).scalar_one()
+        assert count == 2
+
+    async def test_deduplicates_repeated_names(self, session: AsyncSession) -> None:
+        repo = FighterRepo.from_session(session)
+
+        result = await repo.get_or_create_many(names=["oleksandr usyk", "oleksandr usyk", ""])
+
+        assert list(result) == ["oleksandr usyk"]
+
+
+@pytest.mark.asyncio
+class TestRankRepoReconcile:
+    async def _ranks(self, session: AsyncSession) -> dict[tuple[RankType, int | None], Rank]:
+        rows = (await session.execute(select(Rank))).scalars().all()
+        return {(r.rank_type, r.position): r for r in rows}
+
+    async def test_empty_scrape_leaves_table_untouched(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        fighter = await create_test_fighter(save_fixture)
+        organization = await create_test_fight_organization(save_fixture)
+        weight_class = await create_test_weight_class(save_fixture)
+        repo = RankRepo.from_session(session)
+        await repo.reconcile(
+            ranks=[
+                RankInput(
+                    rank_type=RankType.champion,
+                    fighter_id=fighter.id,
+                    weight_class_id=weight_class.id,
+                    organization_id=organization.id,
+                )
+            ]
+        )
+
+        delta = await repo.reconcile(ranks=[])
+
+        assert not delta.has_changes
+        assert len(await self._ranks(session)) == 1
+
+    async def test_applies_only_the_delta(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        champion = await create_test_fighter(save_fixture)
+        contender = await create_test_fighter(save_fixture)
+        challenger = await create_test_fighter(save_fixture)
+        organization = await create_test_fight_organization(save_fixture)
+        weight_class = await create_test_weight_class(save_fixture)
+        repo = RankRepo.from_session(session)
+
+        def rank(fighter: Fighter, rank_type: RankType, position: int | None = None) -> RankInput:
+            return RankInput(
+                rank_type=rank_type,
+                position=position,
+                fighter_id=fighter.id,
+                weight_class_id=weight_class.id,
+                organization_id=organization.id,
+            )
+
+        first = await repo.reconcile(
+            ranks=[
+                rank(champion, RankType.champion),
+                rank(contender, RankType.contender, 1),
+                rank(challenger, RankType.contender, 2),
+            ]
+        )
+        assert len(first.inserted) == 3
+        before = {key: rank.id for key, rank in (await self._ranks(session)).items()}
+
+        # Contenders 1 and 2 swap places, #2 drops out entirely, a new #3 appears
+        second = await repo.reconcile(
+            ranks=[
+                rank(champion, RankType.champion),
+                rank(challenger, RankType.contender, 1),
+                rank(contender, RankType.contender, 3),
+            ]
+        )
+
+        assert [r.position for r in second.inserted] == [3]
+        assert [r.position for r in second.updated] == [1]
+        assert second.deleted == [before[(RankType.contender, 2)]]
+
+        challenger_id = challenger.id
+        session.expire_all()
+        after = await self._ranks(session)
+        assert set(after) == {(RankType.champion, None), (RankType.contender, 1), (RankType.contender, 3)}
+        # Unchanged and updated slots keep their row identity
+        assert after[(RankType.champion, None)].id == before[(RankType.champion, None)]
+        assert after[(RankType.contender, 1)].id == before[(RankType.contender, 1)]
+        assert after[(RankType.contender, 1)].fighter_id == challenger_id
+
+    async def test_noop_when_nothing_moved(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        fighter = await create_test_fighter(save_fixture)
+        organization = await create_test_fight_organization(save_fixture)
+        weight_class = await create_test_weight_class(save_fixture)
+        ranks = [
+            RankInput(
+                rank_type=RankType.contender,
+                position=1,
+                fighter_id=fighter.id,
+                weight_class_id=weight_class.id,
+                organization_id=organization.id,
+            )
+        ]
+        repo = RankRepo.from_session(session)
+        await repo.reconcile(ranks=ranks)
+
+        delta = await repo.reconcile(ranks=ranks)
+
+        assert not delta.has_changes
+
+
+@pytest.mark.asyncio
+class TestFightCardRepoUpsertBouts:
+    async def _bout_ids(self, session: AsyncSession, fight_card_id) -> set:
+        return set((await session.execute(select(Bout.id).where(Bout.fight_card_id == fight_card_id))).scalars())
+
+    async def test_writes_bouts_and_reloads_on_request(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        red = await create_test_fighter(save_fixture)
+        blue = await create_test_fighter(save_fixture)
+        card = await create_test_fight_card(save_fixture)
+        repo = FightCardRepo.from_session(session)
+
+        result = await repo.upsert_bouts(
+            fight_card=card,
+            bouts=[BoutInput(red_corner_id=red.id, blue_corner_id=blue.id, bout_order=1, is_title_fight=True)],
+            reload=True,
+        )
+
+        assert result.bouts_fingerprint is not None
+        assert [(b.red_corner.id, b.blue_corner.id) for b in result.bouts] == [(red.id, blue.id)]
+
+    async def test_skips_write_when_bouts_unchanged(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        red = await create_test_fighter(save_fixture)
+        blue = await create_test_fighter(save_fixture)
+        card = await create_test_fight_card(save_fixture)
+        bouts = [BoutInput(red_corner_id=red.id, blue_corner_id=blue.id, bout_order=1, is_title_fight=True)]
+        repo = FightCardRepo.from_session(session)
+        await repo.upsert_bouts(fight_card=card, bouts=bouts)
+        first_ids = await self._bout_ids(session, card.id)
+
+        await repo.upsert_bouts(fight_card=card, bouts=bouts)
+
+        assert await self._bout_ids(session, card.id) == first_ids
+
+    async def test_replaces_bouts_when_changed(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        red = await create_test_fighter(save_fixture)
+        blue = await create_test_fighter(save_fixture)
+        replacement = await create_test_fighter(save_fixture)
+        card = await create_test_fight_card(save_fixture)
+        repo = FightCardRepo.from_session(session)
+        await repo.upsert_bouts(
+            fight_card=card,
+            bouts=[BoutInput(red_corner_id=red.id, blue_corner_id=blue.id, bout_order=1, is_title_fight=True)],
+        )
+        first_fingerprint = card.bouts_fingerprint
+
+        await repo.upsert_bouts(
+            fight_card=card,
+            bouts=[BoutInput(red_corner_id=red.id, blue_corner_id=replacement.id, bout_order=1, is_title_fight=True)],
+        )
+
+        assert card.bouts_fingerprint != first_fingerprint
+        blue_ids = (await session.execute(select(Bout.blue_corner_id).where(Bout.fight_card_id == card.id))).scalars()
+        assert list(blue_ids) == [replacement.id]
+
+
+@pytest.mark.asyncio
+class TestFightCardRepoUpsertMany:
+    async def test_empty_batch_is_a_noop(self, session: AsyncSession) -> None:
+        assert await FightCardRepo.from_session(session).upsert_many(source="boxing_schedule", cards=[]) == {}
+
+    async def test_updates_existing_card_by_external_id(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        existing = await create_test_fight_card(save_fixture, source="boxing_schedule", external_id="42")
+        new_date = existing.event_date + timedelta(days=7)
+        repo = FightCardRepo.from_session(session)
+
+        result = await repo.upsert_many(
+            source="boxing_schedule",
+            cards=[
+                FightCardInput(external_id="42", event_name="A vs C", event_date=new_date),
+                FightCardInput(external_id="43", event_name="D vs E", event_date=new_date),
+            ],
+        )
+
+        assert result["42"].id == existing.id
+        assert (result["42"].event_name, result["42"].event_date) == ("A vs C", new_date)
+        assert result["43"].id != existing.id
+        assert (await session.execute(select(func.count()).select_from(FightCard))).scalar_one() == 2
+
+    async def test_syncs_a_full_listing_in_one_statement(self, session: AsyncSession) -> None:
+        event_date = datetime(2026, 11, 1, tzinfo=timezone.utc)
+        cards = [FightCardInput(external_id=str(i), event_name=f"card {i}", event_date=event_date) for i in range(200)]
+
+        with count_statements(session) as statements:
+            result = await FightCardRepo.from_session(session).upsert_many(source="boxing_schedule", cards=cards)
+
+        assert list(result) == [card.external_id for card in cards]
+        assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+class TestRankRepoGetReads:
+    async def test_returns_records_heaviest_division_first(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        organization = await create_test_fight_organization(save_fixture, name="WBC")
+        heavyweight = await create_test_weight_class(save_fixture, name="heavyweight", pounds=None)
+        flyweight = await create_test_weight_class(save_fixture, name="flyweight", pounds=112)
+        repo = RankRepo.from_session(session)
+        slots = [
+            (flyweight, RankType.contender, 1, "fly contender"),
+            (heavyweight, RankType.contender, 1, "heavy contender"),
+            (heavyweight, RankType.champion, None, "heavy champion"),
+        ]
+        fighters = {name: await create_test_fighter(save_fixture, name=name) for *_, name in slots}
+        await repo.reconcile(
+            ranks=[
+                RankInput(
+                    rank_type=rank_type,
+                    position=position,
+                    fighter_id=fighters[name].id,
+                    weight_class_id=weight_class.id,
+                    organization_id=organization.id,
+                )
+                for weight_class, rank_type, position, name in slots
+            ]
+        )
+
+        reads = await repo.get_reads(record=RankRead.model_construct)
+
+        assert [(r.weight_class_name, r.rank_type, r.fighter_name) for r in reads] == [
+            ("heavyweight", RankType.champion, "heavy champion"),
+            ("heavyweight", RankType.contender, "heavy contender"),
+            ("flyweight", RankType.contender, "fly contender"),
+        ]
+        assert all(r.organization_name == "WBC" for r in reads)
+
+
+@pytest.mark.asyncio
+class TestFightCardRepoGetReadRows:
+    async def test_one_row_per_bout_and_one_for_a_card_without_bouts(
+        self, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        red = await create_test_fighter(save_fixture, wins=10)
+        blue = await create_test_fighter(save_fixture)
+        now = datetime.now(timezone.utc)
+        later = await create_test_fight_card(save_fixture, event_date=now + timedelta(days=9))
+        empty = await create_test_fight_card(save_fixture, event_date=now + timedelta(days=2))
+        repo = FightCardRepo.from_session(session)
+        await repo.upsert_bouts_many(
+            {
+                later: [
+                    BoutInput(red_corner_id=blue.id, blue_corner_id=red.id, bout_order=2),
+                    BoutInput(red_corner_id=red.id, blue_corner_id=blue.id, bout_order=1, is_title_fight=True),
+                ]
+            }
+        )
+
+        rows = await repo.get_read_rows(ids=[later.id, empty.id])
+
+        assert [(row.card_id, row.bout_order) for row in rows] == [(empty.id, None), (later.id, 1), (later.id, 2)]
+        assert rows[0].bout_id is None and rows[0].red_id is None
+        assert (rows[1].red_name, rows[1].red_wins, rows[1].blue_id) == (red.name, 10, blue.id)
+        assert rows[1].bout_is_title_fight
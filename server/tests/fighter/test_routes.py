@@ -1,8 +1,22 @@
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sbtb.fighter.repository import RankRepo
+from sbtb.fighter.schemas import RankInput
+from sbtb.models.fight_organization import CombatSport
+from sbtb.models.rank import RankType
+from tests.factories import (
+    create_test_featured_fighter,
+    create_test_fight_organization,
+    create_test_fighter,
+    create_test_weight_class,
+)
+from tests.fixtures.database import SaveFixture
 
 GATED_ROUTES: list[tuple[str, str]] = [
     ("GET", "/api/fighter/update-boxing-ranks"),
     ("GET", "/api/fighter/update-boxing-fight-cards"),
+    ("GET", "/api/fighter/refresh-data"),
     ("POST", "/api/fighter/generate-avatars"),
 ]
 
@@ -26,3 +40,55 @@ class TestFeaturedRouteRemainsPublic:
     async def test_featured_no_auth_returns_200(self, client) -> None:
         response = await client.get("/api/fighter/featured")
         assert response.status_code == 200
+
+    async def test_featured_serializes_fighters_in_order(self, client, save_fixture) -> None:
+        second = await create_test_fighter(save_fixture, name="second", avatar_url="https://cdn/second.webp")
+        first = await create_test_fighter(save_fixture, name="first")
+        await create_test_featured_fighter(save_fixture, second, position=2)
+        await create_test_featured_fighter(save_fixture, first, position=1)
+
+        response = await client.get("/api/fighter/featured")
+
+        assert response.json() == [
+            {"id": str(first.id), "name": "first", "avatarUrl": None},
+            {"id": str(second.id), "name": "second", "avatarUrl": "https://cdn/second.webp"},
+        ]
+
+
+@pytest.mark.asyncio
+class TestRankingsRoute:
+    async def test_rankings_no_auth_returns_200(self, client) -> None:
+        response = await client.get("/api/fighter/rankings")
+        assert response.status_code == 200
+
+    async def test_rankings_are_filtered_by_sport(
+        self, client, session: AsyncSession, save_fixture: SaveFixture
+    ) -> None:
+        organization = await create_test_fight_organization(save_fixture, name="WBC")
+        boxing = await create_test_weight_class(save_fixture, name="flyweight", pounds=112)
+        mma = await create_test_weight_class(save_fixture, name="mma flyweight", pounds=125, sport=CombatSport.mma)
+        champion = await create_test_fighter(save_fixture, name="champion")
+        await RankRepo.from_session(session).reconcile(
+            ranks=[
+                RankInput(
+                    rank_type=RankType.champion,
+                    position=None,
+                    fighter_id=champion.id,
+                    weight_class_id=weight_class.id,
+                    organization_id=organization.id,
+                )
+                for weight_class in (boxing, mma)
+            ]
+        )
+
+        response = await client.get("/api/fighter/rankings", params={"sport": "boxing"})
+
+        assert response.json() == [
+            {
+                "rankType": "champion",
+                "position": None,
+                "fighterName": "champion",
+                "weightClassName": "flyweight",
+                "organizationName": "WBC",
+            }
+        ]
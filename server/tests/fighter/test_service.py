@@ -1,9 +1,25 @@
+import datetime
+
 import pytest
+from sqlalchemy import event, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-from sbtb.fighter.service import FeaturedFighterService
+from sbtb.fighter.repository import FightCardRepo
+from sbtb.fighter.schemas import BoutInput, FightCardRead, ParsedFightCard, RawBoxerSchema
+from sbtb.fighter.scraper import BoxingFightCardScraper, BoxingRankScraper, ScrapeResult
+from sbtb.fighter.scraper.state import ScraperStateStore
+from sbtb.fighter.service import BoxerScraperService, BoxingFightCardService, FeaturedFighterService
+from sbtb.models import Bout, FightCard, Fighter, Rank
 from sbtb.models.featured_fighter import FeaturedCollection
-from tests.factories import create_test_featured_fighter, create_test_fighter
+from sbtb.models.rank import RankType
+from tests.factories import (
+    create_test_featured_fighter,
+    create_test_fight_card,
+    create_test_fight_organization,
+    create_test_fighter,
+    create_test_weight_class,
+)
 from tests.fixtures.database import SaveFixture
 
 
@@ -40,3 +56,276 @@ class TestFeaturedFighterServiceGetByCollection:
         result = await service.get_by_collection(session=session, collection=FeaturedCollection.popular_fighters)
 
         assert [f.name for f in result] == ["C", "B", "A"]
+
+
+def _parsed_fight_card(
+    title: list[str], undercard: list[str], days_out: int = 30, external_id: str | None = None
+) -> ParsedFightCard:
+    return ParsedFightCard(
+        external_id=external_id or "-".join(title).lower(),
+        fight_date=datetime.datetime(2026, 1, 1, 2, tzinfo=datetime.timezone.utc) + datetime.timedelta(days=days_out),
+        title_fighters=title,
+        undercard_fighters=undercard,
+        location="Las Vegas, NV",
+        network="DAZN",
+    )
+
+
+@pytest.mark.asyncio
+class TestBoxingFightCardServiceScrapeAndUpdate:
+    @pytest.fixture
+    def parsed_fight_cards(self, monkeypatch: pytest.MonkeyPatch) -> list[ParsedFightCard]:
+        cards = [
+            _parsed_fight_card(["Canelo Alvarez", "Jermell Charlo"], ["Jesse Rodriguez", "Sunny Edwards"]),
+            _parsed_fight_card(["Naoya Inoue", "Jesse Rodriguez"], [], days_out=60),
+        ]
+
+        async def run_scraper(self) -> ScrapeResult[list[ParsedFightCard]]:
+            return ScrapeResult(payload=cards)
+
+        monkeypatch.setattr(BoxingFightCardScraper, "run_scraper", run_scraper)
+        return cards
+
+    async def test_persists_cards_fighters_and_bouts(self, session: AsyncSession, parsed_fight_cards) -> None:
+        service = BoxingFightCardService(scraper=BoxingFightCardScraper())
+
+        result = await service.scrape_and_update_boxing_fight_cards(session=session)
+
+        assert result.cards_scraped == 2
+        assert result.cards_changed == 2
+        assert {"scrape", "fighters", "fight_cards", "bouts", "reload"} <= set(result.timings_ms)
+        assert [card.event_name for card in result.fight_cards] == [
+            "Canelo Alvarez vs Jermell Charlo",
+            "Naoya Inoue vs Jesse Rodriguez",
+        ]
+        assert [len(card.bouts) for card in result.fight_cards] == [2, 1]
+        # "jesse rodriguez" appears on both cards but is only created once
+        assert (await session.execute(select(func.count()).select_from(Fighter))).scalar_one() == 5
+
+    async def test_rerun_with_same_schedule_changes_nothing(self, session: AsyncSession, parsed_fight_cards) -> None:
+        service = BoxingFightCardService(scraper=BoxingFightCardScraper())
+        await service.scrape_and_update_boxing_fight_cards(session=session)
+        bout_ids = set((await session.execute(select(Bout.id))).scalars())
+
+        result = await service.scrape_and_update_boxing_fight_cards(session=session)
+
+        assert result.cards_changed == 0
+        assert set((await session.execute(select(Bout.id))).scalars()) == bout_ids
+        assert (await session.execute(select(func.count()).select_from(FightCard))).scalar_one() == 2
+
+    async def test_reschedule_and_opponent_swap_update_the_same_card(
+        self, session: AsyncSession, parsed_fight_cards: list[ParsedFightCard]
+    ) -> None:
+        service = BoxingFightCardService(scraper=BoxingFightCardScraper())
+        await service.scrape_and_update_boxing_fight_cards(session=session)
+        card_id = (
+            await session.execute(select(FightCard.id).where(FightCard.external_id == "naoya inoue-jesse rodriguez"))
+        ).scalar_one()
+
+        parsed_fight_cards[1].fight_date += datetime.timedelta(days=14)
+        parsed_fight_cards[1].title_fighters = ["Naoya Inoue", "Junto Nakatani"]
+        result = await service.scrape_and_update_boxing_fight_cards(session=session)
+
+        assert (await session.execute(select(func.count()).select_from(FightCard))).scalar_one() == 2
+        rescheduled = next(card for card in result.fight_cards if card.id == card_id)
+        assert rescheduled.event_name == "Naoya Inoue vs Junto Nakatani"
+        assert rescheduled.event_date == parsed_fight_cards[1].fight_date
+        assert [bout.blue_corner.name for bout in rescheduled.bouts] == ["junto nakatani"]
+
+    async def test_full_sync_removes_upcoming_cards_upstream_no_longer_lists(
+        self, session: AsyncSession, save_fixture: SaveFixture, parsed_fight_cards: list[ParsedFightCard]
+    ) -> None:
+        source = BoxingFightCardScraper.SOURCE
+        past = await create_test_fight_card(
+            save_fixture,
+            event_date=datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=3),
+            source=source,
+            external_id="100",
+        )
+        cancelled = await create_test_fight_card(save_fixture, source=source, external_id="101")
+        scraper = BoxingFightCardScraper()
+        service = BoxingFightCardService(scraper=scraper)
+
+        async def full_sync(self) -> ScrapeResult[list[ParsedFightCard]]:
+            return ScrapeResult(
+                payload=parsed_fight_cards,
+                full_sync=True,
+                listed_ids=[card.external_id for card in parsed_fight_cards],
+            )
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(BoxingFightCardScraper, "run_scraper", full_sync)
+            result = await service.scrape_and_update_boxing_fight_cards(session=session)
+
+        assert result.cards_removed == 1
+        remaining = set((await session.execute(select(FightCard.id))).scalars())
+        assert past.id in remaining
+        assert cancelled.id not in remaining
+        assert len(remaining) == 3
+
+    async def test_failed_persist_is_rolled_back(
+        self, session: AsyncSession, parsed_fight_cards, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def upsert_bouts_many(self, bouts_by_card):
+            raise RuntimeError("bout write failed")
+
+        monkeypatch.setattr(FightCardRepo, "upsert_bouts_many", upsert_bouts_many)
+        service = BoxingFightCardService(scraper=BoxingFightCardScraper())
+
+        result = await service.scrape_and_update_boxing_fight_cards(session=session)
+
+        assert result.fight_cards == []
+        assert result.cards_scraped == 0
+        # The cards and fighters written before the failure are gone too
+        assert (await session.execute(select(func.count()).select_from(FightCard))).scalar_one() == 0
+        assert (await session.execute(select(func.count()).select_from(Fighter))).scalar_one() == 0
+
+    async def test_full_sync_replaces_upcoming_cards_stored_without_an_external_id(
+        self, session: AsyncSession, save_fixture: SaveFixture, parsed_fight_cards: list[ParsedFightCard]
+    ) -> None:
+        # A row from before the (source, external_id) key: upcoming, with no upstream id
+        legacy = await create_test_fight_card(
+            save_fixture, event_name="Canelo Alvarez vs Jermell Charlo", source=BoxingFightCardScraper.SOURCE
+        )
+        service = BoxingFightCardService(scraper=BoxingFightCardScraper())
+
+        async def full_sync(self) -> ScrapeResult[list[ParsedFightCard]]:
+            return ScrapeResult(
+                payload=parsed_fight_cards,
+                full_sync=True,
+                listed_ids=[card.external_id for card in parsed_fight_cards],
+            )
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(BoxingFightCardScraper, "run_scraper", full_sync)
+            result = await service.scrape_and_update_boxing_fight_cards(session=session)
+
+        assert result.cards_removed == 1
+        remaining = (await session.execute(select(FightCard.id, FightCard.external_id))).all()
+        assert legacy.id not in {card_id for card_id, _ in remaining}
+        assert sorted(external_id for _, external_id in remaining) == sorted(
+            card.external_id for card in parsed_fight_cards
+        )
+
+
+@pytest.mark.asyncio
+class TestBoxingFightCardServiceFightCardReads:
+    async def test_matches_the_orm_loaded_cards(self, session: AsyncSession, save_fixture: SaveFixture) -> None:
+        red = await create_test_fighter(save_fixture, wins=62, losses=2, draws=2)
+        red.nickname, red.age = "Canelo", 35
+        blue = await create_test_fighter(save_fixture, wins=20)
+        blue.age = 30
+        soon = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=2)
+        later = soon + datetime.timedelta(days=7)
+        card = await create_test_fight_card(save_fixture, location="Riyadh", event_date=later)
+        empty = await create_test_fight_card(save_fixture, location=None, event_date=soon)
+        repo = FightCardRepo.from_session(session)
+        await repo.upsert_bouts_many(
+            {
+                card: [
+                    BoutInput(red_corner_id=red.id, blue_corner_id=blue.id, bout_order=1, is_title_fight=True),
+                    BoutInput(red_corner_id=blue.id, blue_corner_id=red.id, bout_order=2),
+                ]
+            }
+        )
+        ids = [card.id, empty.id]
+
+        reads = BoxingFightCardService._fight_card_reads(await repo.get_read_rows(ids=ids))
+
+        loaded = await session.execute(
+            select(FightCard)
+            .where(FightCard.id.in_(ids))
+            .order_by(FightCard.event_date)
+            .execution_options(populate_existing=True)
+        )
+        expected = [FightCardRead.model_validate(fight_card) for fight_card in loaded.scalars()]
+        for fight_card in expected:
+            fight_card.bouts.sort(key=lambda bout: bout.bout_order)
+        assert [read.model_dump() for read in reads] == [read.model_dump() for read in expected]
+        assert [len(read.bouts) for read in reads] == [0, 2]
+        assert reads[1].bouts[0].red_corner.nickname == "Canelo"
+
+
+@pytest.mark.asyncio
+class TestBoxerScraperServiceScrapeAndUpdate:
+    @pytest.fixture
+    def grouped_rankings(self, monkeypatch: pytest.MonkeyPatch) -> dict[str, dict[str, list[RawBoxerSchema]]]:
+        rankings = {
+            "lightweight": {
+                "WBC": [
+                    RawBoxerSchema(name="shakur stevenson", rank_type=RankType.champion),
+                    RawBoxerSchema(name="william zepeda", rank_type=RankType.contender, position=1),
+                ],
+                "XYZ": [RawBoxerSchema(name="unknown org boxer", rank_type=RankType.champion)],
+            },
+            "catchweight": {"WBC": [RawBoxerSchema(name="unknown division boxer", rank_type=RankType.champion)]},
+        }
+
+        async def run_scraper(self) -> ScrapeResult[dict[str, dict[str, list[RawBoxerSchema]]]]:
+            return ScrapeResult(payload=rankings)
+
+        monkeypatch.setattr(BoxingRankScraper, "run_scraper", run_scraper)
+        return rankings
+
+    async def test_persists_ranks_for_known_reference_data(
+        self, session: AsyncSession, save_fixture: SaveFixture, grouped_rankings
+    ) -> None:
+        await create_test_fight_organization(save_fixture, name="WBC")
+        await create_test_weight_class(save_fixture, name="lightweight", pounds=135)
+
+        result = await BoxerScraperService(scraper=BoxingRankScraper()).scrape_and_update_boxing_ranks(session=session)
+
+        assert [(r.fighter_name, r.rank_type, r.position) for r in result.ranks] == [
+            ("shakur stevenson", RankType.champion, None),
+            ("william zepeda", RankType.contender, 1),
+        ]
+        assert (result.is_noop, result.ranks_inserted) == (False, 2)
+        assert (await session.execute(select(func.count()).select_from(Rank))).scalar_one() == 2
+
+    async def test_scraper_state_is_saved_when_the_transaction_commits(
+        self, session: AsyncSession, rankings_scraper: BoxingRankScraper, scraper_state_store: ScraperStateStore
+    ) -> None:
+        service = BoxerScraperService(scraper=rankings_scraper)
+
+        await service.scrape_and_update_boxing_ranks(session=session)
+        assert scraper_state_store.get(BoxingRankScraper.PAGE_STATE_KEY) is None
+
+        await session.commit()
+        assert scraper_state_store.get(BoxingRankScraper.PAGE_STATE_KEY) is not None
+        assert (await rankings_scraper.run_scraper()).unchanged
+
+    async def test_failed_commit_keeps_the_previous_scraper_state(
+        self, session: AsyncSession, rankings_scraper: BoxingRankScraper, scraper_state_store: ScraperStateStore
+    ) -> None:
+        # Commits and rolls back a savepoint, so the fixture's outer transaction survives the rollback
+        own_session = AsyncSession(bind=session.bind, join_transaction_mode="create_savepoint")
+        service = BoxerScraperService(scraper=rankings_scraper)
+        await service.scrape_and_update_boxing_ranks(session=own_session)
+
+        def fail_commit(session: Session) -> None:
+            raise RuntimeError("commit failed")
+
+        event.listen(own_session.sync_session, "before_commit", fail_commit, once=True)
+        with pytest.raises(RuntimeError, match="commit failed"):
+            await own_session.commit()
+        await own_session.rollback()
+        # A later, unrelated commit doesn't write the dropped state either
+        await own_session.commit()
+        await own_session.close()
+
+        assert scraper_state_store.get(BoxingRankScraper.PAGE_STATE_KEY) is None
+        run = await rankings_scraper.run_scraper()
+        assert not run.unchanged
+        assert run.payload is not None
+
+    async def test_unchanged_page_is_a_noop(self, session: AsyncSession, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def run_scraper(self) -> ScrapeResult[None]:
+            return ScrapeResult(unchanged=True)
+
+        monkeypatch.setattr(BoxingRankScraper, "run_scraper", run_scraper)
+
+        result = await BoxerScraperService(scraper=BoxingRankScraper()).scrape_and_update_boxing_ranks(session=session)
+
+        assert result.is_noop
+        assert result.ranks == []
+        assert (await session.execute(select(func.count()).select_from(Rank))).scalar_one() == 0
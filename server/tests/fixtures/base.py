@@ -7,7 +7,7 @@ import pytest_asyncio
 from fastapi import FastAPI
 
 from sbtb.app import app as sbtb_app
-from sbtb.core.database.session import AsyncSession, get_session
+from sbtb.core.database.session import AsyncSession, get_batch_session, get_read_session, get_session
 
 
 class IsolatedSessionTestClient(httpx.AsyncClient):
@@ -35,10 +35,14 @@ class IsolatedSessionTestClient(httpx.AsyncClient):
 @pytest_asyncio.fixture
 async def app(session: AsyncSession) -> AsyncGenerator[FastAPI, None]:
     sbtb_app.dependency_overrides[get_session] = lambda: session
+    sbtb_app.dependency_overrides[get_batch_session] = lambda: session
+    sbtb_app.dependency_overrides[get_read_session] = lambda: session
 
     yield sbtb_app
 
     sbtb_app.dependency_overrides.pop(get_session)
+    sbtb_app.dependency_overrides.pop(get_batch_session)
+    sbtb_app.dependency_overrides.pop(get_read_session)
 
 
 @pytest_asyncio.fixture
@@ -1,14 +1,17 @@
-from collections.abc import AsyncIterator, Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator
+from contextlib import contextmanager
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
 from pydantic_core import Url
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
 from sbtb.core.config import settings
 from sbtb.core.database.base import BaseModel
+from sbtb.core.reference_data import reference_data
 from sbtb.models import *  # noqa — ensures all models are registered on BaseModel.metadata
 
 
@@ -49,6 +52,9 @@ async def initialize_test_database() -> AsyncIterator[None]:
 
     async with engine.begin() as conn:
         await conn.run_sync(BaseModel.metadata.create_all)
+        # Created by alembic in real databases; the reference data fingerprint reads it
+        await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO alembic_version (version_num) VALUES ('test')"))
     await engine.dispose()
 
     yield
@@ -84,6 +90,22 @@ async def session() -> AsyncIterator[AsyncSession]:
     await engine.dispose()
 
 
+@contextmanager
+def count_statements(session: AsyncSession) -> Iterator[list[str]]:
+    """Collect the SQL of every statement ``session`` sends while the block runs."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
 SaveFixture = Callable[[BaseModel], Coroutine[None, None, None]]
 
 
@@ -98,3 +120,9 @@ def save_fixture_factory(session: AsyncSession) -> SaveFixture:
 @pytest.fixture
 def save_fixture(session: AsyncSession) -> SaveFixture:
     return save_fixture_factory(session)
+
+
+@pytest.fixture(autouse=True)
+def reset_reference_data() -> None:
+    """Each test seeds its own orgs/weight classes inside a rolled-back transaction."""
+    reference_data.invalidate()
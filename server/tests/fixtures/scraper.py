@@ -0,0 +1,183 @@
+"""Local stand-in for the upstream boxing schedule site.
+
+Serves the schedule page, its JS chunk (carrying the Server Action ID) and the
+paginated ``get_upcoming_events`` Server Action, so scrapers can be exercised
+end to end without network access.
+"""
+
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sbtb.fighter.scraper import BoxingFightCardScraper, BoxingRankScraper, RequestPolicy, ScraperHttpClient
+from sbtb.fighter.scraper.archive import ScrapeArchive
+from sbtb.fighter.scraper.state import ScraperStateStore
+
+CHUNK_PATH = "/_next/static/chunks/app/schedule/page-0123abcd.js"
+RANKINGS_HTML = (Path(__file__).parent.parent / "fighter" / "scraper" / "data" / "boxing_rankings.html").read_text()
+
+
+def make_schedule_event(
+    id: int,
+    event_date: str,
+    fighters: list[tuple[str, str]] | None = None,
+    event_time: str = "20:00:00",
+) -> dict[str, Any]:
+    fighters = fighters or [(f"Main A{id}", f"Main B{id}"), (f"Under A{id}", f"Under B{id}")]
+    return {
+        "id": id,
+        "event_date": event_date,
+        "event_time": event_time,
+        "event_timezone": "EST",
+        "venue": {"region_display_name": "Las Vegas, NV"},
+        "networks": [{"name": "DAZN"}],
+        "fights": [
+            {
+                "event_fight_type": "Main Event" if i == 0 else "Undercard",
+                "fighter1_name": red,
+                "fighter2_name": blue,
+            }
+            for i, (red, blue) in enumerate(fighters)
+        ],
+    }
+
+
+class ScheduleUpstream:
+    def __init__(self, events: list[dict[str, Any]], action_id: str = "a1b2c3d4") -> None:
+        self.events = events
+        self.action_id = action_id
+        self.requests: list[tuple[str, str]] = []
+        # Statuses the next Server Action POSTs fail with, e.g. [429, 503] for a flaky upstream
+        self.action_failures: list[int] = []
+        self.app = web.Application()
+        self.app.router.add_get("/schedule", self._page)
+        self.app.router.add_get(CHUNK_PATH, self._chunk)
+        self.app.router.add_post("/schedule", self._action)
+
+    def count(self, method: str, path: str) -> int:
+        return self.requests.count((method, path))
+
+    @staticmethod
+    def _sort_key(event: dict[str, Any]) -> tuple[str, int]:
+        return f"{event['event_date']}T{event.get('event_time', '00:00:00')}", event["id"]
+
+    async def _page(self, request: web.Request) -> web.Response:
+        self.requests.append(("GET", request.path))
+        return web.Response(text=f'<html><script src="{CHUNK_PATH}"></script></html>', content_type="text/html")
+
+    async def _chunk(self, request: web.Request) -> web.Response:
+        self.requests.append(("GET", request.path))
+        return web.Response(text=f'(0,r.createServerReference)("{self.action_id}",r.callServer)')
+
+    async def _action(self, request: web.Request) -> web.Response:
+        self.requests.append(("POST", request.path))
+        if self.action_failures:
+            return web.Response(status=self.action_failures.pop(0), headers={"Retry-After": "0"})
+        if request.headers.get("next-action") != self.action_id:
+            return web.Response(status=404, text="Server action not found")
+
+        _, cursor, _, page_size = await request.json()
+        after = (cursor["last_event_date"], cursor["last_event_id"])
+        page = [e for e in sorted(self.events, key=self._sort_key) if self._sort_key(e) > after][:page_size]
+        body = '0:{"a":"$@1","f":"","b":"build"}\n' + f"1:{json.dumps({'results': page})}\n"
+        return web.Response(text=body, content_type="text/x-component")
+
+
+class RankingsUpstream:
+    """Serves the rankings page with an ETag, answering 304 to a matching If-None-Match."""
+
+    def __init__(self, html: str = RANKINGS_HTML, etag: str | None = '"v1"') -> None:
+        self.html = html
+        self.etag = etag
+        self.statuses: list[int] = []
+        self.app = web.Application()
+        self.app.router.add_get("/rankings", self._page)
+
+    async def _page(self, request: web.Request) -> web.Response:
+        if self.etag is not None and request.headers.get("If-None-Match") == self.etag:
+            response = web.Response(status=304)
+        else:
+            headers = {"ETag": self.etag} if self.etag is not None else {}
+            response = web.Response(text=self.html, content_type="text/html", headers=headers)
+        self.statuses.append(response.status)
+        return response
+
+
+def fast_request_policy(**overrides: Any) -> RequestPolicy:
+    """Request policy with the production shape but delays short enough for tests."""
+    options = {
+        "rate_per_second": 1000.0,
+        "burst": 100,
+        "min_rate_per_second": 100.0,
+        "max_retries": 3,
+        "backoff_base_seconds": 0.001,
+        "backoff_max_seconds": 0.05,
+        "failure_threshold": 5,
+        "reset_seconds": 60.0,
+    }
+    return RequestPolicy(**{**options, **overrides})
+
+
+def _scraper_http_client() -> ScraperHttpClient:
+    return ScraperHttpClient(
+        limit_per_host=2,
+        dns_cache_ttl=60,
+        keepalive_timeout=30,
+        total_timeout=5,
+        connect_timeout=1,
+        policy=fast_request_policy(),
+    )
+
+
+@pytest_asyncio.fixture
+async def schedule_upstream() -> AsyncIterator[ScheduleUpstream]:
+    upstream = ScheduleUpstream(events=[])
+    async with TestServer(upstream.app) as server:
+        upstream.url = str(server.make_url("/schedule"))
+        yield upstream
+
+
+@pytest.fixture
+def scraper_state_store(tmp_path: Path) -> ScraperStateStore:
+    return ScraperStateStore(directory=tmp_path / "scraper_state")
+
+
+@pytest.fixture
+def scrape_archive(tmp_path: Path) -> ScrapeArchive:
+    return ScrapeArchive(directory=tmp_path / "scrape_archive")
+
+
+@pytest_asyncio.fixture
+async def schedule_scraper(
+    schedule_upstream: ScheduleUpstream, scraper_state_store: ScraperStateStore, scrape_archive: ScrapeArchive
+) -> AsyncIterator[BoxingFightCardScraper]:
+    http_client = _scraper_http_client()
+    scraper = BoxingFightCardScraper(http_client=http_client, state_store=scraper_state_store, archive=scrape_archive)
+    scraper.URL = schedule_upstream.url
+    yield scraper
+    await http_client.close()
+
+
+@pytest_asyncio.fixture
+async def rankings_upstream() -> AsyncIterator[RankingsUpstream]:
+    upstream = RankingsUpstream()
+    async with TestServer(upstream.app) as server:
+        upstream.url = str(server.make_url("/rankings"))
+        yield upstream
+
+
+@pytest_asyncio.fixture
+async def rankings_scraper(
+    rankings_upstream: RankingsUpstream, scraper_state_store: ScraperStateStore, scrape_archive: ScrapeArchive
+) -> AsyncIterator[BoxingRankScraper]:
+    http_client = _scraper_http_client()
+    scraper = BoxingRankScraper(http_client=http_client, state_store=scraper_state_store, archive=scrape_archive)
+    scraper.URL = rankings_upstream.url
+    yield scraper
+    await http_client.close()